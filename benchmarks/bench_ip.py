@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+"""
+Purpose: micro-benchmark of the SSRF IP checks (ipaddress is_* properties vs. precompiled interval tables)
+
+Usage: python benchmarks/bench_ip.py
+"""
+
+import ipaddress
+import timeit
+
+from pkg_19544.utils.ip import classify_ips, get_ip_tables
+
+ADDRESSES = ["142.250.72.14", "10.0.0.1", "127.0.0.1", "2607:f8b0:4004:c07::64", "fe80::1", "::ffff:192.168.1.1"]
+
+
+def ipaddress_lookup() -> None:
+    for address in ADDRESSES:
+        ip_addr = ipaddress.ip_address(address)
+        any(
+            [
+                ip_addr.is_unspecified,
+                ip_addr.is_link_local,
+                ip_addr.is_loopback,
+                ip_addr.is_reserved,
+                ip_addr.is_private,
+            ]
+        )
+
+
+def table_lookup() -> None:
+    classify_ips(ADDRESSES)
+
+
+if __name__ == "__main__":
+    get_ip_tables()
+    number = 20000
+    ipaddress_time = min(timeit.repeat(ipaddress_lookup, number=number, repeat=5))
+    table_time = min(timeit.repeat(table_lookup, number=number, repeat=5))
+    lookups = number * len(ADDRESSES)
+    print(f"ipaddress : {ipaddress_time / lookups * 1e9:8.1f} ns/address")
+    print(f"tables    : {table_time / lookups * 1e9:8.1f} ns/address")
+    print(f"speedup   : {ipaddress_time / table_time:.1f}x")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+"""
+Purpose: micro-benchmark of bulk sanitizing (urlsplit per component + quote_plus vs. sanitize_many,
+         decode + sanitize_url + encode vs. sanitize_url_bytes)
+
+Usage: python benchmarks/bench_sanitize.py
+"""
+
+import random
+import timeit
+from urllib.parse import quote_plus, urlsplit, urlunsplit
+
+from pkg_19544 import (
+    parse_url,
+    sanitize_many,
+    sanitize_url,
+    sanitize_url_bytes,
+)
+
+rng = random.Random(0)
+HOSTS = [f"www.site{index}.com" for index in range(200)]
+PATHS = ["/", "/search", "/en/products/item", "/a b/c\r\n", "/blog/2025/10/post"]
+QUERIES = ["", "?q=hello+world", "?page=2&sort=desc", "?utm_source=x&utm_medium=y"]
+USER_URLS = [f"https://{rng.choice(HOSTS)}{rng.choice(PATHS)}{rng.choice(QUERIES)}#top" for _ in range(10000)]
+LOG = "\n".join(user_url.replace("\r\n", "") for user_url in USER_URLS).encode()
+
+
+def split_per_component() -> None:
+    for user_url in USER_URLS:
+        parsed = parse_url(user_url.strip().replace("\n", "").replace("\r", ""))
+        pre_parsed_path = parsed.pre_parsed_path
+        encoded_path = quote_plus(urlsplit(pre_parsed_path).path, safe="/+")
+        encoded_query = quote_plus(urlsplit(pre_parsed_path).query, safe="?&=")
+        encoded_fragment = quote_plus(urlsplit(pre_parsed_path).fragment, safe="#")
+        urlunsplit((parsed.scheme, parsed.authority, encoded_path, encoded_query, encoded_fragment))
+
+
+def bulk() -> None:
+    sanitize_many(USER_URLS)
+
+
+def decode_encode() -> None:
+    for line in LOG.split(b"\n"):
+        sanitize_url(line.decode()).encode()
+
+
+def bytes_native() -> None:
+    for line in LOG.split(b"\n"):
+        sanitize_url_bytes(line)
+
+
+if __name__ == "__main__":
+    split_time = min(timeit.repeat(split_per_component, number=1, repeat=5))
+    bulk_time = min(timeit.repeat(bulk, number=1, repeat=5))
+    print(f"split per component: {split_time / len(USER_URLS) * 1e9:8.1f} ns/URL")
+    print(f"sanitize_many      : {bulk_time / len(USER_URLS) * 1e9:8.1f} ns/URL")
+    print(f"throughput         : {len(USER_URLS) / bulk_time * 3600 / 1e6:.0f}M URLs/hour (one core)")
+    decode_time = min(timeit.repeat(decode_encode, number=1, repeat=5))
+    bytes_time = min(timeit.repeat(bytes_native, number=1, repeat=5))
+    print(f"decode + encode    : {decode_time / len(USER_URLS) * 1e9:8.1f} ns/URL")
+    print(f"sanitize_url_bytes : {bytes_time / len(USER_URLS) * 1e9:8.1f} ns/URL")
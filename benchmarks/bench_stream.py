@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+"""
+Purpose: throughput of stream (sanitize and syntax modes) over a generated URL corpus, with peak RSS
+         to check that memory stays flat whatever the corpus size
+
+Usage: python benchmarks/bench_stream.py [--size-mb 4096] [--directory /tmp]
+"""
+
+import argparse
+import os
+import random
+import resource
+import tempfile
+import time
+
+from pkg_19544 import stream
+
+HOSTS = [f"www.site{index}.com" for index in range(1000)]
+PATHS = ["/", "/search", "/en/products/item", "/a b/c", "/blog/2025/10/post", "/café"]
+QUERIES = ["", "?q=hello+world", "?page=2&sort=desc", "?utm_source=x&utm_medium=y", "?q=$100"]
+
+
+def write_corpus(path: str, size: int) -> int:
+    """
+    Write random URLs (one per line) until the file reaches size bytes; return the number of URLs
+    """
+    rng = random.Random(0)
+    block = "\n".join(
+        f"https://{rng.choice(HOSTS)}{rng.choice(PATHS)}{rng.choice(QUERIES)}#top" for _ in range(100000)
+    ).encode()
+    block += b"\n"
+    count = block.count(b"\n")
+    urls = 0
+    with open(path, "wb") as f:
+        for _ in range(max(1, size // len(block))):
+            f.write(block)
+            urls += count
+    return urls
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=4096, help="corpus size in MiB")
+    parser.add_argument("--directory", default=None, help="directory for the corpus and outputs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.directory) as directory:
+        source = os.path.join(directory, "urls.txt")
+        urls = write_corpus(source, args.size_mb * 1024 * 1024)
+        size = os.path.getsize(source)
+        print(f"corpus      : {size / 2**20:.0f} MiB, {urls:,} URLs, peak RSS {peak_rss_mb():.0f} MiB")
+
+        for mode in ("sanitize", "syntax"):
+            destination = os.path.join(directory, f"{mode}.txt")
+            start = time.perf_counter()
+            stats = stream(source, destination, mode=mode)
+            elapsed = time.perf_counter() - start
+            os.unlink(destination)
+            print(
+                f"{mode:<12}: {size / 2**20 / elapsed:8.1f} MiB/s {stats.urls / elapsed:12,.0f} URLs/s "
+                f"peak RSS {peak_rss_mb():.0f} MiB"
+            )
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+
+"""
+Purpose: micro-benchmark of the TLD lookup (list scan vs. memory-mapped snapshot)
+
+Usage: python benchmarks/bench_tld.py
+"""
+
+import timeit
+
+from pkg_19544.utils.tld_index import get_tld_index, is_tld
+
+# former configs/tlds.py: upper-case list scanned with `in`
+TLDS = [tld.upper() for tld in get_tld_index()]
+
+FQDNS = ["www.google.com", "docs.python.org", "example.zuerich", "api.example.io", "host.invalidtld", "Example.COM"]
+
+
+def list_lookup() -> None:
+    for fqdn in FQDNS:
+        fqdn.split(".")[-1:][0].upper() in TLDS
+
+
+def index_lookup() -> None:
+    for fqdn in FQDNS:
+        is_tld(fqdn.rpartition(".")[2])
+
+
+def snapshot_lookup() -> None:
+    snapshot = get_tld_index()
+    for fqdn in FQDNS:
+        fqdn.rpartition(".")[2] in snapshot
+
+
+if __name__ == "__main__":
+    number = 20000
+    list_time = min(timeit.repeat(list_lookup, number=number, repeat=5))
+    snapshot_time = min(timeit.repeat(snapshot_lookup, number=number, repeat=5))
+    index_time = min(timeit.repeat(index_lookup, number=number, repeat=5))
+    lookups = number * len(FQDNS)
+    print(f"list            : {list_time / lookups * 1e9:8.1f} ns/lookup")
+    print(f"snapshot        : {snapshot_time / lookups * 1e9:8.1f} ns/lookup")
+    print(f"registry        : {index_time / lookups * 1e9:8.1f} ns/lookup")
+    print(f"speedup         : {list_time / index_time:.1f}x")
@@ -1,16 +1,109 @@
-from pkg_19544.clean_url import (
-    evaluate_url,
-    origin_url,
-    redirect_url,
-    sanitize_url,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pkg_19544.clean_url import (
+        CleanUrl,
+        evaluate_url,
+        evaluate_url_async,
+        evaluate_url_bytes,
+        evaluate_url_detailed,
+        evaluate_urls,
+        evaluate_urls_async,
+        origin_url,
+        origin_url_async,
+        redirect_url,
+        redirect_url_async,
+        sanitize_many,
+        sanitize_url,
+        sanitize_url_bytes,
+        stream,
+        trace_redirects,
+        trace_redirects_async,
+    )
+    from pkg_19544.policy import Policy, configure_ca
+    from pkg_19544.result import EvaluationResult, Hop, Reason, RedirectTrace, StreamStats
+    from pkg_19544.syntax import evaluate_url_syntax
+    from pkg_19544.utils.psl import public_suffix, registrable_domain
+    from pkg_19544.utils.url import ParsedURL, parse_url
 
 __version__ = "1.5.5"
 
+# public name -> module, imported on first access (the syntax-only API never loads socket / ssl)
+_LAZY_IMPORTS = {
+    "CleanUrl": "pkg_19544.clean_url",
+    "EvaluationResult": "pkg_19544.result",
+    "Hop": "pkg_19544.result",
+    "ParsedURL": "pkg_19544.utils.url",
+    "Policy": "pkg_19544.policy",
+    "Reason": "pkg_19544.result",
+    "RedirectTrace": "pkg_19544.result",
+    "StreamStats": "pkg_19544.result",
+    "configure_ca": "pkg_19544.policy",
+    "evaluate_url": "pkg_19544.clean_url",
+    "evaluate_url_async": "pkg_19544.clean_url",
+    "evaluate_url_bytes": "pkg_19544.clean_url",
+    "evaluate_url_detailed": "pkg_19544.clean_url",
+    "evaluate_url_syntax": "pkg_19544.syntax",
+    "evaluate_urls": "pkg_19544.clean_url",
+    "evaluate_urls_async": "pkg_19544.clean_url",
+    "origin_url": "pkg_19544.clean_url",
+    "origin_url_async": "pkg_19544.clean_url",
+    "parse_url": "pkg_19544.utils.url",
+    "public_suffix": "pkg_19544.utils.psl",
+    "redirect_url": "pkg_19544.clean_url",
+    "redirect_url_async": "pkg_19544.clean_url",
+    "registrable_domain": "pkg_19544.utils.psl",
+    "sanitize_many": "pkg_19544.clean_url",
+    "sanitize_url": "pkg_19544.clean_url",
+    "sanitize_url_bytes": "pkg_19544.clean_url",
+    "stream": "pkg_19544.clean_url",
+    "trace_redirects": "pkg_19544.clean_url",
+    "trace_redirects_async": "pkg_19544.clean_url",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = (
+    "CleanUrl",
+    "EvaluationResult",
+    "Hop",
+    "ParsedURL",
+    "Policy",
+    "Reason",
+    "RedirectTrace",
+    "StreamStats",
+    "configure_ca",
     "evaluate_url",
+    "evaluate_url_async",
+    "evaluate_url_bytes",
+    "evaluate_url_detailed",
+    "evaluate_url_syntax",
+    "evaluate_urls",
+    "evaluate_urls_async",
     "origin_url",
+    "origin_url_async",
+    "parse_url",
+    "public_suffix",
     "redirect_url",
+    "redirect_url_async",
+    "registrable_domain",
+    "sanitize_many",
     "sanitize_url",
+    "sanitize_url_bytes",
+    "stream",
+    "trace_redirects",
+    "trace_redirects_async",
 )
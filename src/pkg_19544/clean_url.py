@@ -1,22 +1,75 @@
-from urllib.parse import urlunsplit
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import cached_property
+from mmap import mmap
+from time import perf_counter_ns
+from typing import BinaryIO, Iterable, Iterator
 
-from .helpers.define import _define_url
+from .configs.constants import (
+    EVALUATE_MAX_CONCURRENCY,
+    EVALUATE_MAX_WORKERS,
+    MAX_REDIRECTS,
+    REDIRECT_TIMEOUT,
+    STREAM_BUFFER_SIZE,
+    STREAM_CHUNK_SIZE,
+)
+from .helpers.define import (
+    _attach_trailing_path,
+    _define_url,
+    _redirected_url,
+    _redirected_url_async,
+    _sanitized_url,
+    _trace_redirects,
+    _trace_redirects_async,
+)
 from .helpers.evaluate import (
+    _has_valid_fqdn_network,
+    _has_valid_tls,
+    _has_valid_tls_async,
+    _is_fqdn_resolvable,
+    _is_fqdn_resolved_ip_allowed,
+    _resolve_fqdn,
+    _resolve_fqdn_async,
+)
+from .helpers.sanitize import (
+    _rebuild_url,
+    _sanitize_bytes,
+    _sanitize_iter,
+    _sanitized_components,
+)
+from .helpers.stream import LineProcessor, _stream
+from .helpers.syntax import (
     _has_allowed_scheme,
     _has_no_basic_auth,
     _has_no_control_character,
     _has_valid_authority_syntax,
-    _has_valid_fqdn_network,
     _has_valid_fqdn_syntax,
+    _has_valid_syntax_bytes,
     _has_valid_tld,
-    _has_valid_tls,
+    _syntax_verdict,
+)
+from .policy import Policy, get_policy
+from .result import (
+    EvaluationResult,
+    Reason,
+    RedirectTrace,
+    StreamStats,
 )
-from .helpers.sanitize import _encode_url_components, _remove_control_characters
-from .utils.url import get_url_components
+from .syntax import evaluate_url_syntax  # noqa: F401 (re-exported)
+from .utils.err import logger
+from .utils.tls import (
+    TlsSessionStore,
+    TlsVerdictCache,
+    tls_cache,
+    tls_sessions,
+)
+from .utils.url import ParsedURL, _split_url_bytes, parse_url
 
 
 def evaluate_url(
-    user_url: str,
+    user_url: "str | ParsedURL | CleanUrl",
     allow_http: bool = False,
     allow_localhost: bool = False,
     allow_loopback_ip: bool = False,
@@ -25,13 +78,15 @@ def evaluate_url(
     allow_tlsv12: bool = False,
     skip_tls: bool = False,
     enable_log: bool = False,
+    policy: Policy | None = None,
+    level: str = "tls",
 ) -> bool:
     """
     Evaluate URL from syntax to network and transport layer
 
     *Parameters*:
 
-        user_url         : URL string to evaluate
+        user_url         : URL string (or ParsedURL / CleanUrl) to evaluate
         allow_http       : boolean to allow http scheme
         allow_localhost  : boolean to allow using localhost as FQDN
         allow_loopback_ip: boolean to use FQDN resolved to loopback ip address
@@ -40,88 +95,346 @@ def evaluate_url(
         allow_tlsv12     : boolean to use TLSv1.2 in HTTPS protocol
         skip_tls         : boolean to skip TLS validation
         enable_log       : boolean to enable console logging
+        policy           : compiled Policy (the options above are ignored when provided)
+        level            : evaluation level, "syntax" (syntax checks only), "dns" (+ DNS and resolved IP checks)
+                           or "tls" (+ TLS checks, default)
+
+    *Returns*:
+
+        Boolean
+    """
+    if policy is None:
+        policy = get_policy(
+            allow_http,
+            allow_localhost,
+            allow_loopback_ip,
+            allow_private_ip,
+            allow_redirect,
+            allow_tlsv12,
+            skip_tls,
+            enable_log,
+            level,
+        )
+    if isinstance(user_url, CleanUrl):
+        return user_url.evaluate(policy=policy)
+    return _evaluate(_parsed_url(user_url), policy)
+
+
+def evaluate_url_bytes(
+    user_url: "bytes | bytearray | memoryview",
+    policy: Policy | None = None,
+    **options: bool,
+) -> bool:
+    """
+    Evaluate URL given as bytes (see evaluate_url), e.g. a memoryview slice of a log buffer
+
+    *Parameters*:
+
+        user_url: URL bytes (UTF-8)
+        policy  : compiled Policy
+        options : boolean options of evaluate_url (when policy is not provided)
 
     *Returns*:
 
         Boolean
+
+    *Notes*:
+
+        syntax checks run over the bytes (no decode, no copy of the buffer); only the components of
+        a URL that passes them are decoded for the network and TLS checks.
     """
-    scheme, userinfo, authority, fqdn, port, pre_parsed_path = get_url_components(user_url)
+    policy = get_policy(**options) if policy is None else policy
+    parsed = _evaluate_syntax_bytes(user_url, policy)
+    return False if parsed is None else _evaluate_network_verdict(parsed, policy)
+
+
+def evaluate_url_detailed(
+    user_url: "str | ParsedURL | CleanUrl",
+    policy: Policy | None = None,
+    **options: bool,
+) -> EvaluationResult:
+    """
+    Evaluate URL (see evaluate_url) and report the failing check and per-stage timings
+
+    *Parameters*:
+
+        user_url: URL string (or ParsedURL / CleanUrl) to evaluate
+        policy  : compiled Policy
+        options : boolean options of evaluate_url (when policy is not provided)
+
+    *Returns*:
+
+        EvaluationResult: verdict, reason code (failing check), perf_counter_ns timings per stage
+                          and whether the TLS session was resumed
+
+    *Notes*:
+
+        stages: syntax (all syntax checks), dns (resolve FQDN), network (resolved IP allowed),
+        tls (connect, follow redirects and inspect TLS), total. Stages beyond policy.level are not run.
+        a URL that cannot be parsed (e.g. https://[x) fails with Reason.PARSE in stage syntax.
+    """
+    policy = get_policy(**options) if policy is None else policy
+    start = perf_counter_ns()
     try:
-        if all(
-            [
-                _has_allowed_scheme(user_url, allow_http, enable_log=enable_log),
-                _has_no_basic_auth(userinfo, enable_log=enable_log),
-                _has_no_control_character(user_url, enable_log=enable_log),
-                _has_valid_fqdn_syntax(fqdn, allow_localhost, enable_log=enable_log),
-                _has_valid_authority_syntax(authority, port, enable_log=enable_log),
-                _has_valid_tld(fqdn, allow_localhost, enable_log=enable_log),
-                _has_valid_fqdn_network(
-                    fqdn,
-                    port,
-                    allow_localhost,
-                    allow_loopback_ip,
-                    allow_private_ip,
-                    enable_log=enable_log,
-                ),
-                _has_valid_tls(
-                    scheme,
-                    authority,
-                    allow_redirect,
-                    allow_tlsv12,
-                    skip_tls,
-                    enable_log=enable_log,
-                ),
-            ]
-        ):
-            return True
-        else:
-            return False  # pragma: no cover
-    except ValueError:
-        return False
+        parsed = user_url.parsed if isinstance(user_url, CleanUrl) else _parsed_url(user_url)
+    except (IndexError, ValueError):
+        elapsed = perf_counter_ns() - start
+        return EvaluationResult(str(user_url), False, Reason.PARSE, {"syntax": elapsed, "total": elapsed})
+    return _evaluate_detailed(parsed, policy)
 
 
-def sanitize_url(user_url: str) -> str:
+def evaluate_urls(
+    user_urls: "Iterable[str | ParsedURL | CleanUrl]",
+    policy: Policy | None = None,
+    max_workers: int = EVALUATE_MAX_WORKERS,
+    **options: bool,
+) -> list[bool]:
+    """
+    Evaluate many URLs; network and TLS checks run once per host on a thread pool
+
+    *Parameters*:
+
+        user_urls  : iterable of URL strings (or ParsedURL / CleanUrl)
+        policy     : compiled Policy
+        max_workers: maximum number of threads for network and TLS checks
+        options    : boolean options of evaluate_url (when policy is not provided)
+
+    *Returns*:
+
+        List of Boolean in input order
+
+    *Notes*:
+
+        syntax checks run inline; URLs that pass them are grouped by (scheme, fqdn, port)
+        and the network/TLS verdict of each group is shared by all of its URLs.
+    """
+    policy = get_policy(**options) if policy is None else policy
+    verdicts, hosts, parsed_urls = _group_by_host(user_urls, policy)
+
+    if hosts:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(hosts))) as executor:
+            futures = {host: executor.submit(_evaluate_network_verdict, parsed_urls[host], policy) for host in hosts}
+            for host, future in futures.items():
+                verdict = future.result()
+                for index in hosts[host]:
+                    verdicts[index] = verdict
+
+    return verdicts
+
+
+async def evaluate_url_async(
+    user_url: "str | ParsedURL | CleanUrl",
+    allow_http: bool = False,
+    allow_localhost: bool = False,
+    allow_loopback_ip: bool = False,
+    allow_private_ip: bool = False,
+    allow_redirect: bool = True,
+    allow_tlsv12: bool = False,
+    skip_tls: bool = False,
+    enable_log: bool = False,
+    policy: Policy | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    level: str = "tls",
+) -> bool:
+    """
+    Async evaluate_url (loop.getaddrinfo and asyncio streams, no thread per request)
+
+    *Parameters*:
+
+        user_url : URL string (or ParsedURL / CleanUrl) to evaluate
+        options  : boolean options of evaluate_url
+        policy   : compiled Policy (the options are ignored when provided)
+        semaphore: optional asyncio.Semaphore bounding concurrent network and TLS checks
+        level    : evaluation level (see evaluate_url)
+
+    *Returns*:
+
+        Boolean
+    """
+    if policy is None:
+        policy = get_policy(
+            allow_http,
+            allow_localhost,
+            allow_loopback_ip,
+            allow_private_ip,
+            allow_redirect,
+            allow_tlsv12,
+            skip_tls,
+            enable_log,
+            level,
+        )
+    if isinstance(user_url, CleanUrl):
+        if policy not in user_url._evaluations:
+            user_url._evaluations[policy] = await _evaluate_async(user_url.parsed, policy, semaphore)
+        return user_url._evaluations[policy]
+    return await _evaluate_async(_parsed_url(user_url), policy, semaphore)
+
+
+async def evaluate_urls_async(
+    user_urls: "Iterable[str | ParsedURL | CleanUrl]",
+    policy: Policy | None = None,
+    concurrency: int = EVALUATE_MAX_CONCURRENCY,
+    **options: bool,
+) -> list[bool]:
+    """
+    Async evaluate_urls; network and TLS checks run once per host, at most `concurrency` at a time
+
+    *Parameters*:
+
+        user_urls  : iterable of URL strings (or ParsedURL / CleanUrl)
+        policy     : compiled Policy
+        concurrency: maximum number of hosts checked at the same time
+        options    : boolean options of evaluate_url (when policy is not provided)
+
+    *Returns*:
+
+        List of Boolean in input order
+    """
+    policy = get_policy(**options) if policy is None else policy
+    verdicts, hosts, parsed_urls = _group_by_host(user_urls, policy)
+
+    if hosts:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def network_verdict(parsed: ParsedURL) -> bool:
+            async with semaphore:
+                return await _evaluate_network_verdict_async(parsed, policy)
+
+        results = await asyncio.gather(*(network_verdict(parsed_urls[host]) for host in hosts))
+        for host, verdict in zip(hosts, results):
+            for index in hosts[host]:
+                verdicts[index] = verdict
+
+    return verdicts
+
+
+def sanitize_url(user_url: "str | ParsedURL | CleanUrl") -> str:
     """
     Sanitize and rebuild URL
 
     *Parameters*:
 
-        user_url: URL string to sanitize
+        user_url: URL string (or ParsedURL / CleanUrl) to sanitize
 
     *Returns*:
 
         Sanitized URL string
     """
-    sanitized_url = _remove_control_characters(user_url)
-    scheme, _, authority, _, _, pre_parsed_path = get_url_components(sanitized_url)
-    encoded_path, encoded_query, encoded_fragment = _encode_url_components(pre_parsed_path)
+    if isinstance(user_url, CleanUrl):
+        return user_url.sanitized
+    return _rebuild_url(_sanitized_components(user_url))
+
+
+def sanitize_url_bytes(user_url: "bytes | bytearray | memoryview") -> bytes:
+    """
+    Sanitize and rebuild URL given as bytes (see sanitize_url)
+
+    *Parameters*:
+
+        user_url: URL bytes (UTF-8)
+
+    *Returns*:
+
+        Sanitized URL bytes (same as sanitize_url(user_url.decode()).encode())
+
+    *Notes*:
+
+        control characters are removed with bytes.translate and path / query / fragment are
+        percent-encoded as bytes. Raises UnicodeDecodeError (a ValueError) for URLs that must be
+        decoded (outside of the single-pass shape) and are not valid UTF-8.
+    """
+    return _sanitize_bytes(user_url)
+
+
+def sanitize_many(user_urls: "Iterable[str | ParsedURL | CleanUrl]", lazy: bool = False) -> list[str] | Iterator[str]:
+    """
+    Sanitize and rebuild many URLs (same result as sanitize_url for each one)
 
-    url_components = (scheme, authority, encoded_path, encoded_query, encoded_fragment)
-    return urlunsplit(url_components)
+    *Parameters*:
+
+        user_urls: iterable of URL strings (or ParsedURL / CleanUrl)
+        lazy     : boolean to return a generator instead of a list
+
+    *Returns*:
+
+        Sanitized URL strings, in input order
+
+    *Notes*:
+
+        control characters are removed with str.replace (one memchr scan each), the pre-parsed path is split once
+        and the quoting of path / query / fragment is memoized across URLs.
+    """
+    sanitized = _sanitize_iter(user_url.parsed if isinstance(user_url, CleanUrl) else user_url for user_url in user_urls)
+    return sanitized if lazy else list(sanitized)
 
 
-def origin_url(user_url: str, enable_log: bool = False) -> str | bool:
+def stream(
+    source: "str | os.PathLike[str]",
+    destination: "str | os.PathLike[str] | BinaryIO",
+    mode: str = "sanitize",
+    policy: Policy | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    buffer_size: int = STREAM_BUFFER_SIZE,
+    **options: bool,
+) -> StreamStats:
+    """
+    Sanitize or syntax-evaluate a file of URLs (one per line) into another file, in constant memory
+
+    *Parameters*:
+
+        source     : input file, one URL per line ("\n" or "\r\n"; empty lines are skipped)
+        destination: output file path, or binary file object (e.g. sys.stdout.buffer)
+        mode       : "sanitize" (sanitized URL per line, empty line when the URL cannot be sanitized)
+                     or "syntax" (URL, tab, true / false per line; syntax checks only, no network)
+        policy     : compiled Policy (mode "syntax")
+        chunk_size : number of URLs per output write
+        buffer_size: write buffer size in bytes (destination path)
+        options    : boolean options of evaluate_url (when policy is not provided)
+
+    *Returns*:
+
+        StreamStats: URLs read, URLs sanitized / passing, bytes read
+
+    *Notes*:
+
+        the input is memory-mapped and URL lines are sliced out of the mapping one at a time;
+        sanitize_url_bytes / the syntax checks of evaluate_url_bytes run over the slices, so no
+        line is decoded unless it falls outside of the single-pass shape.
+    """
+    if mode == "sanitize":
+        process = _sanitize_line
+    elif mode == "syntax":
+        policy = get_policy(**options) if policy is None else policy
+        process = _syntax_line(policy)
+    else:
+        raise ValueError(f"unsupported stream mode: {mode!r}")
+    return _stream(source, destination, process, chunk_size=chunk_size, buffer_size=buffer_size)
+
+
+def origin_url(user_url: "str | ParsedURL | CleanUrl", enable_log: bool = False) -> str | bool:
     """
     Get Origin URL (without redirection)
 
     *Parameters*:
 
-        user_url: URL string
+        user_url: URL string (or ParsedURL / CleanUrl)
 
     *Returns*:
 
         Origin URL string: protocol + domain name + port (if not 80 or 443)
     """
+    if isinstance(user_url, CleanUrl):
+        return user_url.origin
     return _define_url(user_url=user_url, enable_log=enable_log, url_type="origin")
 
 
-def redirect_url(user_url: str, trailing_path: str = "", enable_log: bool = False) -> str | bool:
+def redirect_url(user_url: "str | ParsedURL | CleanUrl", trailing_path: str = "", enable_log: bool = False) -> str | bool:
     """
     Get Redirect URL
 
     *Parameters*:
 
-        user_url     : URL string
+        user_url     : URL string (or ParsedURL / CleanUrl)
         trailing_path: optional trailing path to attach to redirected URL
         enable_log   : boolean to enable console logging
 
@@ -129,6 +442,8 @@ def redirect_url(user_url: str, trailing_path: str = "", enable_log: bool = Fals
 
         Redirect URL string: protocol + domain name + port (if not 80 or 443) + optional trailing path
     """
+    if isinstance(user_url, CleanUrl):
+        return user_url.redirect(trailing_path=trailing_path, enable_log=enable_log)
     try:
         return _define_url(
             user_url=user_url,
@@ -138,3 +453,429 @@ def redirect_url(user_url: str, trailing_path: str = "", enable_log: bool = Fals
         )
     except ValueError:
         return False
+
+
+def trace_redirects(
+    user_url: "str | ParsedURL | CleanUrl",
+    max_redirects: int = MAX_REDIRECTS,
+    timeout: float = REDIRECT_TIMEOUT,
+) -> RedirectTrace:
+    """
+    Follow redirects from the origin of URL and record every hop (the trace behind redirect_url)
+
+    *Parameters*:
+
+        user_url     : URL string (or ParsedURL / CleanUrl)
+        max_redirects: maximum number of redirects to follow
+        timeout      : overall deadline in seconds for all hops
+
+    *Returns*:
+
+        RedirectTrace: final URL (None on failure), Hop (url, method, status, location, latency) per request
+        and the reason of a failure
+
+    *Notes*:
+
+        requests are HEAD (GET when the server answers 405/501); response bodies are never read.
+    """
+    parsed = user_url.parsed if isinstance(user_url, CleanUrl) else user_url
+    return _trace_redirects(parsed, max_redirects=max_redirects, timeout=timeout)
+
+
+async def trace_redirects_async(
+    user_url: "str | ParsedURL | CleanUrl",
+    max_redirects: int = MAX_REDIRECTS,
+    timeout: float = REDIRECT_TIMEOUT,
+) -> RedirectTrace:
+    """
+    Async trace_redirects (asyncio streams)
+    """
+    parsed = user_url.parsed if isinstance(user_url, CleanUrl) else user_url
+    return await _trace_redirects_async(parsed, max_redirects=max_redirects, timeout=timeout)
+
+
+async def origin_url_async(user_url: "str | ParsedURL | CleanUrl", enable_log: bool = False) -> str | bool:
+    """
+    Async origin_url (no network I/O; provided for symmetry with redirect_url_async)
+    """
+    return origin_url(user_url, enable_log=enable_log)
+
+
+async def redirect_url_async(
+    user_url: "str | ParsedURL | CleanUrl",
+    trailing_path: str = "",
+    enable_log: bool = False,
+    semaphore: asyncio.Semaphore | None = None,
+) -> str | bool:
+    """
+    Async redirect_url (redirects followed with HEAD requests over asyncio streams)
+
+    *Parameters*:
+
+        user_url     : URL string (or ParsedURL / CleanUrl)
+        trailing_path: optional trailing path to attach to redirected URL
+        enable_log   : boolean to enable console logging
+        semaphore    : optional asyncio.Semaphore bounding concurrent requests
+
+    *Returns*:
+
+        Redirect URL string: protocol + domain name + port (if not 80 or 443) + optional trailing path
+    """
+    parsed = user_url.parsed if isinstance(user_url, CleanUrl) else user_url
+    async with semaphore or nullcontext():
+        redirected = await _redirected_url_async(parsed)
+    if isinstance(redirected, str):
+        return _attach_trailing_path(redirected, trailing_path)
+    if enable_log:
+        logger.error("failed to open URL", stacklevel=2)
+    return False
+
+
+class CleanUrl:
+    """
+    Parse URL once and share the parsed components with evaluate, sanitize, origin and redirect
+
+    *Parameters*:
+
+        user_url: URL string (or ParsedURL)
+
+    *Notes*:
+
+        results are cached on the object, so keep one CleanUrl per URL along the ingest path.
+    """
+
+    def __init__(self, user_url: str | ParsedURL) -> None:
+        self.parsed = _parsed_url(user_url)
+        self._evaluations: dict[Policy, bool] = {}
+
+    def __repr__(self) -> str:
+        return f"CleanUrl({self.url!r})"
+
+    @property
+    def url(self) -> str:
+        return self.parsed.url
+
+    def evaluate(self, policy: Policy | None = None, **options: bool) -> bool:
+        """
+        Evaluate URL (see evaluate_url); result is cached per policy
+
+        *Parameters*:
+
+            policy : compiled Policy
+            options: boolean options of evaluate_url (when policy is not provided)
+        """
+        policy = get_policy(**options) if policy is None else policy
+        if policy not in self._evaluations:
+            self._evaluations[policy] = _evaluate(self.parsed, policy)
+        return self._evaluations[policy]
+
+    @cached_property
+    def sanitized(self) -> str:
+        """
+        Sanitized URL string (see sanitize_url)
+        """
+        return _rebuild_url(self._sanitized_parsed)
+
+    @cached_property
+    def origin(self) -> str:
+        """
+        Origin URL string (see origin_url)
+        """
+        return _sanitized_url(self._sanitized_parsed)
+
+    def redirect(self, trailing_path: str = "", enable_log: bool = False) -> str | bool:
+        """
+        Redirect URL (see redirect_url); the redirect is only followed once per object
+        """
+        if isinstance(self._redirected, str):
+            return _attach_trailing_path(self._redirected, trailing_path)
+        if enable_log:
+            logger.error("failed to open URL", stacklevel=2)
+        return False
+
+    @cached_property
+    def _sanitized_parsed(self) -> ParsedURL:
+        return _sanitized_components(self.parsed)
+
+    @cached_property
+    def _redirected(self) -> str | bool:
+        return _redirected_url(self._sanitized_parsed)
+
+
+def _parsed_url(user_url: str | ParsedURL) -> ParsedURL:
+    return user_url if isinstance(user_url, ParsedURL) else parse_url(user_url)
+
+
+def _group_by_host(
+    user_urls: "Iterable[str | ParsedURL | CleanUrl]", policy: Policy
+) -> tuple[list[bool], dict[tuple[str, str, str], list[int]], dict[tuple[str, str, str], ParsedURL]]:
+    """
+    Run syntax checks and group the URLs that pass them by (scheme, fqdn, port) (no grouping at level syntax)
+    """
+    verdicts: list[bool] = []
+    hosts: dict[tuple[str, str, str], list[int]] = {}
+    parsed_urls: dict[tuple[str, str, str], ParsedURL] = {}
+
+    for index, user_url in enumerate(user_urls):
+        verdicts.append(False)
+        try:
+            parsed = user_url.parsed if isinstance(user_url, CleanUrl) else _parsed_url(user_url)
+            if not _evaluate_syntax(parsed, policy):
+                continue  # pragma: no cover
+        except (IndexError, ValueError):
+            continue
+        if policy.level == "syntax":
+            verdicts[index] = True
+            continue
+        host = (parsed.scheme, parsed.fqdn.lower(), parsed.port)
+        hosts.setdefault(host, []).append(index)
+        parsed_urls.setdefault(host, parsed)
+
+    return verdicts, hosts, parsed_urls
+
+
+def _evaluate(parsed: ParsedURL, policy: Policy) -> bool:
+    try:
+        return _evaluate_syntax(parsed, policy) and _evaluate_network(parsed, policy)
+    except ValueError:
+        return False
+
+
+def _evaluate_detailed(parsed: ParsedURL, policy: Policy) -> EvaluationResult:
+    scheme, userinfo, authority, fqdn, port, _ = parsed
+    enable_log = policy.enable_log
+    timings: dict[str, int] = {}
+    tls_info: dict = {}
+    start = stage_start = perf_counter_ns()
+
+    def stage_done() -> None:
+        nonlocal stage_start
+        now = perf_counter_ns()
+        timings[stage] = now - stage_start
+        stage_start = now
+
+    stage, reason = "syntax", Reason.SCHEME
+    try:
+        _has_allowed_scheme(parsed.url, policy.allow_http, enable_log=enable_log)
+        reason = Reason.BASIC_AUTH
+        _has_no_basic_auth(userinfo, enable_log=enable_log)
+        reason = Reason.CONTROL_CHAR
+        _has_no_control_character(parsed.url, enable_log=enable_log)
+        reason = Reason.FQDN_SYNTAX
+        _has_valid_fqdn_syntax(fqdn, policy.allow_localhost, enable_log=enable_log)
+        reason = Reason.AUTHORITY_SYNTAX
+        _has_valid_authority_syntax(authority, port, enable_log=enable_log)
+        reason = Reason.TLD
+        _has_valid_tld(fqdn, policy.allow_localhost, enable_log=enable_log)
+        stage_done()
+
+        if policy.level != "syntax":
+            stage, reason = "dns", Reason.DNS
+            addr_info = _resolve_fqdn(fqdn, port, policy.resolver)
+            _is_fqdn_resolvable(fqdn, port, enable_log=enable_log, addr_info=addr_info)
+            stage_done()
+
+            stage, reason = "network", Reason.NETWORK
+            _is_fqdn_resolved_ip_allowed(
+                fqdn,
+                port,
+                policy.allow_localhost,
+                policy.allow_loopback_ip,
+                policy.allow_private_ip,
+                enable_log=enable_log,
+                addr_info=addr_info,
+            )
+            stage_done()
+
+            if policy.level == "tls":
+                stage, reason = "tls", Reason.TLS
+                _has_valid_tls(
+                    scheme,
+                    authority,
+                    policy.allow_redirect,
+                    policy.allow_tlsv12,
+                    policy.skip_tls,
+                    enable_log=enable_log,
+                    ssl_context=policy.ssl_context,
+                    addr_info=addr_info,
+                    resolver=policy.resolver,
+                    tls_cache=_tls_cache(policy),
+                    tls_sessions=_tls_sessions(policy),
+                    tls_info=tls_info,
+                )
+                stage_done()
+        reason = Reason.OK
+
+    except ValueError:
+        stage_done()
+
+    timings["total"] = perf_counter_ns() - start
+    return EvaluationResult(parsed.url, reason is Reason.OK, reason, timings, session_reused=tls_info.get("session_reused"))
+
+
+def _evaluate_syntax(parsed: ParsedURL, policy: Policy) -> bool:
+    """
+    URL syntax checks (raise ValueError on failure)
+    """
+    return _syntax_verdict(parsed, policy.allow_http, policy.allow_localhost, enable_log=policy.enable_log)
+
+
+def _evaluate_syntax_bytes(
+    buffer: "bytes | bytearray | memoryview | mmap", policy: Policy, pos: int = 0, endpos: int | None = None
+) -> ParsedURL | None:
+    """
+    URL syntax checks over buffer[pos:endpos]; return the (decoded) ParsedURL when they pass, None otherwise
+    """
+    endpos = len(buffer) if endpos is None else endpos
+    if not _syntax_verdict_bytes(buffer, policy, pos, endpos):
+        return None
+    components = _split_url_bytes(buffer, pos, endpos)
+    url = bytes(buffer[pos:endpos]).decode("utf-8", "replace")
+    if components is None:
+        return parse_url(url)
+    return ParsedURL(url, *(component.decode("utf-8", "replace") for component in components))
+
+
+def _syntax_verdict_bytes(
+    buffer: "bytes | bytearray | memoryview | mmap", policy: Policy, pos: int = 0, endpos: int | None = None
+) -> bool:
+    """
+    URL syntax checks over buffer[pos:endpos] (nothing is decoded for URLs of the single-pass shape)
+    """
+    endpos = len(buffer) if endpos is None else endpos
+    components = _split_url_bytes(buffer, pos, endpos)
+    if components is None:
+        try:
+            return _evaluate_syntax(parse_url(bytes(buffer[pos:endpos]).decode("utf-8")), policy)
+        except (IndexError, ValueError):
+            return False
+
+    head_end = min(pos + 8, endpos)
+    head = bytes(buffer[pos:head_end])
+    if not _has_valid_syntax_bytes(head, components, policy.allow_http, policy.allow_localhost):
+        if policy.enable_log:
+            logger.error("invalid URL syntax", stacklevel=4)
+        return False
+    return True
+
+
+def _sanitize_line(buffer: mmap, start: int, end: int) -> tuple[bytes, bool]:
+    try:
+        return _sanitize_bytes(buffer[start:end]), True
+    except (IndexError, ValueError):
+        return b"", False
+
+
+def _syntax_line(policy: Policy) -> LineProcessor:
+    def process(buffer: mmap, start: int, end: int) -> tuple[bytes, bool]:
+        verdict = _syntax_verdict_bytes(buffer, policy, start, end)
+        return buffer[start:end] + (b"\ttrue" if verdict else b"\tfalse"), verdict
+
+    return process
+
+
+def _evaluate_network(parsed: ParsedURL, policy: Policy) -> bool:
+    """
+    Network and TLS checks up to policy.level (raise ValueError on failure); depends only on scheme, FQDN and port
+    """
+    if policy.level == "syntax":
+        return True
+    scheme, _, authority, fqdn, port, _ = parsed
+    enable_log = policy.enable_log
+
+    # resolve once; the same addresses are vetted and then used for the TLS connection
+    addr_info = _resolve_fqdn(fqdn, port, policy.resolver)
+    return all(
+        [
+            _has_valid_fqdn_network(
+                fqdn,
+                port,
+                policy.allow_localhost,
+                policy.allow_loopback_ip,
+                policy.allow_private_ip,
+                enable_log=enable_log,
+                addr_info=addr_info,
+            ),
+            _has_valid_tls(
+                scheme,
+                authority,
+                policy.allow_redirect,
+                policy.allow_tlsv12,
+                _skip_tls(policy),
+                enable_log=enable_log,
+                ssl_context=policy.ssl_context,
+                addr_info=addr_info,
+                resolver=policy.resolver,
+                tls_cache=_tls_cache(policy),
+                tls_sessions=_tls_sessions(policy),
+            ),
+        ]
+    )
+
+
+def _skip_tls(policy: Policy) -> bool:
+    return policy.skip_tls or policy.level != "tls"
+
+
+def _tls_cache(policy: Policy) -> TlsVerdictCache:
+    return tls_cache if policy.tls_cache is None else policy.tls_cache
+
+
+def _tls_sessions(policy: Policy) -> TlsSessionStore:
+    return tls_sessions if policy.tls_sessions is None else policy.tls_sessions
+
+
+def _evaluate_network_verdict(parsed: ParsedURL, policy: Policy) -> bool:
+    try:
+        return _evaluate_network(parsed, policy)
+    except ValueError:
+        return False
+
+
+async def _evaluate_async(parsed: ParsedURL, policy: Policy, semaphore: asyncio.Semaphore | None = None) -> bool:
+    try:
+        if not _evaluate_syntax(parsed, policy):
+            return False  # pragma: no cover
+    except ValueError:
+        return False
+    async with semaphore or nullcontext():
+        return await _evaluate_network_verdict_async(parsed, policy)
+
+
+async def _evaluate_network_async(parsed: ParsedURL, policy: Policy) -> bool:
+    """
+    Async _evaluate_network (raise ValueError on failure)
+    """
+    if policy.level == "syntax":
+        return True
+    scheme, _, authority, fqdn, port, _ = parsed
+    enable_log = policy.enable_log
+
+    addr_info = await _resolve_fqdn_async(fqdn, port, policy.resolver)
+    return _has_valid_fqdn_network(
+        fqdn,
+        port,
+        policy.allow_localhost,
+        policy.allow_loopback_ip,
+        policy.allow_private_ip,
+        enable_log=enable_log,
+        addr_info=addr_info,
+    ) and await _has_valid_tls_async(
+        scheme,
+        authority,
+        policy.allow_redirect,
+        policy.allow_tlsv12,
+        _skip_tls(policy),
+        enable_log=enable_log,
+        ssl_context=policy.ssl_context,
+        addr_info=addr_info,
+        resolver=policy.resolver,
+        tls_cache=_tls_cache(policy),
+    )
+
+
+async def _evaluate_network_verdict_async(parsed: ParsedURL, policy: Policy) -> bool:
+    try:
+        return await _evaluate_network_async(parsed, policy)
+    except ValueError:
+        return False
@@ -0,0 +1,260 @@
+import argparse
+import asyncio
+import fileinput
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    TextIO,
+)
+
+from .clean_url import (
+    evaluate_urls,
+    evaluate_urls_async,
+    origin_url,
+    redirect_url,
+    redirect_url_async,
+    sanitize_url,
+)
+from .configs.constants import (
+    EVALUATE_MAX_CONCURRENCY,
+    EVALUATE_MAX_WORKERS,
+    EVALUATION_LEVELS,
+    STREAM_BUFFER_SIZE,
+    STREAM_CHUNK_SIZE,
+)
+from .policy import Policy
+from .syntax import evaluate_url_syntax
+
+# result key per command (JSONL output)
+RESULT_KEYS = {
+    "evaluate": "verdict",
+    "sanitize": "sanitized",
+    "origin": "origin",
+    "redirect": "redirect",
+}
+
+# state of the chunk runner (set once per process by _init_runner)
+_runner: dict = {}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    pkg-19544 console script: evaluate / sanitize / origin / redirect newline-delimited URLs
+
+    *Notes*:
+
+        CPU-bound runs (sanitize, origin, evaluate --level syntax) are split into chunks of URLs and
+        spread over a process pool (--workers); evaluate and redirect run their network checks on a
+        thread pool (--workers) or on asyncio (--concurrency). Results keep the input order.
+    """
+    args = _parser().parse_args(argv)
+    options = {
+        "command": args.command,
+        "format": args.format,
+        "policy": {
+            "allow_http": args.allow_http,
+            "allow_localhost": args.allow_localhost,
+            "allow_loopback_ip": args.allow_loopback_ip,
+            "allow_private_ip": args.allow_private_ip,
+            "allow_redirect": not args.no_redirect,
+            "allow_tlsv12": args.allow_tlsv12,
+            "skip_tls": args.skip_tls,
+            "enable_log": args.enable_log,
+            "cafile": args.cafile,
+            "capath": args.capath,
+            "level": "syntax" if args.syntax_only else args.level,
+        },
+        "trailing_path": args.trailing_path,
+        "workers": args.workers,
+        "concurrency": args.concurrency,
+    }
+    cpu_bound = args.command in ("sanitize", "origin") or options["policy"]["level"] == "syntax"
+    chunks = _read_chunks(args.files, args.chunk_size)
+
+    if args.output == "-":
+        _write(sys.stdout, _run(chunks, options, args.workers if cpu_bound else 1))
+    else:
+        with open(args.output, "w", encoding="utf-8", buffering=STREAM_BUFFER_SIZE) as output:
+            _write(output, _run(chunks, options, args.workers if cpu_bound else 1))
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("files", nargs="*", default=["-"], help="files of newline-delimited URLs (default: stdin)")
+    common.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    common.add_argument("-f", "--format", choices=("jsonl", "tsv"), default="jsonl", help="output format")
+    common.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="processes for CPU-bound runs (default: CPU count), threads for network checks",
+    )
+    common.add_argument("--chunk-size", type=int, default=STREAM_CHUNK_SIZE, help="URLs per chunk of work")
+
+    network = argparse.ArgumentParser(add_help=False)
+    network.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=None,
+        help=f"run network checks on asyncio with this many in flight (e.g. {EVALUATE_MAX_CONCURRENCY})",
+    )
+
+    policy = argparse.ArgumentParser(add_help=False)
+    policy.add_argument("--allow-http", action="store_true", help="allow http scheme")
+    policy.add_argument("--allow-localhost", action="store_true", help="allow localhost as FQDN")
+    policy.add_argument("--allow-loopback-ip", action="store_true", help="allow FQDN resolved to loopback IP address")
+    policy.add_argument("--allow-private-ip", action="store_true", help="allow FQDN resolved to private IP address")
+    policy.add_argument("--no-redirect", action="store_true", help="do not follow redirects")
+    policy.add_argument("--allow-tlsv12", action="store_true", help="allow TLSv1.2")
+    policy.add_argument("--skip-tls", action="store_true", help="skip TLS validation")
+    policy.add_argument("--cafile", default=None, help="CA bundle file for TLS validation")
+    policy.add_argument("--capath", default=None, help="CA certificate directory for TLS validation")
+    policy.add_argument("--level", choices=EVALUATION_LEVELS, default="tls", help="evaluation level (default: tls)")
+    policy.add_argument("--syntax-only", action="store_true", help="same as --level syntax (no DNS, network or TLS)")
+
+    parser = argparse.ArgumentParser(prog="pkg-19544", description="Evaluate, sanitize and resolve URLs in bulk")
+    parser.add_argument("--enable-log", action="store_true", help="enable console logging")
+    parser.set_defaults(allow_http=False, allow_localhost=False, allow_loopback_ip=False, allow_private_ip=False)
+    parser.set_defaults(no_redirect=False, allow_tlsv12=False, skip_tls=False, cafile=None, capath=None)
+    parser.set_defaults(level="tls", syntax_only=False, trailing_path="", concurrency=None)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("evaluate", parents=[common, network, policy], help="evaluate URLs (see evaluate_url)")
+    subparsers.add_parser("sanitize", parents=[common], help="sanitize URLs (see sanitize_url)")
+    subparsers.add_parser("origin", parents=[common], help="origin of URLs (see origin_url)")
+    redirect = subparsers.add_parser("redirect", parents=[common, network], help="follow redirects (see redirect_url)")
+    redirect.add_argument("--trailing-path", default="", help="trailing path to attach to redirected URLs")
+    return parser
+
+
+def _read_chunks(files: list[str], chunk_size: int) -> Iterator[list[str]]:
+    """
+    Yield lists of up to chunk_size URLs (line endings removed, empty lines skipped)
+    """
+    chunk: list[str] = []
+    with fileinput.input(files, encoding="utf-8", errors="replace") as lines:
+        for line in lines:
+            user_url = line.rstrip("\r\n")
+            if user_url:
+                chunk.append(user_url)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+    if chunk:
+        yield chunk
+
+
+def _run(chunks: Iterable[list[str]], options: dict, workers: int | None) -> Iterator[str]:
+    """
+    Yield the formatted output of every chunk, in input order
+
+    *Notes*:
+
+        with more than one worker, chunks go to a process pool; at most 2 x workers chunks are in
+        flight, so memory stays bounded on unbounded input.
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers <= 1:
+        _init_runner(options)
+        yield from map(_run_chunk, chunks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_runner, initargs=(options,)) as executor:
+        pending: deque = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_run_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _write(output: TextIO, results: Iterable[str]) -> None:
+    for result in results:
+        output.write(result)
+    output.flush()
+
+
+def _init_runner(options: dict) -> None:
+    _runner.clear()
+    _runner.update(options, policy=Policy(**options["policy"]))
+
+
+def _run_chunk(chunk: list[str]) -> str:
+    """
+    Run the command of the runner over a chunk of URLs and return the formatted output lines
+    """
+    command, policy = _runner["command"], _runner["policy"]
+    values: list
+    if command == "sanitize":
+        values = [_guarded(sanitize_url, user_url) for user_url in chunk]
+    elif command == "origin":
+        values = [_guarded(origin_url, user_url) or None for user_url in chunk]
+    elif command == "evaluate" and policy.level == "syntax":
+        values = [evaluate_url_syntax(user_url, policy=policy) for user_url in chunk]
+    elif command == "evaluate" and _runner["concurrency"]:
+        values = asyncio.run(evaluate_urls_async(chunk, policy=policy, concurrency=_runner["concurrency"]))
+    elif command == "evaluate":
+        values = evaluate_urls(chunk, policy=policy, max_workers=_runner["workers"] or EVALUATE_MAX_WORKERS)
+    else:
+        values = [value or None for value in _redirect_urls(chunk)]
+    return _format(chunk, values, RESULT_KEYS[command], _runner["format"])
+
+
+def _redirect_urls(chunk: list[str]) -> list:
+    trailing_path = _runner["trailing_path"]
+    if _runner["concurrency"]:
+        semaphore_size = _runner["concurrency"]
+
+        async def redirect_all() -> list:
+            semaphore = asyncio.Semaphore(semaphore_size)
+            return await asyncio.gather(
+                *(redirect_url_async(user_url, trailing_path=trailing_path, semaphore=semaphore) for user_url in chunk)
+            )
+
+        return asyncio.run(redirect_all())
+
+    with ThreadPoolExecutor(max_workers=_runner["workers"] or EVALUATE_MAX_WORKERS) as executor:
+        return list(executor.map(lambda user_url: redirect_url(user_url, trailing_path=trailing_path), chunk))
+
+
+def _guarded(function: Callable, *args):
+    """
+    Call function; None when it raises ValueError / IndexError (malformed URL)
+    """
+    try:
+        return function(*args)
+    except (IndexError, ValueError):
+        return None
+
+
+def _format(chunk: list[str], values: list, key: str, output_format: str) -> str:
+    """
+    Format one output line per URL: JSON object {"url": ..., key: value} or URL, tab, value
+    """
+    if output_format == "jsonl":
+        lines = [json.dumps({"url": user_url, key: value}) for user_url, value in zip(chunk, values)]
+    else:
+        lines = [f"{user_url}\t{_tsv_value(value)}" for user_url, value in zip(chunk, values)]
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _tsv_value(value: object) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
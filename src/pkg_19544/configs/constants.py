@@ -1,8 +1,20 @@
 # configs/constants.py
 
+import os
+
 BLACKLIST_CIPHERS = ["ANON", "EXPORT", "NULL"]
 BLACKLIST_CONTROL_CHARACTERS = ["\n", "\r"]
 
+DNS_CACHE_SIZE = 4096
+DNS_CACHE_TTL = 300
+DNS_CACHE_NEGATIVE_TTL = 30
+
+# evaluation levels, cheapest first: syntax checks only / + DNS and IP checks / + TLS checks
+EVALUATION_LEVELS = ("syntax", "dns", "tls")
+
+EVALUATE_MAX_CONCURRENCY = 256
+EVALUATE_MAX_WORKERS = 32
+
 HEADER_DEFAULT = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36",  # noqa: E501
     "Accept": "*/*",
@@ -12,11 +24,29 @@ HEADER_DEFAULT = {
     "Connection": "keep-alive",
 }
 
+MAX_REDIRECTS = 10
+REDIRECT_TIMEOUT = 15
+
+SANITIZE_QUOTE_CACHE_SIZE = 65536
+
+STREAM_BUFFER_SIZE = 1 << 20
+STREAM_CHUNK_SIZE = 4096
+
 TIMEOUT_DEFAULT = 5
 HTTPS_TIMEOUT = 5
 SOCKET_TIMEOUT = 2
 
-TLD_LIST = "src/pkg_19544/configs/tlds.py"
+TLS_CACHE_SIZE = 4096
+TLS_CACHE_TTL = 3600
+TLS_CACHE_NEGATIVE_TTL = 60
+TLS_SESSION_CACHE_SIZE = 1024
+TLS_SESSION_TTL = 300
+
+PSL_LIST = os.path.join(os.path.dirname(__file__), "public_suffix_list.dat")
+PSL_LIVE = "https://publicsuffix.org/list/public_suffix_list.dat"
+
+TLD_LOOKUP_CACHE_SIZE = 1024
+TLD_SNAPSHOT = os.path.join(os.path.dirname(__file__), "tlds.bin")
 TLD_LIVE = "https://data.iana.org/TLD/tlds-alpha-by-domain.txt"
 
 WHITELIST_CHARS_IN_AUTHORITY = r"^[a-zA-Z0-9\.\-\:]+$"
@@ -1,4 +1,4 @@
-from pkg_19544.configs import constants, tlds
+from pkg_19544.configs import constants
 from pkg_19544.utils import err
 
-__all__ = ("constants", "err", "tlds")
+__all__ = ("constants", "err")
@@ -1,9 +1,13 @@
-from urllib.request import urlopen
+from time import monotonic
 
-from ..configs.constants import TIMEOUT_DEFAULT
-from ..helpers.sanitize import _remove_control_characters
+from ..configs.constants import MAX_REDIRECTS, REDIRECT_TIMEOUT
+from ..helpers.probe import REDIRECT_STATUS, _probe_final_hop, _probe_final_hop_async
+from ..helpers.sanitize import _sanitized_components
+from ..result import Hop, RedirectTrace
+from ..utils.dns import Resolver, dns_cache
 from ..utils.err import raise_on_false
-from ..utils.url import get_url_components
+from ..utils.tls import get_ssl_context
+from ..utils.url import ParsedURL
 
 
 class ValueError(ValueError):
@@ -11,28 +15,130 @@ class ValueError(ValueError):
 
 
 @raise_on_false(exception_type=ValueError, message="failed to open URL")
-def _define_url(user_url: str, url_type: str = "", trailing_path: str = "", enable_log: bool = False) -> str | bool:
+def _define_url(
+    user_url: str | ParsedURL,
+    url_type: str = "",
+    trailing_path: str = "",
+    enable_log: bool = False,
+) -> str | bool:
     """
     return URL for different usages
     """
     if url_type == "origin":
         return _sanitized_url(user_url=user_url)
     elif url_type == "redirect":
-        try:
-            with urlopen(_sanitized_url(user_url=user_url), timeout=TIMEOUT_DEFAULT) as response:
-                response_url = response.url
-                trailing_path = "/" + trailing_path if trailing_path and not trailing_path.startswith("/") else trailing_path
-                return _sanitized_url(response_url) + trailing_path
-
-        except Exception:
-            return False
+        redirected_url = _redirected_url(user_url)
+        return _attach_trailing_path(redirected_url, trailing_path) if redirected_url else False
     else:
         return False
 
 
-def _sanitized_url(user_url: str) -> str:
-    sanitized_url = _remove_control_characters(user_url)
-    scheme, _, _, fqdn, port, _ = get_url_components(sanitized_url)
+def _redirected_url(user_url: str | ParsedURL) -> str | bool:
+    """
+    return origin of the URL that the origin of user_url redirects to
+    """
+    trace = _trace_redirects(user_url)
+    return _sanitized_url(trace.url) if trace.url else False
+
+
+async def _redirected_url_async(user_url: str | ParsedURL) -> str | bool:
+    """
+    Async _redirected_url (HEAD requests over asyncio streams, GET fallback on 405/501)
+    """
+    trace = await _trace_redirects_async(user_url)
+    return _sanitized_url(trace.url) if trace.url else False
+
+
+def _trace_redirects(
+    user_url: str | ParsedURL,
+    max_redirects: int = MAX_REDIRECTS,
+    timeout: float = REDIRECT_TIMEOUT,
+    resolver: Resolver | None = None,
+) -> RedirectTrace:
+    """
+    Follow redirects from the origin of user_url with HEAD requests (GET fallback on 405/501, body never read)
+
+    *Notes*:
+
+        at most max_redirects redirects are followed, all of them within timeout seconds.
+    """
+    resolver = dns_cache if resolver is None else resolver
+    hops: list[Hop] = []
+    try:
+        scheme, _, _, fqdn, port, _ = _sanitized_components(user_url)
+        if scheme not in ("http", "https"):
+            return RedirectTrace(None, hops, f"unsupported scheme: {scheme}")
+        deadline = monotonic() + timeout
+        reached = _probe_final_hop(
+            scheme,
+            fqdn,
+            int(port),
+            get_ssl_context(allow_tlsv12=True),
+            lambda sock: True,
+            addr_info=resolver.resolve(fqdn, port),
+            max_redirects=max_redirects,
+            resolver=resolver,
+            hops=hops,
+            deadline=deadline,
+        )
+        return RedirectTrace(hops[-1].url, hops) if reached else RedirectTrace(None, hops, _trace_error(hops))
+
+    except Exception as e:
+        return RedirectTrace(None, hops, f"{type(e).__name__}: {e}")
+
+
+async def _trace_redirects_async(
+    user_url: str | ParsedURL,
+    max_redirects: int = MAX_REDIRECTS,
+    timeout: float = REDIRECT_TIMEOUT,
+    resolver: Resolver | None = None,
+) -> RedirectTrace:
+    """
+    Async _trace_redirects (asyncio streams)
+    """
+    resolver = dns_cache if resolver is None else resolver
+    hops: list[Hop] = []
+    try:
+        scheme, _, _, fqdn, port, _ = _sanitized_components(user_url)
+        if scheme not in ("http", "https"):
+            return RedirectTrace(None, hops, f"unsupported scheme: {scheme}")
+        deadline = monotonic() + timeout
+        redirected_url = await _probe_final_hop_async(
+            scheme,
+            fqdn,
+            int(port),
+            get_ssl_context(allow_tlsv12=True),
+            lambda ssl_object, url: url,
+            addr_info=await resolver.resolve_async(fqdn, port),
+            max_redirects=max_redirects,
+            resolver=resolver,
+            hops=hops,
+            deadline=deadline,
+        )
+        return RedirectTrace(redirected_url, hops) if redirected_url else RedirectTrace(None, hops, _trace_error(hops))
+
+    except Exception as e:
+        return RedirectTrace(None, hops, f"{type(e).__name__}: {e}")
+
+
+def _trace_error(hops: list[Hop]) -> str:
+    """
+    Reason the probe stopped without reaching a final URL, from its last hop
+    """
+    if hops and hops[-1].status >= 400:
+        return f"HTTP status {hops[-1].status}"
+    if hops and hops[-1].status in REDIRECT_STATUS:
+        return f"redirect not followed: {hops[-1].location}"
+    return "no final URL"  # pragma: no cover
+
+
+def _attach_trailing_path(redirected_url: str, trailing_path: str = "") -> str:
+    trailing_path = "/" + trailing_path if trailing_path and not trailing_path.startswith("/") else trailing_path
+    return redirected_url + trailing_path
+
+
+def _sanitized_url(user_url: str | ParsedURL) -> str:
+    scheme, _, _, fqdn, port, _ = _sanitized_components(user_url)
     port = "" if port and port in ["80", "443"] else ":" + port if port else ""
 
     return scheme + "://" + fqdn + port
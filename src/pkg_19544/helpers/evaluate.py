@@ -1,126 +1,43 @@
-import ipaddress
-import re
 import socket
 import ssl
 from datetime import datetime, timezone
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
-
-from ..configs.constants import (
-    BLACKLIST_CIPHERS,
-    BLACKLIST_CONTROL_CHARACTERS,
-    HEADER_DEFAULT,
-    HTTPS_TIMEOUT,
-    SOCKET_TIMEOUT,
-    WHITELIST_CHARS_IN_AUTHORITY,
-    WHITELIST_CHARS_IN_FQDN,
-    WHITELIST_HASHING_ALG,
-    WHITELIST_PROTO_SCHEME,
-    WHITELIST_TLS_VERSION,
+from http.client import HTTPException
+
+from ..configs.constants import BLACKLIST_CIPHERS, WHITELIST_HASHING_ALG
+from ..helpers.probe import (
+    _create_connection,
+    _handshake_async,
+    _probe_final_hop,
+    _probe_final_hop_async,
+    _store_session,
 )
-from ..configs.tlds import TLDS
+from ..helpers.syntax import (  # noqa: F401 (syntax checks used to live here)
+    _has_allowed_scheme,
+    _has_no_basic_auth,
+    _has_no_control_character,
+    _has_valid_authority_syntax,
+    _has_valid_fqdn_syntax,
+    _has_valid_syntax_bytes,
+    _has_valid_tld,
+)
+from ..policy import TLS_VERSIONS
+from ..utils.dns import Resolver, dns_cache
 from ..utils.err import raise_on_false
-from ..utils.url import get_url_components
+from ..utils.ip import (
+    LINK_LOCAL,
+    LOOPBACK,
+    PRIVATE,
+    RESERVED,
+    UNSPECIFIED,
+    classify_ips,
+)
+from ..utils.tls import TlsSessionStore, TlsVerdictCache, get_ssl_context
 
 
 class ValueError(ValueError):
     pass
 
 
-@raise_on_false(exception_type=ValueError, message="invalid protocol scheme prefix")
-def _has_allowed_scheme(user_url: str, allow_http: bool = False, enable_log: bool = False) -> bool:
-    """
-    only http(s) is supported
-    """
-    PROTO_SCHEME = tuple(WHITELIST_PROTO_SCHEME) + ("http://",) if allow_http else tuple(WHITELIST_PROTO_SCHEME)
-    return True if user_url.lower().startswith(PROTO_SCHEME) else False
-
-
-@raise_on_false(exception_type=ValueError, message="invalid URL - basic auth is not supported")
-def _has_no_basic_auth(userinfo: str, enable_log: bool = False) -> bool:
-    """
-    userinfo is not supported
-    """
-    return True if not userinfo else False
-
-
-@raise_on_false(
-    exception_type=ValueError,
-    message="invalid URL - unsupported control characters found",
-)
-def _has_no_control_character(user_url: str, enable_log: bool = False) -> bool:
-    """
-    Control character is not supported due to log injection risk.
-
-    *Referencee*: https://owasp.org/www-community/attacks/Log_Injection
-    """
-    return False if any(char in user_url for char in BLACKLIST_CONTROL_CHARACTERS) else True
-
-
-@raise_on_false(
-    exception_type=ValueError,
-    message="invalid FQDN - check chars usage, max length of label(63)/ fqdn(255)",
-)
-def _has_valid_fqdn_syntax(fqdn: str, allow_localhost: bool = False, enable_log: bool = False) -> bool:
-    """
-    *Notes*:
-
-        allowed characters: https://datatracker.ietf.org/doc/html/rfc3986#section-2
-    """
-    if fqdn.lower() == "localhost" and allow_localhost:
-        return True
-    else:
-        if all(
-            [
-                re.fullmatch(WHITELIST_CHARS_IN_FQDN, fqdn) is not None,
-                fqdn.count(".") > 0,
-                len(fqdn) <= 255,
-            ]
-        ):
-            list_split_fqdn = fqdn.split(".")
-            for label in list_split_fqdn:
-                if any([not label[0].isalnum(), not label[-1].isalnum(), len(label) > 63]):
-                    return False
-            return True
-        else:
-            return False
-
-
-@raise_on_false(
-    exception_type=ValueError,
-    message="invalid authority - check chars usage and any port number",
-)
-def _has_valid_authority_syntax(authority: str, port: str, enable_log: bool = False) -> bool:
-    """
-    *Notes*:
-
-        allowed characters: https://datatracker.ietf.org/doc/html/rfc3986#section-2
-        allowed length    : https://datatracker.ietf.org/doc/html/rfc2181#section-11
-    """
-    if any(
-        [
-            re.fullmatch(WHITELIST_CHARS_IN_AUTHORITY, authority) is None,
-            authority.count(":") > 1,
-            port.startswith("0"),
-            not port.isdigit(),
-            not 1 <= int(port) <= 65535 if port.isdigit() else True,
-        ]
-    ):
-        return False
-    return True
-
-
-@raise_on_false(exception_type=ValueError, message="invalid top-level domain")
-def _has_valid_tld(fqdn: str, allow_localhost: bool = False, enable_log: bool = False) -> bool:
-    """
-    Check top-level domain
-    """
-    if fqdn.lower() == "localhost" and allow_localhost:
-        return True
-    else:
-        return True if fqdn.split(".")[-1:][0].upper() in TLDS else False
-
-
 @raise_on_false(exception_type=ValueError, message="FQDN error at network layer")
 def _has_valid_fqdn_network(
     fqdn: str,
@@ -129,13 +46,19 @@ def _has_valid_fqdn_network(
     allow_loopback_ip: bool = False,
     allow_private_ip: bool = False,
     enable_log: bool = False,
+    addr_info: list | None = None,
 ) -> bool:
     """
     Check FQDN at network layer
+
+    *Notes*:
+
+        addr_info: result of _resolve_fqdn (FQDN is resolved once here when missing)
     """
+    addr_info = _resolve_fqdn(fqdn, port) if addr_info is None else addr_info
     if all(
         [
-            _is_fqdn_resolvable(fqdn, port, enable_log=enable_log),
+            _is_fqdn_resolvable(fqdn, port, enable_log=enable_log, addr_info=addr_info),
             _is_fqdn_resolved_ip_allowed(
                 fqdn,
                 port,
@@ -143,6 +66,7 @@ def _has_valid_fqdn_network(
                 allow_loopback_ip,
                 allow_private_ip,
                 enable_log=enable_log,
+                addr_info=addr_info,
             ),
         ]
     ):
@@ -151,8 +75,7 @@ def _has_valid_fqdn_network(
         return False  # pragma: no cover
 
 
-@raise_on_false(exception_type=ValueError, message="unable to resolve FQDN")
-def _is_fqdn_resolvable(fqdn: str, port: str, enable_log: bool = False) -> bool:
+def _resolve_fqdn(fqdn: str, port: str | int, resolver: Resolver | None = None) -> list:
     """
     https://docs.python.org/3/library/socket.html
 
@@ -161,11 +84,30 @@ def _is_fqdn_resolvable(fqdn: str, port: str, enable_log: bool = False) -> bool:
         Family: AF_UNSPEC (0)
         Type  : SOCK_STREAM (1)
         Proto : IPPROTO_TCP (6)
+        resolver: Policy.resolver; answers (and failures) are cached in dns_cache by default.
     """
     try:
-        return True if socket.getaddrinfo(fqdn, port, family=0, type=1, proto=6, flags=socket.AI_CANONNAME) else False
+        return (dns_cache if resolver is None else resolver).resolve(fqdn, port)
     except socket.gaierror:
-        return False
+        return []
+
+
+async def _resolve_fqdn_async(fqdn: str, port: str | int, resolver: Resolver | None = None) -> list:
+    """
+    Async _resolve_fqdn (loop.getaddrinfo, same dns_cache)
+    """
+    try:
+        return await (dns_cache if resolver is None else resolver).resolve_async(fqdn, port)
+    except socket.gaierror:
+        return []
+
+
+@raise_on_false(exception_type=ValueError, message="unable to resolve FQDN")
+def _is_fqdn_resolvable(fqdn: str, port: str, enable_log: bool = False, addr_info: list | None = None) -> bool:
+    """
+    Check FQDN resolves (addr_info: result of _resolve_fqdn, resolved here when missing)
+    """
+    return True if (_resolve_fqdn(fqdn, port) if addr_info is None else addr_info) else False
 
 
 @raise_on_false(
@@ -179,6 +121,7 @@ def _is_fqdn_resolved_ip_allowed(
     allow_loopback_ip: bool = False,
     allow_private_ip: bool = False,
     enable_log: bool = False,
+    addr_info: list | None = None,
 ) -> bool:
     """
     In an API call, FQDN that resolves to a non-Public Routable IP
@@ -202,25 +145,15 @@ def _is_fqdn_resolved_ip_allowed(
     """
     allow_loopback_ip = True if fqdn.lower() == "localhost" and allow_localhost else allow_loopback_ip
     allow_private_ip = True if fqdn.lower() == "localhost" and allow_localhost else allow_private_ip
-    try:
-        list_addr_info = socket.getaddrinfo(fqdn, port, family=0, type=1, proto=6, flags=socket.AI_CANONNAME)
-        if list_addr_info:
-            for addr_info in list_addr_info:
-                ip_addr = ipaddress.ip_address(addr_info[4][0])
-                if any(
-                    [
-                        ip_addr.is_unspecified,
-                        False if allow_loopback_ip else ip_addr.is_link_local,
-                        False if allow_loopback_ip else ip_addr.is_loopback,
-                        False if allow_loopback_ip else ip_addr.is_reserved,
-                        (False if allow_private_ip or ip_addr.is_loopback else ip_addr.is_private),
-                    ]
-                ):
-                    return False
-            return True
-        else:
-            return False
-    except socket.gaierror:
+    list_addr_info = _resolve_fqdn(fqdn, port) if addr_info is None else addr_info
+    if list_addr_info:
+        # flags from the precompiled interval tables (same answers as the ipaddress is_* properties)
+        disallowed = UNSPECIFIED if allow_loopback_ip else UNSPECIFIED | LINK_LOCAL | LOOPBACK | RESERVED
+        for flags in classify_ips(addr_info[4][0] for addr_info in list_addr_info):
+            if flags & disallowed or (not allow_private_ip and flags & PRIVATE and not flags & LOOPBACK):
+                return False
+        return True
+    else:
         return False
 
 
@@ -232,48 +165,162 @@ def _has_valid_tls(
     allow_tlsv12: bool = False,
     skip_tls: bool = False,
     enable_log: bool = False,
+    ssl_context: ssl.SSLContext | None = None,
+    addr_info: list | None = None,
+    resolver: Resolver | None = None,
+    tls_cache: TlsVerdictCache | None = None,
+    tls_sessions: TlsSessionStore | None = None,
+    tls_info: dict | None = None,
 ) -> bool:
     """
     Check TLS unless skip_tls=True
+
+    *Notes*:
+
+        ssl_context: ready-made context (from Policy); the shared context of get_ssl_context when missing.
+        addr_info  : vetted addresses of the FQDN (from _resolve_fqdn); the TLS socket connects to one
+                     of them (SNI set to FQDN) unless a redirect leads to another host.
+        resolver   : resolves the hosts that redirects lead to (default: dns_cache).
+        tls_cache  : verdict cache keyed by (scheme, fqdn, port, TLS policy); no caching when missing.
+        tls_sessions: TLS sessions resumed per (fqdn, port, ssl_context); full handshakes when missing
+                     (without redirects, a new TLSv1.3 connection sends HEAD / to receive its ticket).
+        tls_info   : filled with cert and session_reused of the inspected connection (when one was made).
+        redirects  : followed with HEAD requests; TLS is inspected on the final hop's connection.
     """
     if skip_tls:
         return True
     else:
-        fqdn = authority.split(":", maxsplit=1)[0] if ":" in authority else authority
-        port = int(authority.split(":", maxsplit=1)[1]) if ":" in authority else 443 if scheme == "https" else 80
+        fqdn, port = _split_authority(scheme, authority)
+        ssl_context = ssl_context or get_ssl_context(allow_tlsv12)
+        key = (scheme, fqdn.lower(), port, bool(allow_redirect), bool(allow_tlsv12), ssl_context)
+        verdict = None if tls_cache is None else tls_cache.get(key)
+        if verdict is not None:
+            return verdict
+
+        peer = {} if tls_info is None else tls_info
         try:
-            ssl_context = ssl.create_default_context()
-            ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+            inspect = _inspect_tls_keep_peer(peer, allow_tlsv12, enable_log)
+            if allow_redirect:
+                verdict = _probe_final_hop(
+                    scheme,
+                    fqdn,
+                    port,
+                    ssl_context,
+                    lambda ssock: inspect(ssock, ""),
+                    addr_info=addr_info,
+                    resolver=resolver,
+                    tls_sessions=tls_sessions,
+                )
+            else:
+                session = None if tls_sessions is None else tls_sessions.get(fqdn, port, ssl_context)
+                with _create_connection(fqdn, port, addr_info) as sock:
+                    with ssl_context.wrap_socket(sock, server_hostname=fqdn, session=session) as ssock:
+                        verdict = inspect(ssock, "")
+                        if tls_sessions is not None:
+                            _store_session(ssock, fqdn, port, ssl_context, tls_sessions)
+
+        except (OSError, HTTPException):
+            verdict = False
+        except ValueError:
+            if tls_cache is not None:
+                tls_cache.set(key, False)
+            raise
+
+        if tls_cache is not None:
+            tls_cache.set(key, bool(verdict), peer.get("cert"))
+        return verdict
+
+
+@raise_on_false(exception_type=ValueError, message="invalid https certificate or connections")
+async def _has_valid_tls_async(
+    scheme: str,
+    authority: str,
+    allow_redirect: bool = False,
+    allow_tlsv12: bool = False,
+    skip_tls: bool = False,
+    enable_log: bool = False,
+    ssl_context: ssl.SSLContext | None = None,
+    addr_info: list | None = None,
+    resolver: Resolver | None = None,
+    tls_cache: TlsVerdictCache | None = None,
+    tls_sessions: TlsSessionStore | None = None,
+    tls_info: dict | None = None,
+) -> bool:
+    """
+    Async _has_valid_tls (asyncio streams, TLS inspected on the transport's SSLObject)
+
+    *Notes*:
 
+        asyncio streams cannot offer a session, so tls_sessions is not used (full handshakes).
+    """
+    if skip_tls:
+        return True
+    else:
+        fqdn, port = _split_authority(scheme, authority)
+        ssl_context = ssl_context or get_ssl_context(allow_tlsv12)
+        key = (scheme, fqdn.lower(), port, bool(allow_redirect), bool(allow_tlsv12), ssl_context)
+        verdict = None if tls_cache is None else tls_cache.get(key)
+        if verdict is not None:
+            return verdict
+
+        peer = {} if tls_info is None else tls_info
+        try:
+            inspect = _inspect_tls_keep_peer(peer, allow_tlsv12, enable_log)
             if allow_redirect:
-                user_url = f"{scheme}://" + authority
-                req = Request(user_url, headers=HEADER_DEFAULT)
-                with urlopen(req, context=ssl_context, timeout=HTTPS_TIMEOUT) as response:
-                    redirected_url = response.geturl()
-                    _, _, _, fqdn, port, _ = get_url_components(redirected_url)
-
-            with socket.create_connection((fqdn, int(port)), timeout=SOCKET_TIMEOUT) as sock:
-                with ssl_context.wrap_socket(sock, server_hostname=fqdn) as ssock:
-                    cipher_info = ssock.cipher()
-                    if cipher_info:
-                        cipher_name, protocol_version, _ = cipher_info
-                        _has_no_blacklist_cipher(cipher_name, enable_log=enable_log)
-                        _has_weak_hash_alg(cipher_name, enable_log=enable_log)
-                        _has_weak_protocol(protocol_version, allow_tlsv12, enable_log=enable_log)
-                        _has_invalid_expired_cert(ssock, enable_log=enable_log)
-                    else:
-                        return False
-                return True
+                verdict = await _probe_final_hop_async(
+                    scheme, fqdn, port, ssl_context, inspect, addr_info=addr_info, resolver=resolver
+                )
+            else:
+                verdict = await _handshake_async(fqdn, port, ssl_context, inspect, addr_info=addr_info)
 
-        except (
-            ConnectionRefusedError,
-            ssl.SSLError,
-            socket.gaierror,
-            socket.timeout,
-            HTTPError,
-            URLError,
-        ):
-            return False
+        except (OSError, HTTPException):
+            verdict = False
+        except ValueError:
+            if tls_cache is not None:
+                tls_cache.set(key, False)
+            raise
+
+        if tls_cache is not None:
+            tls_cache.set(key, bool(verdict), peer.get("cert"))
+        return verdict
+
+
+def _split_authority(scheme: str, authority: str) -> tuple[str, int]:
+    fqdn = authority.split(":", maxsplit=1)[0] if ":" in authority else authority
+    port = int(authority.split(":", maxsplit=1)[1]) if ":" in authority else 443 if scheme == "https" else 80
+    return fqdn, port
+
+
+def _inspect_tls_keep_peer(peer: dict, allow_tlsv12: bool = False, enable_log: bool = False):
+    """
+    Return an inspect(ssock, url) callback for the probers that also records cert and session_reused in peer
+    """
+
+    def inspect(ssock: "ssl.SSLSocket | ssl.SSLObject | None", url: str) -> bool:
+        if isinstance(ssock, (ssl.SSLSocket, ssl.SSLObject)):
+            peer["session_reused"] = ssock.session_reused
+        verdict = _inspect_tls(ssock, allow_tlsv12, enable_log=enable_log)  # type: ignore[arg-type]
+        if verdict:
+            peer["cert"] = ssock.getpeercert()  # type: ignore[union-attr]
+        return verdict
+
+    return inspect
+
+
+def _inspect_tls(ssock: ssl.SSLSocket, allow_tlsv12: bool = False, enable_log: bool = False) -> bool:
+    """
+    Check cipher, protocol and certificate of an established TLS socket (False for plain sockets)
+    """
+    cipher_info = ssock.cipher() if hasattr(ssock, "cipher") else None
+    if cipher_info:
+        cipher_name, protocol_version, _ = cipher_info
+        _has_no_blacklist_cipher(cipher_name, enable_log=enable_log)
+        _has_weak_hash_alg(cipher_name, enable_log=enable_log)
+        _has_weak_protocol(protocol_version, allow_tlsv12, enable_log=enable_log)
+        _has_invalid_expired_cert(ssock, enable_log=enable_log)
+        return True
+    else:
+        return False
 
 
 @raise_on_false(exception_type=ValueError, message="TLS not using strong cipher")
@@ -288,8 +335,7 @@ def _has_weak_hash_alg(cipher_name: str, enable_log: bool = False) -> bool:
 
 @raise_on_false(exception_type=ValueError, message="TLS not using strong protocol")
 def _has_weak_protocol(protocol_version: str, allow_tlsv12: bool = False, enable_log: bool = False) -> bool:
-    WHITELIST_TLS_VERSION.append("TLSv1.2") if allow_tlsv12 else WHITELIST_TLS_VERSION
-    return False if protocol_version not in WHITELIST_TLS_VERSION else True
+    return False if protocol_version not in TLS_VERSIONS[bool(allow_tlsv12)] else True
 
 
 @raise_on_false(exception_type=ValueError, message="invalid or expired certificate")
@@ -0,0 +1,335 @@
+import asyncio
+import io
+import socket
+import ssl
+from http.client import (
+    HTTPConnection,
+    HTTPException,
+    HTTPSConnection,
+    RemoteDisconnected,
+    parse_headers,
+)
+from time import monotonic, perf_counter_ns
+from typing import Any, Callable
+from urllib.parse import urljoin
+
+from ..configs.constants import (
+    HEADER_DEFAULT,
+    HTTPS_TIMEOUT,
+    MAX_REDIRECTS,
+    SOCKET_TIMEOUT,
+)
+from ..result import Hop
+from ..utils.dns import Resolver, dns_cache
+from ..utils.tls import TlsSessionStore
+from ..utils.url import ParsedURL, parse_url
+
+REDIRECT_STATUS = frozenset({301, 302, 303, 307, 308})
+HEAD_NOT_ALLOWED_STATUS = frozenset({405, 501})
+
+
+def _create_connection(fqdn: str, port: int, addr_info: list | None = None) -> socket.socket:
+    """
+    Connect to one of the vetted addresses in addr_info (no new DNS lookup), or to FQDN when missing
+    """
+    if not addr_info:
+        return socket.create_connection((fqdn, port), timeout=SOCKET_TIMEOUT)
+
+    error: OSError = ConnectionRefusedError(f"unable to connect to {fqdn}:{port}")
+    for family, type, proto, _, sockaddr in addr_info:
+        sock = socket.socket(family, type, proto)
+        try:
+            sock.settimeout(SOCKET_TIMEOUT)
+            sock.connect(sockaddr)
+            return sock
+        except OSError as e:
+            sock.close()
+            error = e
+    raise error
+
+
+def _probe_final_hop(
+    scheme: str,
+    fqdn: str,
+    port: int,
+    ssl_context: ssl.SSLContext,
+    inspect: Callable[[socket.socket], Any],
+    addr_info: list | None = None,
+    path: str = "/",
+    max_redirects: int = MAX_REDIRECTS,
+    resolver: Resolver | None = None,
+    tls_sessions: TlsSessionStore | None = None,
+    hops: list[Hop] | None = None,
+    deadline: float | None = None,
+) -> Any:
+    """
+    Follow redirects with HEAD requests and inspect the socket of the final hop
+
+    *Notes*:
+
+        every hop is a single TCP (+TLS) connection: the request is sent over the socket that
+        inspect() then reads (cipher, protocol, certificate), so no second handshake is needed.
+        HEAD falls back to GET (body not read) when the server answers 405/501.
+        HTTP status >= 400 on the final hop fails the probe (same as urlopen raising HTTPError).
+        a redirect to another host is resolved with resolver (default: dns_cache).
+        TLS hops resume the session kept in tls_sessions for their host (no resumption when missing).
+        hops (when given) receives one Hop per request; deadline is a time.monotonic() value after
+        which the probe fails with TimeoutError.
+    """
+    resolver = dns_cache if resolver is None else resolver
+    method = "HEAD"
+    redirects = 0
+    while True:
+        timeout = _remaining(deadline)
+        hop_start = perf_counter_ns()
+        sock = _create_connection(fqdn, port, addr_info)
+        try:
+            if scheme == "https":
+                session = None if tls_sessions is None else tls_sessions.get(fqdn, port, ssl_context)
+                sock = ssl_context.wrap_socket(sock, server_hostname=fqdn, session=session)
+                conn: HTTPConnection = HTTPSConnection(fqdn, port, timeout=timeout, context=ssl_context)
+            else:
+                conn = HTTPConnection(fqdn, port, timeout=timeout)
+            sock.settimeout(_remaining(deadline))
+            conn.sock = sock
+            conn.request(method, path, headers=HEADER_DEFAULT)
+            response = conn.getresponse()
+            if tls_sessions is not None and isinstance(sock, ssl.SSLSocket):
+                # TLSv1.3 tickets arrive after the handshake: store the session once the response is read
+                tls_sessions.set(fqdn, port, ssl_context, sock.session)
+            try:
+                location = response.getheader("Location")
+                if hops is not None:
+                    latency = perf_counter_ns() - hop_start
+                    hops.append(Hop(_hop_url(scheme, fqdn, port, path), method, response.status, location, latency))
+                if method == "HEAD" and response.status in HEAD_NOT_ALLOWED_STATUS:
+                    method = "GET"
+                    continue
+                if response.status in REDIRECT_STATUS and location:
+                    if redirects >= max_redirects:
+                        return False
+                    redirects += 1
+                    method = "HEAD"
+                    redirected = _redirect_target(scheme, fqdn, port, path, location)
+                    if redirected is None:
+                        return False
+                    if (redirected.fqdn.lower(), int(redirected.port)) != (fqdn.lower(), port):
+                        addr_info = resolver.resolve(redirected.fqdn, redirected.port)
+                    scheme, fqdn, port = redirected.scheme, redirected.fqdn, int(redirected.port)
+                    path = _request_path(redirected)
+                    continue
+                if response.status >= 400:
+                    return False
+                return inspect(sock)
+            finally:
+                response.close()
+        finally:
+            sock.close()
+
+
+def _store_session(
+    ssock: ssl.SSLSocket,
+    fqdn: str,
+    port: int,
+    ssl_context: ssl.SSLContext,
+    tls_sessions: TlsSessionStore,
+) -> None:
+    """
+    Keep the session of a connection made without an HTTP request (no redirect probe) for resumption
+
+    *Notes*:
+
+        TLSv1.3 tickets arrive after the handshake and are only read with application data, so a
+        fresh TLSv1.3 connection first sends HEAD / and reads the response (status ignored).
+        a resumed connection keeps the session already stored.
+    """
+    if ssock.version() != "TLSv1.3":
+        tls_sessions.set(fqdn, port, ssl_context, ssock.session)
+        return
+    if ssock.session_reused:
+        return
+    conn = HTTPSConnection(fqdn, port, context=ssl_context)
+    conn.sock = ssock
+    try:
+        conn.request("HEAD", "/", headers=HEADER_DEFAULT)
+        response = conn.getresponse()
+    except (OSError, HTTPException):
+        return
+    try:
+        # read while the response still holds the socket open
+        tls_sessions.set(fqdn, port, ssl_context, ssock.session)
+    finally:
+        response.close()
+
+
+def _remaining(deadline: float | None) -> float:
+    """
+    Timeout of the next hop: HTTPS_TIMEOUT, shortened to what is left before deadline
+    """
+    if deadline is None:
+        return HTTPS_TIMEOUT
+    remaining = deadline - monotonic()
+    if remaining <= 0:
+        raise TimeoutError("redirect deadline exceeded")
+    return min(HTTPS_TIMEOUT, remaining)
+
+
+def _hop_url(scheme: str, fqdn: str, port: int, path: str) -> str:
+    host = fqdn if port == (443 if scheme == "https" else 80) else f"{fqdn}:{port}"
+    return f"{scheme}://{host}{path}"
+
+
+def _redirect_target(scheme: str, fqdn: str, port: int, path: str, location: str) -> ParsedURL | None:
+    """
+    Resolve a Location header against the current hop (None for non-http(s) targets)
+    """
+    redirected = parse_url(urljoin(f"{scheme}://{fqdn}:{port}{path}", location))
+    return redirected if redirected.scheme in ("http", "https") else None
+
+
+def _request_path(parsed: ParsedURL) -> str:
+    return (parsed.pre_parsed_path or "/").split("#", maxsplit=1)[0]
+
+
+async def _open_connection_async(
+    fqdn: str,
+    port: int,
+    ssl_context: ssl.SSLContext | None = None,
+    addr_info: list | None = None,
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Async _create_connection: connect to a vetted address (TLS with SNI set to FQDN when ssl_context is given)
+    """
+    server_hostname = fqdn if ssl_context else None
+    if not addr_info:
+        async with asyncio.timeout(SOCKET_TIMEOUT):
+            return await asyncio.open_connection(fqdn, port, ssl=ssl_context, server_hostname=server_hostname)
+
+    loop = asyncio.get_running_loop()
+    error: OSError = ConnectionRefusedError(f"unable to connect to {fqdn}:{port}")
+    for family, type, proto, _, sockaddr in addr_info:
+        sock = socket.socket(family, type, proto)
+        try:
+            sock.setblocking(False)
+            async with asyncio.timeout(SOCKET_TIMEOUT):
+                await loop.sock_connect(sock, sockaddr)
+        except OSError as e:
+            sock.close()
+            error = e
+            continue
+        try:
+            return await asyncio.open_connection(sock=sock, ssl=ssl_context, server_hostname=server_hostname)
+        except BaseException:
+            sock.close()
+            raise
+    raise error
+
+
+async def _read_response_head(reader: asyncio.StreamReader) -> tuple[int, str | None]:
+    """
+    Read status line and headers of an HTTP/1.x response; return (status, Location)
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+        raise RemoteDisconnected("incomplete HTTP response head") from e
+    status_line, _, header_block = head.partition(b"\r\n")
+    version, _, rest = status_line.decode("iso-8859-1").partition(" ")
+    status = rest[:3]
+    if not version.startswith("HTTP/") or not status.isdigit():
+        raise RemoteDisconnected(f"invalid HTTP status line: {status_line[:64]!r}")
+    headers = parse_headers(io.BytesIO(header_block))
+    return int(status), headers.get("Location")
+
+
+def _request_head(method: str, scheme: str, fqdn: str, port: int, path: str) -> bytes:
+    host = fqdn if port == (443 if scheme == "https" else 80) else f"{fqdn}:{port}"
+    headers = {"Host": host, **HEADER_DEFAULT, "Connection": "close"}
+    lines = [f"{method} {path} HTTP/1.1"] + [f"{name}: {value}" for name, value in headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def _probe_final_hop_async(
+    scheme: str,
+    fqdn: str,
+    port: int,
+    ssl_context: ssl.SSLContext,
+    inspect: Callable[[ssl.SSLObject | None, str], Any],
+    addr_info: list | None = None,
+    path: str = "/",
+    max_redirects: int = MAX_REDIRECTS,
+    resolver: Resolver | None = None,
+    hops: list[Hop] | None = None,
+    deadline: float | None = None,
+) -> Any:
+    """
+    Async _probe_final_hop; inspect(ssl_object, final_url) runs on the final hop's connection
+
+    *Notes*:
+
+        ssl_object is None on a plain http hop. Returns the result of inspect, or False when the
+        probe fails (too many redirects, non-http(s) target, HTTP status >= 400).
+        hops and deadline: see _probe_final_hop.
+    """
+    resolver = dns_cache if resolver is None else resolver
+    method = "HEAD"
+    redirects = 0
+    while True:
+        async with asyncio.timeout(_remaining(deadline)):
+            hop_start = perf_counter_ns()
+            reader, writer = await _open_connection_async(fqdn, port, ssl_context if scheme == "https" else None, addr_info)
+            try:
+                writer.write(_request_head(method, scheme, fqdn, port, path))
+                await writer.drain()
+                status, location = await _read_response_head(reader)
+                if hops is not None:
+                    latency = perf_counter_ns() - hop_start
+                    hops.append(Hop(_hop_url(scheme, fqdn, port, path), method, status, location, latency))
+                head_not_allowed = method == "HEAD" and status in HEAD_NOT_ALLOWED_STATUS
+                if not head_not_allowed and not (status in REDIRECT_STATUS and location):
+                    if status >= 400:
+                        return False
+                    return inspect(writer.get_extra_info("ssl_object"), _hop_url(scheme, fqdn, port, path))
+            finally:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except OSError:
+                    pass
+
+        if head_not_allowed:
+            method = "GET"
+            continue
+        if redirects >= max_redirects:
+            return False
+        redirects += 1
+        method = "HEAD"
+        redirected = _redirect_target(scheme, fqdn, port, path, location)  # type: ignore[arg-type]
+        if redirected is None:
+            return False
+        if (redirected.fqdn.lower(), int(redirected.port)) != (fqdn.lower(), port):
+            addr_info = await resolver.resolve_async(redirected.fqdn, redirected.port)
+        scheme, fqdn, port = redirected.scheme, redirected.fqdn, int(redirected.port)
+        path = _request_path(redirected)
+
+
+async def _handshake_async(
+    fqdn: str,
+    port: int,
+    ssl_context: ssl.SSLContext,
+    inspect: Callable[[ssl.SSLObject | None, str], Any],
+    addr_info: list | None = None,
+) -> Any:
+    """
+    Async TLS handshake without an HTTP request; return inspect(ssl_object, url)
+    """
+    async with asyncio.timeout(HTTPS_TIMEOUT):
+        _, writer = await _open_connection_async(fqdn, port, ssl_context, addr_info)
+        try:
+            return inspect(writer.get_extra_info("ssl_object"), f"https://{fqdn}:{port}")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
@@ -1,17 +1,137 @@
-from urllib.parse import quote_plus, urlsplit
+from functools import lru_cache
+from typing import Iterable, Iterator
+from urllib.parse import quote_plus, urlsplit, urlunsplit
 
-from ..configs.constants import BLACKLIST_CONTROL_CHARACTERS
+from ..configs.constants import BLACKLIST_CONTROL_CHARACTERS, SANITIZE_QUOTE_CACHE_SIZE
+from ..utils.url import (
+    UNICODE_SPACES_BYTES,
+    ParsedURL,
+    _split_url_bytes,
+    parse_url,
+)
+
+# control characters deleted with bytes.translate (one pass, 256-entry table)
+CONTROL_CHARACTERS_BYTES = "".join(BLACKLIST_CONTROL_CHARACTERS).encode("ascii")
+# str.strip removes these too (bytes.strip only removes ASCII whitespace)
+_STR_ONLY_WHITESPACE = frozenset(b"\x1c\x1d\x1e\x1f")
 
 
 def _remove_control_characters(user_url: str) -> str:
+    # str.replace per character beats a str.translate table here: URLs rarely contain them and
+    # replace scans with memchr, while translate maps every character
     updated_url = user_url.strip()
     for chars in BLACKLIST_CONTROL_CHARACTERS:
         updated_url = updated_url.replace(chars, "")
     return updated_url
 
 
+def _split_path(pre_parsed_path: str) -> tuple[str, str, str]:
+    """
+    Split pre-parsed path into (path, query, fragment), same as urlsplit
+
+    *Notes*:
+
+        printable paths starting with a single "/" (no netloc, no scheme, nothing for urlsplit
+        to strip) are split with str.partition; anything else goes through urlsplit.
+    """
+    if pre_parsed_path[:1] == "/" and pre_parsed_path[1:2] != "/" and pre_parsed_path.isprintable():
+        rest, _, fragment = pre_parsed_path.partition("#")
+        path, _, query = rest.partition("?")
+        return (path, query, fragment)
+    split = urlsplit(pre_parsed_path)
+    return (split.path, split.query, split.fragment)
+
+
+@lru_cache(maxsize=SANITIZE_QUOTE_CACHE_SIZE)
+def _quote_component(component: str, safe: str) -> str:
+    """
+    quote_plus memoized per (component, safe); path/query/fragment of a crawl frontier repeat a lot
+    """
+    return quote_plus(component, safe=safe)
+
+
 def _encode_url_components(pre_parsed_path) -> tuple[str, str, str]:
-    encoded_path = quote_plus(urlsplit(pre_parsed_path).path, safe="/+")
-    encoded_query = quote_plus(urlsplit(pre_parsed_path).query, safe="?&=")
-    encoded_fragment = quote_plus(urlsplit(pre_parsed_path).fragment, safe="#")
+    path, query, fragment = _split_path(pre_parsed_path)
+    encoded_path = _quote_component(path, "/+") if path else ""
+    encoded_query = _quote_component(query, "?&=") if query else ""
+    encoded_fragment = _quote_component(fragment, "#") if fragment else ""
     return (encoded_path, encoded_query, encoded_fragment)
+
+
+def _sanitized_components(user_url: str | ParsedURL) -> ParsedURL:
+    """
+    return URL components after removing control characters (reuse parsed URL when nothing is removed)
+    """
+    if isinstance(user_url, str):
+        return parse_url(_remove_control_characters(user_url))
+
+    sanitized_url = _remove_control_characters(user_url.url)
+    return user_url if sanitized_url == user_url.url else parse_url(sanitized_url)
+
+
+def _rebuild_url(parsed: ParsedURL) -> str:
+    encoded_path, encoded_query, encoded_fragment = _encode_url_components(parsed.pre_parsed_path)
+    return urlunsplit((parsed.scheme, parsed.authority, encoded_path, encoded_query, encoded_fragment))
+
+
+def _sanitize_iter(user_urls: Iterable[str | ParsedURL]) -> Iterator[str]:
+    """
+    Sanitize URL strings / ParsedURLs one by one (same result as _rebuild_url(_sanitized_components(url)))
+    """
+    remove_control_characters, rebuild_url = _remove_control_characters, _rebuild_url
+    for user_url in user_urls:
+        if isinstance(user_url, str):
+            yield rebuild_url(parse_url(remove_control_characters(user_url)))
+        else:
+            yield rebuild_url(_sanitized_components(user_url))
+
+
+@lru_cache(maxsize=SANITIZE_QUOTE_CACHE_SIZE)
+def _quote_component_bytes(component: bytes, safe: str) -> bytes:
+    """
+    _quote_component over bytes (percent-encodes the bytes as they are, no decode)
+    """
+    return quote_plus(component, safe=safe).encode("ascii")
+
+
+def _sanitize_bytes(raw: "bytes | bytearray | memoryview") -> bytes:
+    """
+    Sanitize a URL given as bytes; same result as _rebuild_url(_sanitized_components(raw.decode())).encode()
+
+    *Notes*:
+
+        URLs outside of the single-pass shape are decoded (UTF-8) and go through the str sanitizer;
+        raises UnicodeDecodeError (a ValueError) when such a URL is not valid UTF-8.
+    """
+    data = bytes(raw).strip()
+    if data and (
+        data[0] in _STR_ONLY_WHITESPACE
+        or data[-1] in _STR_ONLY_WHITESPACE
+        or data.startswith(UNICODE_SPACES_BYTES)
+        or data.endswith(UNICODE_SPACES_BYTES)
+    ):
+        return _sanitize_bytes_fallback(data)
+    data = data.translate(None, CONTROL_CHARACTERS_BYTES)
+
+    components = _split_url_bytes(data)
+    if components is None or not components[2]:
+        return _sanitize_bytes_fallback(data)
+    scheme, _, authority, _, _, pre_parsed_path = components
+    if pre_parsed_path[:2] == b"//":
+        return _sanitize_bytes_fallback(data)
+
+    # pre-parsed path starts with "/", "?", "#" or is empty: split as urlsplit does
+    rest, hash_mark, fragment = pre_parsed_path.partition(b"#")
+    path, question_mark, query = rest.partition(b"?")
+    sanitized = [scheme, b"://", authority]
+    if path:
+        sanitized.append(_quote_component_bytes(path, "/+"))
+    if query:
+        sanitized += (b"?", _quote_component_bytes(query, "?&="))
+    if fragment:
+        sanitized += (b"#", _quote_component_bytes(fragment, "#"))
+    return b"".join(sanitized)
+
+
+def _sanitize_bytes_fallback(data: bytes) -> bytes:
+    return _rebuild_url(_sanitized_components(data.decode("utf-8"))).encode("utf-8")
@@ -0,0 +1,99 @@
+import mmap
+import os
+from contextlib import nullcontext
+from typing import BinaryIO, Callable, Iterator
+
+from ..result import StreamStats
+
+# process(buffer, start, end) -> (output line without newline, passed)
+LineProcessor = Callable[[mmap.mmap, int, int], tuple[bytes, bool]]
+
+
+def _url_slices(buffer: mmap.mmap, start: int = 0, end: int | None = None) -> Iterator[tuple[int, int]]:
+    """
+    Yield (start, end) of every non-empty line of buffer[start:end], without its "\\n" or "\\r\\n"
+
+    *Notes*:
+
+        lines are found with buffer.find, one at a time; nothing is copied out of the buffer.
+    """
+    end = len(buffer) if end is None else end
+    find = buffer.find
+    while start < end:
+        newline = find(b"\n", start, end)
+        line_end = end if newline < 0 else newline
+        stop = line_end - 1 if line_end > start and buffer[line_end - 1] == 0x0D else line_end
+        if stop > start:
+            yield start, stop
+        start = line_end + 1
+
+
+def _map_file(path: "str | os.PathLike[str]") -> mmap.mmap | None:
+    """
+    Map a file read-only for a sequential scan (None for an empty file, which cannot be mapped)
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        buffer.madvise(mmap.MADV_SEQUENTIAL)
+    return buffer
+
+
+def _release_pages(buffer: mmap.mmap, start: int, end: int) -> int:
+    """
+    Drop the pages of buffer[start:end] from the process (they stay in the page cache); return the new start
+    """
+    end -= end % mmap.PAGESIZE
+    if end > start and hasattr(mmap, "MADV_DONTNEED"):
+        buffer.madvise(mmap.MADV_DONTNEED, start, end - start)
+        return end
+    return start
+
+
+def _stream(
+    source: "str | os.PathLike[str]",
+    destination: "str | os.PathLike[str] | BinaryIO",
+    process: LineProcessor,
+    chunk_size: int,
+    buffer_size: int,
+) -> StreamStats:
+    """
+    Run process over every URL line of source and write one output line per URL to destination
+
+    *Notes*:
+
+        output lines are joined and written once per chunk of chunk_size URLs; pages of the
+        mapped input are released after every chunk, so memory stays flat whatever the file size.
+    """
+    buffer = _map_file(source)
+    urls = passed = 0
+    if hasattr(destination, "write"):
+        writer = nullcontext(destination)
+    else:
+        writer = open(destination, "wb", buffering=buffer_size)  # type: ignore[arg-type]
+
+    with writer as output:
+        if buffer is None:
+            return StreamStats(0, 0, 0)
+        try:
+            lines: list[bytes] = []
+            released = 0
+            for start, end in _url_slices(buffer):
+                line, ok = process(buffer, start, end)
+                lines.append(line)
+                passed += ok
+                if len(lines) >= chunk_size:
+                    urls += len(lines)
+                    lines.append(b"")
+                    output.write(b"\n".join(lines))
+                    lines.clear()
+                    released = _release_pages(buffer, released, start)
+            if lines:
+                urls += len(lines)
+                lines.append(b"")
+                output.write(b"\n".join(lines))
+            return StreamStats(urls, passed, len(buffer))
+        finally:
+            buffer.close()
@@ -0,0 +1,185 @@
+import re
+
+from ..configs.constants import (
+    BLACKLIST_CONTROL_CHARACTERS,
+    WHITELIST_CHARS_IN_AUTHORITY,
+    WHITELIST_CHARS_IN_FQDN,
+    WHITELIST_PROTO_SCHEME,
+)
+from ..utils.err import raise_on_false
+from ..utils.tld_index import tld_registry
+from ..utils.url import ParsedURL
+
+# keep this module free of socket / ssl imports (see syntax.py:evaluate_url_syntax)
+
+# precomputed once per process (keyed by allow_http)
+PROTO_SCHEMES = {
+    False: tuple(WHITELIST_PROTO_SCHEME),
+    True: tuple(WHITELIST_PROTO_SCHEME) + ("http://",),
+}
+AUTHORITY_PATTERN = re.compile(WHITELIST_CHARS_IN_AUTHORITY)
+FQDN_PATTERN = re.compile(WHITELIST_CHARS_IN_FQDN)
+
+# byte-level counterparts of the syntax check patterns (see _has_valid_syntax_bytes)
+PROTO_SCHEMES_BYTES = {
+    allow_http: tuple(prefix.encode("ascii") for prefix in prefixes) for allow_http, prefixes in PROTO_SCHEMES.items()
+}
+AUTHORITY_PATTERN_BYTES = re.compile(WHITELIST_CHARS_IN_AUTHORITY.encode("ascii"))
+FQDN_PATTERN_BYTES = re.compile(WHITELIST_CHARS_IN_FQDN.encode("ascii"))
+
+
+class ValueError(ValueError):
+    pass
+
+
+@raise_on_false(exception_type=ValueError, message="invalid protocol scheme prefix")
+def _has_allowed_scheme(user_url: str, allow_http: bool = False, enable_log: bool = False) -> bool:
+    """
+    only http(s) is supported
+    """
+    return True if user_url.lower().startswith(PROTO_SCHEMES[bool(allow_http)]) else False
+
+
+@raise_on_false(exception_type=ValueError, message="invalid URL - basic auth is not supported")
+def _has_no_basic_auth(userinfo: str, enable_log: bool = False) -> bool:
+    """
+    userinfo is not supported
+    """
+    return True if not userinfo else False
+
+
+@raise_on_false(
+    exception_type=ValueError,
+    message="invalid URL - unsupported control characters found",
+)
+def _has_no_control_character(user_url: str, enable_log: bool = False) -> bool:
+    """
+    Control character is not supported due to log injection risk.
+
+    *Referencee*: https://owasp.org/www-community/attacks/Log_Injection
+    """
+    return False if any(char in user_url for char in BLACKLIST_CONTROL_CHARACTERS) else True
+
+
+@raise_on_false(
+    exception_type=ValueError,
+    message="invalid FQDN - check chars usage, max length of label(63)/ fqdn(255)",
+)
+def _has_valid_fqdn_syntax(fqdn: str, allow_localhost: bool = False, enable_log: bool = False) -> bool:
+    """
+    *Notes*:
+
+        allowed characters: https://datatracker.ietf.org/doc/html/rfc3986#section-2
+    """
+    if fqdn.lower() == "localhost" and allow_localhost:
+        return True
+    else:
+        if all(
+            [
+                FQDN_PATTERN.fullmatch(fqdn) is not None,
+                fqdn.count(".") > 0,
+                len(fqdn) <= 255,
+            ]
+        ):
+            list_split_fqdn = fqdn.split(".")
+            for label in list_split_fqdn:
+                # empty label (a..com, .a.com, a.com.) is invalid
+                if not label or any([not label[0].isalnum(), not label[-1].isalnum(), len(label) > 63]):
+                    return False
+            return True
+        else:
+            return False
+
+
+@raise_on_false(
+    exception_type=ValueError,
+    message="invalid authority - check chars usage and any port number",
+)
+def _has_valid_authority_syntax(authority: str, port: str, enable_log: bool = False) -> bool:
+    """
+    *Notes*:
+
+        allowed characters: https://datatracker.ietf.org/doc/html/rfc3986#section-2
+        allowed length    : https://datatracker.ietf.org/doc/html/rfc2181#section-11
+    """
+    if any(
+        [
+            AUTHORITY_PATTERN.fullmatch(authority) is None,
+            authority.count(":") > 1,
+            port.startswith("0"),
+            not port.isdigit(),
+            not 1 <= int(port) <= 65535 if port.isdigit() else True,
+        ]
+    ):
+        return False
+    return True
+
+
+@raise_on_false(exception_type=ValueError, message="invalid top-level domain")
+def _has_valid_tld(fqdn: str, allow_localhost: bool = False, enable_log: bool = False) -> bool:
+    """
+    Check top-level domain
+    """
+    if fqdn.lower() == "localhost" and allow_localhost:
+        return True
+    else:
+        return True if fqdn.rpartition(".")[2] in tld_registry else False
+
+
+def _has_valid_syntax_bytes(
+    head: bytes,
+    components: tuple[bytes, bytes, bytes, bytes, bytes, bytes],
+    allow_http: bool = False,
+    allow_localhost: bool = False,
+) -> bool:
+    """
+    All URL syntax checks (scheme to TLD) over bytes components (from utils/url.py:_split_url_bytes)
+
+    *Notes*:
+
+        head is the start of the user-supplied URL (at least 8 bytes when available) for the scheme check.
+        Components come from the single-pass split, which only accepts URLs without control characters.
+        Same verdicts as the str checks.
+        Nothing is logged.
+    """
+    _, userinfo, authority, fqdn, port, _ = components
+    if not head.lower().startswith(PROTO_SCHEMES_BYTES[bool(allow_http)]) or userinfo:
+        return False
+
+    localhost = allow_localhost and fqdn.lower() == b"localhost"
+    if not localhost:
+        if FQDN_PATTERN_BYTES.fullmatch(fqdn) is None or b"." not in fqdn or len(fqdn) > 255:
+            return False
+        for label in fqdn.split(b"."):
+            if not (label[:1].isalnum() and label[-1:].isalnum() and len(label) <= 63):
+                return False
+
+    if (
+        AUTHORITY_PATTERN_BYTES.fullmatch(authority) is None
+        or authority.count(b":") > 1
+        or port.startswith(b"0")
+        or not port.isdigit()
+        or not 1 <= int(port) <= 65535
+    ):
+        return False
+
+    return localhost or fqdn.rpartition(b".")[2] in tld_registry
+
+
+def _syntax_verdict(
+    parsed: ParsedURL, allow_http: bool = False, allow_localhost: bool = False, enable_log: bool = False
+) -> bool:
+    """
+    All URL syntax checks, scheme to TLD (raise ValueError on failure)
+    """
+    _, userinfo, authority, fqdn, port, _ = parsed
+    return all(
+        [
+            _has_allowed_scheme(parsed.url, allow_http, enable_log=enable_log),
+            _has_no_basic_auth(userinfo, enable_log=enable_log),
+            _has_no_control_character(parsed.url, enable_log=enable_log),
+            _has_valid_fqdn_syntax(fqdn, allow_localhost, enable_log=enable_log),
+            _has_valid_authority_syntax(authority, port, enable_log=enable_log),
+            _has_valid_tld(fqdn, allow_localhost, enable_log=enable_log),
+        ]
+    )
@@ -0,0 +1,119 @@
+import ssl
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from .configs.constants import EVALUATION_LEVELS, WHITELIST_TLS_VERSION
+from .utils.dns import Resolver
+from .utils.tls import (
+    TlsSessionStore,
+    TlsVerdictCache,
+    get_ssl_context,
+    set_default_ca,
+)
+
+# precomputed once per process (keyed by allow_tlsv12)
+TLS_VERSIONS = {
+    False: frozenset(WHITELIST_TLS_VERSION),
+    True: frozenset(WHITELIST_TLS_VERSION) | {"TLSv1.2"},
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Policy:
+    """
+    Compiled evaluation policy for evaluate_url
+
+    *Parameters*:
+
+        allow_http       : boolean to allow http scheme
+        allow_localhost  : boolean to allow using localhost as FQDN
+        allow_loopback_ip: boolean to use FQDN resolved to loopback ip address
+        allow_private_ip : boolean to use FQDN resolved to private ip address
+        allow_redirect   : boolean to follow redirect
+        allow_tlsv12     : boolean to use TLSv1.2 in HTTPS protocol
+        skip_tls         : boolean to skip TLS validation
+        enable_log       : boolean to enable console logging
+        cafile           : CA bundle file for TLS validation (default: configure_ca / system CA)
+        capath           : CA certificate directory for TLS validation (default: configure_ca / system CA)
+        resolver         : DNS resolver (default: shared CachingResolver, pkg_19544.utils.dns.dns_cache)
+        tls_cache        : TLS verdict cache (default: shared cache, pkg_19544.utils.tls.tls_cache;
+                           TlsVerdictCache(maxsize=0) disables caching)
+        tls_sessions     : TLS session store for resumption (default: shared store, pkg_19544.utils.tls.tls_sessions;
+                           TlsSessionStore(maxsize=0) disables resumption)
+        level            : evaluation level, "syntax" (syntax checks only), "dns" (+ DNS and resolved IP checks)
+                           or "tls" (+ TLS checks, default)
+
+    *Notes*:
+
+        a Policy is immutable and hashable (on the options above), so it can be
+        built once, shared across threads and used as a cache key.
+    """
+
+    allow_http: bool = False
+    allow_localhost: bool = False
+    allow_loopback_ip: bool = False
+    allow_private_ip: bool = False
+    allow_redirect: bool = True
+    allow_tlsv12: bool = False
+    skip_tls: bool = False
+    enable_log: bool = False
+    cafile: str | None = None
+    capath: str | None = None
+    resolver: Resolver | None = None
+    tls_cache: TlsVerdictCache | None = None
+    tls_sessions: TlsSessionStore | None = None
+    level: str = "tls"
+
+    ssl_context: ssl.SSLContext | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.level not in EVALUATION_LEVELS:
+            raise ValueError(f"unknown evaluation level: {self.level!r} (expected one of {EVALUATION_LEVELS})")
+        # no TLS check below level tls
+        skip_tls = self.skip_tls or self.level != "tls"
+        object.__setattr__(
+            self,
+            "ssl_context",
+            None if skip_tls else get_ssl_context(self.allow_tlsv12, cafile=self.cafile, capath=self.capath),
+        )
+
+
+@lru_cache(maxsize=None)
+def get_policy(
+    allow_http: bool = False,
+    allow_localhost: bool = False,
+    allow_loopback_ip: bool = False,
+    allow_private_ip: bool = False,
+    allow_redirect: bool = True,
+    allow_tlsv12: bool = False,
+    skip_tls: bool = False,
+    enable_log: bool = False,
+    level: str = "tls",
+) -> Policy:
+    """
+    Return the shared Policy for a combination of options (built once)
+    """
+    return Policy(
+        allow_http=allow_http,
+        allow_localhost=allow_localhost,
+        allow_loopback_ip=allow_loopback_ip,
+        allow_private_ip=allow_private_ip,
+        allow_redirect=allow_redirect,
+        allow_tlsv12=allow_tlsv12,
+        skip_tls=skip_tls,
+        enable_log=enable_log,
+        level=level,
+    )
+
+
+def configure_ca(cafile: str | None = None, capath: str | None = None) -> None:
+    """
+    Load a custom CA file / directory once (at startup) for every policy without its own CA source
+
+    *Parameters*:
+
+        cafile: CA bundle file
+        capath: CA certificate directory
+    """
+    set_default_ca(cafile=cafile, capath=capath)
+    get_policy.cache_clear()
@@ -0,0 +1,135 @@
+from enum import IntEnum
+from typing import NamedTuple
+
+
+class Reason(IntEnum):
+    """
+    Compact reason code of an evaluation (0 = passed, otherwise the failing check)
+    """
+
+    OK = 0
+    SCHEME = 1
+    BASIC_AUTH = 2
+    CONTROL_CHAR = 3
+    FQDN_SYNTAX = 4
+    AUTHORITY_SYNTAX = 5
+    TLD = 6
+    DNS = 7
+    NETWORK = 8
+    TLS = 9
+    PARSE = 10
+
+
+class EvaluationResult:
+    """
+    Detailed result of evaluate_url_detailed
+
+    *Attributes*:
+
+        url    : user-supplied URL
+        verdict: same Boolean as evaluate_url
+        reason : Reason code (Reason.OK when verdict is True)
+        timings: perf_counter_ns duration per stage (syntax, dns, network, tls, total);
+                 stages after the failing one are missing
+        session_reused: True when the TLS handshake resumed a stored session, False for a full
+                        handshake, None when no handshake was inspected (skip_tls, cached verdict)
+
+    *Notes*:
+
+        the result is truthy when verdict is True.
+    """
+
+    __slots__ = ("url", "verdict", "reason", "timings", "session_reused")
+
+    def __init__(
+        self,
+        url: str,
+        verdict: bool,
+        reason: Reason,
+        timings: dict[str, int],
+        session_reused: bool | None = None,
+    ) -> None:
+        self.url = url
+        self.verdict = verdict
+        self.reason = reason
+        self.timings = timings
+        self.session_reused = session_reused
+
+    def __bool__(self) -> bool:
+        return self.verdict
+
+    def __repr__(self) -> str:
+        return f"EvaluationResult(url={self.url!r}, verdict={self.verdict!r}, failed_check={self.failed_check!r})"
+
+    @property
+    def failed_check(self) -> str | None:
+        """
+        Name of the failing check (scheme, basic_auth, control_char, fqdn_syntax, authority_syntax, tld, dns, network, tls,
+        parse when the URL could not be parsed)
+        """
+        return None if self.reason is Reason.OK else self.reason.name.lower()
+
+
+class Hop(NamedTuple):
+    """
+    One request of a redirect trace
+
+    *Attributes*:
+
+        url     : requested URL (scheme://fqdn:port/path)
+        method  : HEAD, or GET when the server does not allow HEAD
+        status  : HTTP status code
+        location: Location header (None when missing)
+        latency : perf_counter_ns duration from connect to response head
+    """
+
+    url: str
+    method: str
+    status: int
+    location: str | None
+    latency: int
+
+
+class RedirectTrace:
+    """
+    Result of trace_redirects
+
+    *Attributes*:
+
+        url    : final URL (None when the trace failed)
+        hops   : Hop per request, in order (also for a failed trace)
+        error  : reason of a failed trace (None when url is set)
+
+    *Notes*:
+
+        the trace is truthy when the final URL was reached.
+    """
+
+    __slots__ = ("url", "hops", "error")
+
+    def __init__(self, url: str | None, hops: list[Hop], error: str | None = None) -> None:
+        self.url = url
+        self.hops = hops
+        self.error = error
+
+    def __bool__(self) -> bool:
+        return self.url is not None
+
+    def __repr__(self) -> str:
+        return f"RedirectTrace(url={self.url!r}, hops={len(self.hops)}, error={self.error!r})"
+
+
+class StreamStats(NamedTuple):
+    """
+    Counters of a stream run
+
+    *Attributes*:
+
+        urls  : number of URL lines read (one output line each)
+        passed: URLs sanitized (mode "sanitize") or passing the syntax checks (mode "syntax")
+        size  : bytes read from the input file
+    """
+
+    urls: int
+    passed: int
+    size: int
@@ -0,0 +1,45 @@
+from typing import TYPE_CHECKING
+
+from .helpers.syntax import _syntax_verdict
+from .utils.url import ParsedURL, parse_url
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .policy import Policy
+
+# this module (and everything it imports) must not import socket / ssl / asyncio:
+# `from pkg_19544 import evaluate_url_syntax` loads only what the syntax checks need
+
+
+def evaluate_url_syntax(
+    user_url: "str | ParsedURL",
+    allow_http: bool = False,
+    allow_localhost: bool = False,
+    enable_log: bool = False,
+    policy: "Policy | None" = None,
+) -> bool:
+    """
+    Evaluate URL syntax only: scheme, basic auth, control characters, FQDN, authority and TLD (no DNS, network or TLS)
+
+    *Parameters*:
+
+        user_url       : URL string (or ParsedURL) to evaluate
+        allow_http     : boolean to allow http scheme
+        allow_localhost: boolean to allow using localhost as FQDN
+        enable_log     : boolean to enable console logging
+        policy         : compiled Policy (the boolean options above are ignored when provided)
+
+    *Returns*:
+
+        Boolean (same as evaluate_url with level="syntax")
+
+    *Notes*:
+
+        never imports socket or ssl, so it is cheap to load in every worker of a process pool.
+    """
+    if policy is not None:
+        allow_http, allow_localhost, enable_log = policy.allow_http, policy.allow_localhost, policy.enable_log
+    try:
+        parsed = user_url if isinstance(user_url, ParsedURL) else parse_url(user_url)
+        return _syntax_verdict(parsed, allow_http, allow_localhost, enable_log=enable_log)
+    except (IndexError, ValueError):
+        return False
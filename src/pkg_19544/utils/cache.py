@@ -0,0 +1,64 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+class TtlCache:
+    """
+    Thread-safe LRU cache where each entry carries its own time-to-live
+
+    *Parameters*:
+
+        maxsize: maximum number of entries (least recently used entry is evicted first)
+        clock  : monotonic clock in seconds
+    """
+
+    def __init__(self, maxsize: int, clock: Callable[[], float] = monotonic) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = clock
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                if entry[0] > self._clock():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (self._clock() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drop all entries and reset counters
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,181 @@
+import asyncio
+import ipaddress
+import socket
+import time
+from typing import Callable, Mapping, Protocol
+
+from pkg_19544.configs.constants import (
+    DNS_CACHE_NEGATIVE_TTL,
+    DNS_CACHE_SIZE,
+    DNS_CACHE_TTL,
+)
+from pkg_19544.utils.cache import _MISSING, TtlCache
+
+
+class Resolver(Protocol):
+    """
+    DNS resolver used by evaluate_url (see Policy.resolver)
+
+    resolve / resolve_async return getaddrinfo-style tuples (family, type, proto, canonname, sockaddr)
+    for TCP and raise socket.gaierror when FQDN cannot be resolved.
+    """
+
+    def resolve(self, fqdn: str, port: str | int) -> list: ...
+
+    async def resolve_async(self, fqdn: str, port: str | int) -> list: ...
+
+
+class SystemResolver:
+    """
+    Resolver backed by socket.getaddrinfo / loop.getaddrinfo (no caching)
+
+    *Notes*:
+
+        Family: AF_UNSPEC (0)
+        Type  : SOCK_STREAM (1)
+        Proto : IPPROTO_TCP (6)
+    """
+
+    def resolve(self, fqdn: str, port: str | int) -> list:
+        return socket.getaddrinfo(fqdn, port, family=0, type=1, proto=6, flags=socket.AI_CANONNAME)
+
+    async def resolve_async(self, fqdn: str, port: str | int) -> list:
+        loop = asyncio.get_running_loop()
+        return await loop.getaddrinfo(fqdn, port, family=0, type=1, proto=6, flags=socket.AI_CANONNAME)
+
+
+class CachingResolver:
+    """
+    Bounded in-process cache in front of another resolver
+
+    *Parameters*:
+
+        maxsize     : maximum number of (fqdn, port) entries, LRU eviction
+        ttl         : seconds to keep a resolved address list
+        negative_ttl: seconds to keep a resolver failure (socket.gaierror)
+        resolver    : resolver to cache (default: SystemResolver)
+
+    *Notes*:
+
+        getaddrinfo does not expose record TTLs, so ttl is an upper bound chosen by the caller.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DNS_CACHE_SIZE,
+        ttl: float = DNS_CACHE_TTL,
+        negative_ttl: float = DNS_CACHE_NEGATIVE_TTL,
+        clock: Callable[[], float] | None = None,
+        resolver: Resolver | None = None,
+    ) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.resolver = SystemResolver() if resolver is None else resolver
+        self._cache = TtlCache(maxsize) if clock is None else TtlCache(maxsize, clock=clock)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
+
+    @property
+    def evictions(self) -> int:
+        return self._cache.evictions
+
+    def resolve(self, fqdn: str, port: str | int) -> list:
+        """
+        Return getaddrinfo result for (fqdn, port); raise socket.gaierror (also from cache)
+        """
+        key = (fqdn.lower(), str(port))
+        entry = self._cached(key)
+        if entry is not _MISSING:
+            return entry
+
+        try:
+            addr_info = self.resolver.resolve(fqdn, port)
+        except socket.gaierror as e:
+            self._cache.set(key, e, self.negative_ttl)
+            raise
+        self._cache.set(key, addr_info, self.ttl)
+        return addr_info
+
+    async def resolve_async(self, fqdn: str, port: str | int) -> list:
+        """
+        Async resolve (same cache as resolve)
+        """
+        key = (fqdn.lower(), str(port))
+        entry = self._cached(key)
+        if entry is not _MISSING:
+            return entry
+
+        try:
+            addr_info = await self.resolver.resolve_async(fqdn, port)
+        except socket.gaierror as e:
+            self._cache.set(key, e, self.negative_ttl)
+            raise
+        self._cache.set(key, addr_info, self.ttl)
+        return addr_info
+
+    def _cached(self, key: tuple[str, str]):
+        entry = self._cache.get(key, _MISSING)
+        if isinstance(entry, socket.gaierror):
+            raise socket.gaierror(*entry.args)
+        return entry
+
+    def clear(self) -> None:
+        """
+        Drop all cached answers and reset counters
+        """
+        self._cache.clear()
+
+
+class StaticResolver:
+    """
+    In-memory resolver driven by a hosts-like mapping, for tests and deterministic benchmarks
+
+    *Parameters*:
+
+        hosts  : FQDN -> IP address or list of IP addresses (FQDN is case-insensitive)
+        latency: seconds to wait on every lookup (time.sleep / asyncio.sleep)
+
+    *Notes*:
+
+        FQDN missing from hosts raises socket.gaierror (EAI_NONAME), like an NXDOMAIN answer.
+    """
+
+    def __init__(self, hosts: Mapping[str, "str | list[str]"], latency: float = 0.0) -> None:
+        self.latency = latency
+        self.hosts = {
+            fqdn.lower().removesuffix("."): [ips] if isinstance(ips, str) else list(ips) for fqdn, ips in hosts.items()
+        }
+
+    def resolve(self, fqdn: str, port: str | int) -> list:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._addr_info(fqdn, port)
+
+    async def resolve_async(self, fqdn: str, port: str | int) -> list:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._addr_info(fqdn, port)
+
+    def _addr_info(self, fqdn: str, port: str | int) -> list:
+        ips = self.hosts.get(fqdn.lower().removesuffix("."))
+        if not ips:
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        addr_info = []
+        for ip in ips:
+            if ipaddress.ip_address(ip).version == 6:
+                addr_info.append((socket.AF_INET6, socket.SOCK_STREAM, 6, "", (ip, int(port), 0, 0)))
+            else:
+                addr_info.append((socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip, int(port))))
+        return addr_info
+
+
+dns_cache = CachingResolver()
@@ -1,4 +1,5 @@
 from functools import wraps
+from inspect import iscoroutinefunction
 from logging import ERROR, basicConfig, getLogger
 
 basicConfig(level=ERROR, format="%(levelname)s: %(message)s (%(filename)s:%(lineno)s)")
@@ -7,18 +8,28 @@ logger = getLogger(__name__)
 
 def raise_on_false(exception_type=ValueError, message="Function returned False"):
     """
-    Raise an exception if the decorated function returns False.
+    Raise an exception if the decorated function (or coroutine function) returns False.
     """
 
+    def check(result, kwargs):
+        if not result:
+            if kwargs.get("enable_log"):
+                logger.error(f"{message}", stacklevel=3)
+            raise exception_type(message)
+        return result
+
     def decorator(func):
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return check(await func(*args, **kwargs), kwargs)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            result = func(*args, **kwargs)
-            if not result:
-                if kwargs.get("enable_log"):
-                    logger.error(f"{message}", stacklevel=2)
-                raise exception_type(message)
-            return result
+            return check(func(*args, **kwargs), kwargs)
 
         return wrapper
 
@@ -0,0 +1,124 @@
+import ipaddress
+import socket
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Iterable
+
+# classification flags (same meaning as the ipaddress is_* properties)
+UNSPECIFIED = 1
+LINK_LOCAL = 2
+LOOPBACK = 4
+RESERVED = 8
+PRIVATE = 16
+
+_PROPERTIES = (
+    (UNSPECIFIED, "is_unspecified"),
+    (LINK_LOCAL, "is_link_local"),
+    (LOOPBACK, "is_loopback"),
+    (RESERVED, "is_reserved"),
+    (PRIVATE, "is_private"),
+)
+_IPV4_MAPPED = 0xFFFF << 32
+
+
+class IpTable:
+    """
+    Sorted integer interval table: starts[i] <= address < starts[i + 1] has flags[i]
+    """
+
+    __slots__ = ("starts", "flags")
+
+    def __init__(self, starts: list[int], flags: list[int]) -> None:
+        self.starts = starts
+        self.flags = flags
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def classify(self, address: int) -> int:
+        return self.flags[bisect_right(self.starts, address) - 1]
+
+
+def _boundaries(constants: type) -> set[int]:
+    """
+    Start and end + 1 of every network / address in an ipaddress constants table
+    """
+    points: set[int] = set()
+    for value in vars(constants).values():
+        for item in value if isinstance(value, (list, tuple)) else (value,):
+            if isinstance(item, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+                points.update((int(item.network_address), int(item.broadcast_address) + 1))
+            elif isinstance(item, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
+                points.update((int(item), int(item) + 1))
+    return points
+
+
+def _compile(version: int, points: set[int]) -> IpTable:
+    """
+    Classify one address per interval with the ipaddress properties and merge equal neighbours
+    """
+    address_class = ipaddress.IPv4Address if version == 4 else ipaddress.IPv6Address
+    upper = 2**32 if version == 4 else 2**128
+    starts: list[int] = []
+    flags: list[int] = []
+    for start in sorted(point for point in points | {0} if point < upper):
+        address = address_class(start)
+        value = 0
+        for flag, name in _PROPERTIES:
+            if getattr(address, name):
+                value |= flag
+        if not flags or flags[-1] != value:
+            starts.append(start)
+            flags.append(value)
+    return IpTable(starts, flags)
+
+
+@lru_cache(maxsize=1)
+def get_ip_tables() -> tuple[IpTable, IpTable]:
+    """
+    Return the (IPv4, IPv6) interval tables (compiled on first use from the stdlib ipaddress tables)
+
+    *Notes*:
+
+        IPv6 boundaries also include ::, ::1 (is_unspecified / is_loopback are not networks in the
+        stdlib tables) and the IPv4 boundaries mapped into ::ffff:0:0/96, so Python versions that
+        classify IPv4-mapped addresses through their IPv4 address get the same answers.
+    """
+    ipv4_points = _boundaries(ipaddress._IPv4Constants)  # type: ignore[attr-defined]
+    ipv6_points = _boundaries(ipaddress._IPv6Constants)  # type: ignore[attr-defined]
+    ipv6_points |= {0, 1, 2, _IPV4_MAPPED, _IPV4_MAPPED + 2**32}
+    ipv6_points |= {_IPV4_MAPPED + point for point in ipv4_points}
+    return _compile(4, ipv4_points), _compile(6, ipv6_points)
+
+
+def classify_ip(address: str | bytes) -> int:
+    """
+    Return the classification flags of an IP address (text, optionally with %scope, or packed bytes)
+
+    *Notes*:
+
+        raises ValueError for an invalid address (same as ipaddress.ip_address).
+    """
+    return _classify(address, *get_ip_tables())
+
+
+def classify_ips(addresses: Iterable[str | bytes]) -> list[int]:
+    """
+    Return the classification flags of many IP addresses (tables looked up once for the batch)
+    """
+    ipv4_table, ipv6_table = get_ip_tables()
+    return [_classify(address, ipv4_table, ipv6_table) for address in addresses]
+
+
+def _classify(address: str | bytes, ipv4_table: IpTable, ipv6_table: IpTable) -> int:
+    if isinstance(address, str):
+        host = address.partition("%")[0]
+        try:
+            address = socket.inet_pton(socket.AF_INET6 if ":" in host else socket.AF_INET, host)
+        except OSError as e:
+            raise ValueError(f"{host!r} does not appear to be an IPv4 or IPv6 address") from e
+    if len(address) == 4:
+        return ipv4_table.classify(int.from_bytes(address, "big"))
+    if len(address) == 16:
+        return ipv6_table.classify(int.from_bytes(address, "big"))
+    raise ValueError(f"packed IP address must be 4 or 16 bytes, not {len(address)}")
@@ -0,0 +1,130 @@
+from functools import lru_cache
+from pathlib import Path
+
+from pkg_19544.configs.constants import PSL_LIST
+
+# trie node markers (never valid DNS labels)
+_RULE = "!rule"
+_EXCEPTION = "!exception"
+
+
+class PublicSuffixList:
+    """
+    Suffix trie of the Public Suffix List (https://publicsuffix.org/list/)
+
+    *Parameters*:
+
+        rules          : lines of a public_suffix_list.dat file
+        include_private: boolean to include the PRIVATE DOMAINS section (e.g. github.io)
+
+    *Notes*:
+
+        rules are stored label by label from the right (com -> example); wildcard (*.ck) and
+        exception (!www.ck) rules are supported. IDN rules are stored in Unicode and in punycode.
+        Lookups walk one dict per label of the FQDN.
+    """
+
+    def __init__(self, rules: "list[str] | tuple[str, ...]", include_private: bool = True) -> None:
+        self._root: dict = {}
+        for line in rules:
+            line = line.strip()
+            if line.startswith("// ===BEGIN PRIVATE DOMAINS===") and not include_private:
+                break
+            if not line or line.startswith("//"):
+                continue
+            self._add_rule(line.split()[0].lower())
+
+    @classmethod
+    def from_file(cls, path: "str | Path" = PSL_LIST, include_private: bool = True) -> "PublicSuffixList":
+        """
+        Load a public_suffix_list.dat file (default: copy vendored in configs/)
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls(f.read().splitlines(), include_private=include_private)
+
+    def _add_rule(self, rule: str) -> None:
+        exception = rule.startswith("!")
+        rule = rule.lstrip("!")
+        for form in {rule, _to_ascii(rule)} - {""}:
+            node = self._root
+            for label in reversed(form.split(".")):
+                node = node.setdefault(label, {})
+            node[_EXCEPTION if exception else _RULE] = True
+
+    def _suffix_length(self, labels: list[str]) -> int:
+        """
+        Number of labels (from the right) in the public suffix; the default rule is "*"
+        """
+        suffix_length = 1
+        node = self._root
+        for depth, label in enumerate(reversed(labels)):
+            child = node.get(label)
+            if child is not None and _EXCEPTION in child:
+                return depth
+            if (child is not None and _RULE in child) or _RULE in node.get("*", ()):
+                suffix_length = depth + 1
+            if child is None:
+                break
+            node = child
+        return suffix_length
+
+    def public_suffix(self, fqdn: str) -> str | None:
+        """
+        Return the public suffix (eTLD) of FQDN, e.g. co.uk for www.example.co.uk
+        """
+        labels = _labels(fqdn)
+        if labels is None:
+            return None
+        suffix_start = len(labels) - self._suffix_length(labels)
+        return ".".join(labels[suffix_start:])
+
+    def registrable_domain(self, fqdn: str) -> str | None:
+        """
+        Return the registrable domain (eTLD+1) of FQDN, e.g. example.co.uk for www.example.co.uk
+
+        None when FQDN is itself a public suffix (or not a valid name).
+        """
+        labels = _labels(fqdn)
+        if labels is None:
+            return None
+        suffix_length = self._suffix_length(labels)
+        if len(labels) <= suffix_length:
+            return None
+        domain_start = len(labels) - suffix_length - 1
+        return ".".join(labels[domain_start:])
+
+
+def _labels(fqdn: str) -> list[str] | None:
+    labels = fqdn.lower().removesuffix(".").split(".")
+    return None if "" in labels else labels
+
+
+def _to_ascii(rule: str) -> str:
+    if rule.isascii():
+        return rule
+    try:
+        return rule.encode("idna").decode("ascii")
+    except UnicodeError:
+        return ""
+
+
+@lru_cache(maxsize=1)
+def get_public_suffix_list() -> PublicSuffixList:
+    """
+    Return the Public Suffix List vendored in configs/ (loaded on first use)
+    """
+    return PublicSuffixList.from_file(PSL_LIST)
+
+
+def public_suffix(fqdn: str) -> str | None:
+    """
+    Return the public suffix (eTLD) of FQDN from the vendored Public Suffix List
+    """
+    return get_public_suffix_list().public_suffix(fqdn)
+
+
+def registrable_domain(fqdn: str) -> str | None:
+    """
+    Return the registrable domain (eTLD+1) of FQDN from the vendored Public Suffix List
+    """
+    return get_public_suffix_list().registrable_domain(fqdn)
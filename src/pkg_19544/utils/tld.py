@@ -1,34 +1,141 @@
+import json
+import os
+from http.client import HTTPException
 from urllib import request
 from urllib.error import HTTPError, URLError
 
-from pkg_19544.configs.constants import TLD_LIST, TLD_LIVE
+from pkg_19544.configs.constants import TIMEOUT_DEFAULT, TLD_LIVE, TLD_SNAPSHOT
+from pkg_19544.utils.tld_snapshot import (
+    SnapshotError,
+    TldSnapshot,
+    replace_file,
+    write_snapshot,
+)
+
+
+class TldRefresh:
+    """
+    Outcome of refresh_tlds
+
+    *Attributes*:
+
+        status        : "updated", "unchanged" (same TLDs, snapshot kept), "not_modified" (HTTP 304) or "failed"
+        added         : TLDs added to the snapshot
+        removed       : TLDs removed from the snapshot
+        source_version: version of the IANA list ("# Version ..." header), 0 when unknown
+    """
+
+    __slots__ = ("status", "added", "removed", "source_version")
+
+    def __init__(
+        self,
+        status: str,
+        added: frozenset[str] = frozenset(),
+        removed: frozenset[str] = frozenset(),
+        source_version: int = 0,
+    ) -> None:
+        self.status = status
+        self.added = added
+        self.removed = removed
+        self.source_version = source_version
+
+    def __bool__(self) -> bool:
+        return self.status != "failed"
+
+    def __repr__(self) -> str:
+        return f"TldRefresh(status={self.status!r}, added={len(self.added)}, removed={len(self.removed)})"
 
 
 def get_tlds() -> bool:
     """
-    Create a list that contains all top-level domains
+    Refresh the binary TLD snapshot from IANA (see refresh_tlds)
+    """
+    return bool(refresh_tlds())
+
+
+def refresh_tlds(url: str = TLD_LIVE, path: str = TLD_SNAPSHOT, timeout: float = TIMEOUT_DEFAULT) -> TldRefresh:
+    """
+    Conditionally download the IANA TLD list and atomically rewrite the snapshot when it changed
+
+    *Parameters*:
+
+        url    : IANA tlds-alpha-by-domain.txt (or a mirror)
+        path   : snapshot file; validators (ETag / Last-Modified) are kept next to it in <path>.meta
+        timeout: HTTP timeout in seconds
+
+    *Notes*:
+
+        sends If-None-Match / If-Modified-Since from the previous run and stops on 304.
+        the snapshot is only rewritten when the set of TLDs changed, through a temp file and
+        os.replace, so readers never see a truncated file. An empty or truncated response is
+        "failed" and leaves the snapshot as it is.
     """
+    validators = _read_validators(path)
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
     try:
-        with request.urlopen(TLD_LIVE) as response:
-            html_bytes = response.read()
-            html_string = html_bytes.decode("utf-8")
-            list_tld = html_string.splitlines()[1:]
-
-            with open(TLD_LIST, "w") as f:
-                tld_key = "TLDS"
-                tld_val = (
-                    str(list_tld)
-                    .replace(" ", "\r\n    ")
-                    .replace("['", "[\r\n    '")
-                    .replace("]", ",\r\n]\r\n")
-                    .replace("'", '"')
-                )
-                f.write(f"{tld_key} = {tld_val}")
-            return True
-
-    except (HTTPError, URLError, TimeoutError, ValueError):
-        return False
+        with request.urlopen(request.Request(url, headers=headers), timeout=timeout) as response:
+            html_string = response.read().decode("utf-8")
+            validators = {"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+    except HTTPError as e:
+        return TldRefresh("not_modified" if e.code == 304 else "failed")
+    except (URLError, HTTPException, TimeoutError, ValueError):
+        # HTTPException: IncompleteRead on a body shorter than its Content-Length
+        return TldRefresh("failed")
+
+    lines = html_string.splitlines()
+    if not lines:
+        return TldRefresh("failed")
+    header, *list_tld = lines
+    source_version = _source_version(header)
+    new_tlds = frozenset(tld.strip().lower() for tld in list_tld) - {""}
+    if not new_tlds:
+        return TldRefresh("failed", source_version=source_version)
+
+    current_tlds = _read_tlds(path)
+    added, removed = new_tlds - current_tlds, current_tlds - new_tlds
+    if added or removed:
+        write_snapshot(new_tlds, path, source_version=source_version)
+    _write_validators(path, validators)
+    return TldRefresh("updated" if added or removed else "unchanged", added, removed, source_version)
+
+
+def _read_tlds(path: str) -> frozenset[str]:
+    try:
+        snapshot = TldSnapshot(path)
+    except (OSError, SnapshotError):
+        return frozenset()
+    try:
+        return frozenset(snapshot)
+    finally:
+        snapshot.close()
+
+
+def _read_validators(path: str) -> dict:
+    try:
+        with open(path + ".meta", encoding="utf-8") as f:
+            validators = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # validators only count while the snapshot they describe is still there
+    return validators if isinstance(validators, dict) and os.path.exists(path) else {}
+
+
+def _write_validators(path: str, validators: dict) -> None:
+    replace_file(path + ".meta", json.dumps(validators, sort_keys=True).encode("utf-8"))
+
+
+def _source_version(header: str) -> int:
+    """
+    Version number of the IANA list, e.g. "# Version 2025100200, Last Updated ..." -> 2025100200
+    """
+    words = header.replace(",", " ").split()
+    return int(words[2]) if len(words) > 2 and words[1] == "Version" and words[2].isdigit() else 0
 
 
 if __name__ == "__main__":
-    get_tlds()
+    print(refresh_tlds())
@@ -0,0 +1,102 @@
+import os
+from functools import lru_cache
+from threading import Lock
+
+from pkg_19544.configs.constants import TLD_LOOKUP_CACHE_SIZE, TLD_SNAPSHOT
+from pkg_19544.utils.tld_snapshot import TldSnapshot
+
+
+class _TldIndex:
+    """
+    One loaded snapshot and an LRU of the labels recently looked up in it (dropped with the index on reload)
+    """
+
+    __slots__ = ("snapshot", "contains", "stat")
+
+    def __init__(self, snapshot: TldSnapshot, stat: tuple[int, int]) -> None:
+        self.snapshot = snapshot
+        self.contains = lru_cache(maxsize=TLD_LOOKUP_CACHE_SIZE)(snapshot.__contains__)
+        self.stat = stat
+
+
+class TldRegistry:
+    """
+    Hot-reloadable TLD lookup backed by the memory-mapped TLD snapshot
+
+    *Parameters*:
+
+        path: snapshot file (default: configs/tlds.bin), opened on first lookup
+
+    *Notes*:
+
+        lookups read the current index through a single attribute load and take no lock;
+        reload() opens and verifies the new snapshot first, then swaps the index in one
+        assignment, so concurrent lookups see either the old or the new TLDs. The answers for
+        the TLD_LOOKUP_CACHE_SIZE most recent labels are kept per index (LRU), so hot TLDs skip
+        the binary search even when most labels looked up are junk.
+    """
+
+    def __init__(self, path: str = TLD_SNAPSHOT) -> None:
+        self.path = path
+        self._index: _TldIndex | None = None
+        self._lock = Lock()
+
+    def __contains__(self, label: str | bytes) -> bool:
+        return (self._index or self._load()).contains(label)
+
+    @property
+    def snapshot(self) -> TldSnapshot:
+        return (self._index or self._load()).snapshot
+
+    def reload(self, path: str | None = None) -> TldSnapshot:
+        """
+        Load a snapshot (default: current path) and swap it in atomically
+
+        *Notes*:
+
+            raises OSError / SnapshotError and keeps serving the current index when the file is
+            missing or invalid. The old snapshot is unmapped once no reader holds it any more.
+        """
+        with self._lock:
+            path = self.path if path is None else path
+            index = _TldIndex(TldSnapshot(path), _file_stat(path))
+            self.path, self._index = path, index
+            return index.snapshot
+
+    def reload_if_modified(self) -> bool:
+        """
+        Reload when the snapshot file was replaced since it was loaded (one stat call)
+        """
+        index = self._index
+        if index is not None and index.stat == _file_stat(self.path):
+            return False
+        self.reload()
+        return True
+
+    def _load(self) -> _TldIndex:
+        with self._lock:
+            if self._index is None:
+                self._index = _TldIndex(TldSnapshot(self.path), _file_stat(self.path))
+            return self._index
+
+
+def _file_stat(path: str) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_mtime_ns
+
+
+tld_registry = TldRegistry()
+
+
+def get_tld_index() -> TldSnapshot:
+    """
+    Return the TLD snapshot currently served by tld_registry
+    """
+    return tld_registry.snapshot
+
+
+def is_tld(label: str) -> bool:
+    """
+    Case-insensitive check that label is a top-level domain (see TldRegistry)
+    """
+    return label in tld_registry
@@ -0,0 +1,156 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from typing import Iterable, Iterator
+
+# file layout (little-endian):
+#   header : magic(4s) format(H) reserved(H) count(I) source_version(Q) sha256(32s)
+#   offsets: (count + 1) x uint32, offsets of the labels below (last one = end of labels)
+#   labels : sorted, lower-case ASCII labels, each one prefixed by its length (uint8)
+# sha256 covers offsets + labels.
+SNAPSHOT_MAGIC = b"TLDS"
+SNAPSHOT_FORMAT = 1
+_HEADER = struct.Struct("<4sHHIQ32s")
+_OFFSET = struct.Struct("<I")
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def build_snapshot(labels: Iterable[str], source_version: int = 0) -> bytes:
+    """
+    Serialize labels into a TLD snapshot (see file layout above)
+    """
+    encoded = sorted({label.strip().lower().encode("ascii") for label in labels} - {b""})
+    offsets, body, position = [], bytearray(), 0
+    for label in encoded:
+        if len(label) > 255:
+            raise SnapshotError(f"label too long: {label[:16]!r}...")
+        offsets.append(position)
+        body += bytes((len(label),)) + label
+        position += 1 + len(label)
+    offsets.append(position)
+
+    payload = b"".join(_OFFSET.pack(offset) for offset in offsets) + bytes(body)
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, 0, len(encoded), source_version, hashlib.sha256(payload).digest())
+    return header + payload
+
+
+def write_snapshot(labels: Iterable[str], path: str, source_version: int = 0) -> None:
+    """
+    Write a TLD snapshot file (atomically, see replace_file)
+    """
+    replace_file(path, build_snapshot(labels, source_version=source_version))
+
+
+def replace_file(path: str, data: bytes) -> None:
+    """
+    Write data to a temp file in the same directory, fsync it, then os.replace it over path
+
+    *Notes*:
+
+        readers see either the old or the new file, never a truncated one; processes that
+        already mapped the old snapshot keep reading it until they reopen the path.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix="-" + os.path.basename(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class TldSnapshot:
+    """
+    Read-only, memory-mapped TLD snapshot with binary-search lookup
+
+    *Parameters*:
+
+        path: snapshot file (written by write_snapshot / utils/tld.py:get_tlds)
+
+    *Notes*:
+
+        the file is mapped read-only, so every process using the same snapshot shares one
+        page-cached copy. Magic, format and checksum are verified once when the file is opened.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise SnapshotError(f"empty TLD snapshot: {path}") from e
+
+        if len(self._mm) < _HEADER.size:
+            raise SnapshotError(f"truncated TLD snapshot: {path}")
+        magic, snapshot_format, _, count, source_version, checksum = _HEADER.unpack_from(self._mm, 0)
+        if magic != SNAPSHOT_MAGIC or snapshot_format != SNAPSHOT_FORMAT:
+            raise SnapshotError(f"unsupported TLD snapshot: {path}")
+        header_size = _HEADER.size
+        if hashlib.sha256(self._mm[header_size:]).digest() != checksum:
+            raise SnapshotError(f"TLD snapshot checksum mismatch: {path}")
+
+        self.count = count
+        self.source_version = source_version
+        self._labels = labels = header_size + (count + 1) * _OFFSET.size
+        # offsets are read in place on little-endian hosts (copied and byte-swapped elsewhere)
+        self._offsets: "memoryview | list[int]"
+        with memoryview(self._mm) as view:
+            if sys.byteorder == "little":
+                self._offsets = view[header_size:labels].cast("I")
+            else:  # pragma: no cover
+                self._offsets = [offset for (offset,) in _OFFSET.iter_unpack(view[header_size:labels])]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self.count):
+            yield self._label(index).decode("ascii")
+
+    def __contains__(self, label: object) -> bool:
+        if isinstance(label, str):
+            try:
+                label = label.lower().encode("ascii")
+            except UnicodeEncodeError:
+                return False
+        elif isinstance(label, (bytes, bytearray, memoryview)):
+            label = bytes(label).lower()
+        else:
+            return False
+
+        mm, offsets, labels = self._mm, self._offsets, self._labels
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            start = labels + offsets[middle] + 1
+            end = start + mm[start - 1]
+            probe = mm[start:end]
+            if probe < label:
+                low = middle + 1
+            elif probe > label:
+                high = middle
+            else:
+                return True
+        return False
+
+    def _label(self, index: int) -> bytes:
+        start = self._labels + self._offsets[index] + 1
+        end = start + self._mm[start - 1]
+        return self._mm[start:end]
+
+    def close(self) -> None:
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._mm.close()
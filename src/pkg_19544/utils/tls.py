@@ -0,0 +1,218 @@
+import ssl
+import time
+from functools import lru_cache
+from typing import Callable, Hashable
+
+from pkg_19544.configs.constants import (
+    TLS_CACHE_NEGATIVE_TTL,
+    TLS_CACHE_SIZE,
+    TLS_CACHE_TTL,
+    TLS_SESSION_CACHE_SIZE,
+    TLS_SESSION_TTL,
+)
+from pkg_19544.utils.cache import TtlCache
+
+# CA source used when a caller does not pass its own (None, None = system default CA bundle)
+_default_ca: tuple[str | None, str | None] = (None, None)
+
+
+def get_ssl_context(
+    allow_tlsv12: bool = False,
+    minimum_version: ssl.TLSVersion = ssl.TLSVersion.TLSv1_2,
+    cafile: str | None = None,
+    capath: str | None = None,
+) -> ssl.SSLContext:
+    """
+    Return the shared client SSLContext for a TLS policy
+
+    *Parameters*:
+
+        allow_tlsv12   : boolean to use TLSv1.2 in HTTPS protocol
+        minimum_version: minimum TLS version accepted in the handshake
+        cafile         : CA bundle file (default: configured/system CA)
+        capath         : CA certificate directory (default: configured/system CA)
+
+    *Notes*:
+
+        contexts are built once per (minimum_version, allow_tlsv12, CA source) and reused
+        across calls and threads, so the CA bundle is loaded only once.
+    """
+    if cafile is None and capath is None:
+        cafile, capath = _default_ca
+    return _create_ssl_context(minimum_version, bool(allow_tlsv12), cafile, capath)
+
+
+def set_default_ca(cafile: str | None = None, capath: str | None = None) -> None:
+    """
+    Set CA file / directory for contexts that do not name their own CA source
+    """
+    global _default_ca
+    _default_ca = (cafile, capath)
+    for allow_tlsv12 in (False, True):
+        get_ssl_context(allow_tlsv12)
+
+
+@lru_cache(maxsize=None)
+def _create_ssl_context(
+    minimum_version: ssl.TLSVersion,
+    allow_tlsv12: bool,
+    cafile: str | None,
+    capath: str | None,
+) -> ssl.SSLContext:
+    ssl_context = ssl.create_default_context(cafile=cafile, capath=capath)
+    ssl_context.minimum_version = minimum_version
+    return ssl_context
+
+
+class TlsVerdictCache:
+    """
+    Bounded cache of TLS verdicts per (scheme, fqdn, port, TLS policy)
+
+    *Parameters*:
+
+        maxsize     : maximum number of entries, LRU eviction (0 disables caching)
+        ttl         : maximum seconds to keep a passing verdict
+        negative_ttl: seconds to keep a failing verdict
+        clock       : monotonic clock in seconds (entry expiry)
+        wall_clock  : wall clock in seconds since the epoch (certificate notAfter)
+
+    *Notes*:
+
+        a passing verdict never outlives the peer certificate: its TTL is min(ttl, notAfter - now).
+        A passing verdict without a certificate notAfter is not cached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = TLS_CACHE_SIZE,
+        ttl: float = TLS_CACHE_TTL,
+        negative_ttl: float = TLS_CACHE_NEGATIVE_TTL,
+        clock: Callable[[], float] | None = None,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._wall_clock = wall_clock
+        self._cache = TtlCache(maxsize) if clock is None else TtlCache(maxsize, clock=clock)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
+
+    @property
+    def evictions(self) -> int:
+        return self._cache.evictions
+
+    @property
+    def hit_rate(self) -> float:
+        return self._cache.hit_rate
+
+    def get(self, key: Hashable) -> bool | None:
+        """
+        Return the cached verdict for key (None when missing or expired)
+        """
+        return self._cache.get(key)
+
+    def set(self, key: Hashable, verdict: bool, cert: dict | None = None) -> None:
+        """
+        Cache a verdict; cert is the peer certificate (SSLSocket.getpeercert) of a passing verdict
+        """
+        if not verdict:
+            self._cache.set(key, False, self.negative_ttl)
+            return
+
+        not_after = (cert or {}).get("notAfter")
+        if not not_after:
+            return
+        try:
+            expires_in = ssl.cert_time_to_seconds(not_after) - self._wall_clock()
+        except ValueError:
+            return
+        self._cache.set(key, True, min(self.ttl, expires_in))
+
+    def clear(self) -> None:
+        """
+        Drop all cached verdicts and reset counters
+        """
+        self._cache.clear()
+
+
+class TlsSessionStore:
+    """
+    Bounded store of TLS sessions per (fqdn, port, SSLContext) for session resumption
+
+    *Parameters*:
+
+        maxsize   : maximum number of sessions, LRU eviction (0 disables resumption)
+        ttl       : maximum seconds to keep a session
+        clock     : monotonic clock in seconds (entry expiry)
+        wall_clock: wall clock in seconds since the epoch (SSLSession.time)
+
+    *Notes*:
+
+        a session is kept for min(ttl, remaining session lifetime announced by the server) and
+        only offered again with the SSLContext that created it (SSLContext.wrap_socket(session=...)).
+        Sessions without a ticket or session id cannot be resumed and are not stored.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = TLS_SESSION_CACHE_SIZE,
+        ttl: float = TLS_SESSION_TTL,
+        clock: Callable[[], float] | None = None,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl = ttl
+        self._wall_clock = wall_clock
+        self._cache = TtlCache(maxsize) if clock is None else TtlCache(maxsize, clock=clock)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
+
+    @property
+    def evictions(self) -> int:
+        return self._cache.evictions
+
+    @property
+    def hit_rate(self) -> float:
+        return self._cache.hit_rate
+
+    def get(self, fqdn: str, port: int, ssl_context: ssl.SSLContext) -> ssl.SSLSession | None:
+        """
+        Return the stored session for (fqdn, port, ssl_context), None when missing or expired
+        """
+        return self._cache.get((fqdn.lower(), port, ssl_context))
+
+    def set(self, fqdn: str, port: int, ssl_context: ssl.SSLContext, session: ssl.SSLSession | None) -> None:
+        """
+        Store the session of an established connection (SSLSocket.session)
+        """
+        if not isinstance(session, ssl.SSLSession) or not (session.has_ticket or session.id):
+            return
+        remaining = session.time + session.timeout - self._wall_clock()
+        self._cache.set((fqdn.lower(), port, ssl_context), session, min(self.ttl, remaining))
+
+    def clear(self) -> None:
+        """
+        Drop all stored sessions and reset counters
+        """
+        self._cache.clear()
+
+
+tls_cache = TlsVerdictCache()
+tls_sessions = TlsSessionStore()
@@ -1,3 +1,4 @@
+import re
 from typing import Tuple
 from urllib.parse import urlparse
 
@@ -9,34 +10,174 @@ from urllib.parse import urlparse
 #                                |                                         |
 #                         authority (netloc)                        pre-parsed path
 
+# single-pass pattern for the common URL shape; anything it does not accept
+# (control chars/spaces, params, brackets, upper-case scheme) goes through urlparse.
+_SIMPLE_URL = re.compile(r"([a-z][a-z0-9+.\-]*)://([^/?#\x00-\x20\[\]]*)(/[^?#\x00-\x20;]*)?([?#][^\x00-\x20]*)?")
+# same pattern over bytes (scheme optional: parse_url fills in http:// when "://" is missing); spaces are
+# also accepted in path / query / fragment, where urlparse keeps them as they are (e.g. /a b from logs)
+_SIMPLE_URL_BYTES = re.compile(
+    rb"(?:([a-z][a-z0-9+.\-]*)://)?([^/?#\x00-\x20\[\]]*)(/[^?#\x00-\x1f;]*)?([?#][^\x00-\x1f]*)?"
+)
+_SCHEME_SEPARATOR_BYTES = re.compile(rb"://")
+# UTF-8 of the non-ASCII characters that str.strip() removes (str.isspace)
+_UNICODE_SPACES = "\x85\xa0\u1680" + "".join(map(chr, range(0x2000, 0x200B))) + "\u2028\u2029\u202f\u205f\u3000"
+UNICODE_SPACES_BYTES = tuple(char.encode("utf-8") for char in _UNICODE_SPACES)
 
-def get_url_components(user_url: str) -> Tuple[str, str, str, str, str, str]:
+
+class ParsedURL:
     """
-    Parse user-supplied URL
+    Components of a user-supplied URL
+    """
+
+    __slots__ = ("url", "scheme", "userinfo", "authority", "fqdn", "port", "pre_parsed_path")
+
+    def __init__(
+        self,
+        url: str,
+        scheme: str,
+        userinfo: str,
+        authority: str,
+        fqdn: str,
+        port: str,
+        pre_parsed_path: str,
+    ) -> None:
+        self.url = url
+        self.scheme = scheme
+        self.userinfo = userinfo
+        self.authority = authority
+        self.fqdn = fqdn
+        self.port = port
+        self.pre_parsed_path = pre_parsed_path
+
+    def __iter__(self):
+        return iter((self.scheme, self.userinfo, self.authority, self.fqdn, self.port, self.pre_parsed_path))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ParsedURL):
+            return NotImplemented
+        return self.url == other.url and tuple(self) == tuple(other)
+
+    def __hash__(self) -> int:
+        return hash((self.url, *self))
+
+    def __repr__(self) -> str:
+        return f"ParsedURL(url={self.url!r}, scheme={self.scheme!r}, authority={self.authority!r}, port={self.port!r})"
+
+
+def parse_url(user_url: str) -> ParsedURL:
+    """
+    Parse user-supplied URL in a single scan
+    """
+    # when scheme is missing in user_url, fill in a temp scheme prefix (same as get_url_components).
+    url = user_url if "://" in user_url else "http://" + user_url.strip()
+
+    match = _SIMPLE_URL.fullmatch(url)
+    if match is None:
+        return _parse_url_fallback(user_url, url)
+
+    scheme, netloc, path, tail = match.group(1, 2, 3, 4)
+    if not netloc.isascii():
+        return _parse_url_fallback(user_url, url)
+
+    pre_parsed_path = (path or "") + (tail or "")
+    if tail:
+        # urlparse drops an empty query ("?") or fragment ("#") marker; leave those to the fallback
+        query, hash_mark, fragment = tail.partition("#")
+        if query == "?" or (hash_mark and not fragment):
+            return _parse_url_fallback(user_url, url)
+
+    at = netloc.find("@")
+    userinfo = netloc[:at] if at > 0 else ""
+    authority = netloc.partition("@")[2] if at > 0 else netloc
+    fqdn, colon, port = authority.partition(":")
+    port = port.split(":", maxsplit=1)[0] if colon else "443" if scheme == "https" else "80"
+
+    return ParsedURL(user_url, scheme, userinfo, authority, fqdn, port, pre_parsed_path)
+
+
+def _split_url_bytes(
+    buffer: "bytes | bytearray | memoryview", pos: int = 0, endpos: int | None = None
+) -> tuple[bytes, bytes, bytes, bytes, bytes, bytes] | None:
+    """
+    Split buffer[pos:endpos] into (scheme, userinfo, authority, fqdn, port, pre_parsed_path) bytes
+
+    *Notes*:
+
+        same components as parse_url for its single-pass shape (plus spaces in path / query /
+        fragment, split as urlparse does); the regex runs over the buffer
+        in place (no copy of a memoryview), only the components are copied. Returns None when
+        parse_url would need its urlparse fallback (decode and use parse_url then).
+    """
+    endpos = len(buffer) if endpos is None else endpos
+    match = _SIMPLE_URL_BYTES.fullmatch(buffer, pos, endpos)
+    if match is None:
+        return None
+
+    scheme, netloc, path, tail = match.group(1, 2, 3, 4)
+    if scheme is None:
+        # no scheme: parse_url strips (Unicode) whitespace before filling in http://
+        if (
+            _SCHEME_SEPARATOR_BYTES.search(buffer, pos, endpos)
+            or (endpos > pos and buffer[endpos - 1] == 0x20)
+            or _has_unicode_space_end(buffer, pos, endpos)
+        ):
+            return None
+        scheme = b"http"
+    if not netloc.isascii():
+        return None
+
+    pre_parsed_path = (path or b"") + (tail or b"")
+    if tail:
+        query, hash_mark, fragment = tail.partition(b"#")
+        if query == b"?" or (hash_mark and not fragment):
+            return None
+
+    at = netloc.find(b"@")
+    userinfo = netloc[:at] if at > 0 else b""
+    authority = netloc.partition(b"@")[2] if at > 0 else netloc
+    fqdn, colon, port = authority.partition(b":")
+    port = port.split(b":", maxsplit=1)[0] if colon else b"443" if scheme == b"https" else b"80"
+
+    return scheme, userinfo, authority, fqdn, port, pre_parsed_path
+
+
+def _has_unicode_space_end(buffer: "bytes | bytearray | memoryview", pos: int, endpos: int) -> bool:
+    if endpos <= pos or buffer[endpos - 1] < 0x80:
+        return False
+    start = max(pos, endpos - 3)
+    return bytes(buffer[start:endpos]).endswith(UNICODE_SPACES_BYTES)
+
+
+def _parse_url_fallback(user_url: str, url: str) -> ParsedURL:
     """
-    # when scheme is missing in user_url, urllib.parse may have issues to parse URL;
-    # fill in a temp scheme prefix to facilitate URL parsing.
-    default_scheme_prefix = "http://"
-    if "://" not in user_url:
-        user_url = default_scheme_prefix + user_url.strip()
-    scheme = urlparse(user_url).scheme
+    Parse URL through urllib.parse (for URLs outside of the single-pass pattern)
+    """
+    parsed = urlparse(url)
+    scheme = parsed.scheme
 
     # extract URL components to build pre-parsed path
     # to get authority properly and for sanitize_url
-    path = f"{urlparse(user_url).path}" if urlparse(user_url).path else ""
-    query = f"?{urlparse(user_url).query}" if urlparse(user_url).query else ""
-    fragment = f"#{urlparse(user_url).fragment}" if urlparse(user_url).fragment else ""
+    path = f"{parsed.path}" if parsed.path else ""
+    query = f"?{parsed.query}" if parsed.query else ""
+    fragment = f"#{parsed.fragment}" if parsed.fragment else ""
     pre_parsed_path = path + query + fragment
     if pre_parsed_path:
-        user_url = user_url.rsplit(pre_parsed_path, maxsplit=1)[0]
+        url = url.rsplit(pre_parsed_path, maxsplit=1)[0]
 
     # after stripping off the front (scheme) and back (pre_parsed_path) of the
     # user-supplied URL, time to get on userinfo, authority, fqdn, and port.
-    authority = urlparse(user_url).netloc
+    authority = urlparse(url).netloc
     userinfo = authority.split("@")[0] if "@" in authority else ""
-    authority = user_url.replace(f"{scheme}://", "")
+    authority = url.replace(f"{scheme}://", "")
     authority = authority.split(f"{userinfo}@", maxsplit=1)[1] if userinfo else authority
     fqdn = authority.split(":")[0]
     port = authority.split(":")[1] if ":" in authority else "443" if scheme == "https" else "80"
 
-    return (scheme, userinfo, authority, fqdn, port, pre_parsed_path)
+    return ParsedURL(user_url, scheme, userinfo, authority, fqdn, port, pre_parsed_path)
+
+
+def get_url_components(user_url: str) -> Tuple[str, str, str, str, str, str]:
+    """
+    Parse user-supplied URL
+    """
+    return tuple(parse_url(user_url))  # type: ignore[return-value]
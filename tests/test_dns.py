@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+
+"""
+Purpose: tests
+"""
+
+import asyncio
+import socket
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from pkg_19544.utils.cache import TtlCache
+from pkg_19544.utils.dns import (
+    CachingResolver,
+    StaticResolver,
+    SystemResolver,
+)
+
+ADDR_INFO = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.215.14", 443))]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTtlCache(unittest.TestCase):
+    def test_ttl_cache_expiry(self):
+        clock = FakeClock()
+        cache = TtlCache(maxsize=4, clock=clock)
+        cache.set("key", "value", ttl=10)
+        self.assertEqual(cache.get("key"), "value")
+        clock.now += 11
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(len(cache), 0)
+
+    def test_ttl_cache_lru_eviction(self):
+        cache = TtlCache(maxsize=2)
+        cache.set("a", 1, ttl=10)
+        cache.set("b", 2, ttl=10)
+        cache.get("a")
+        cache.set("c", 3, ttl=10)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_ttl_cache_no_store(self):
+        cache = TtlCache(maxsize=2)
+        cache.set("a", 1, ttl=0)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hit_rate, 0.0)
+
+
+class TestCachingResolver(unittest.TestCase):
+    @patch("socket.getaddrinfo")
+    def test_dns_cache_positive(self, mock_getaddrinfo):
+        mock_getaddrinfo.return_value = ADDR_INFO
+        dns_cache = CachingResolver(maxsize=8, ttl=60)
+        self.assertEqual(dns_cache.resolve("example.com", "443"), ADDR_INFO)
+        self.assertEqual(dns_cache.resolve("EXAMPLE.com", 443), ADDR_INFO)
+        self.assertEqual(mock_getaddrinfo.call_count, 1)
+        self.assertEqual((dns_cache.hits, dns_cache.misses), (1, 1))
+
+    @patch("socket.getaddrinfo")
+    def test_dns_cache_negative(self, mock_getaddrinfo):
+        clock = FakeClock()
+        mock_getaddrinfo.side_effect = socket.gaierror(-2, "Name or service not known")
+        dns_cache = CachingResolver(maxsize=8, ttl=60, negative_ttl=5, clock=clock)
+        for _ in range(3):
+            with self.assertRaises(socket.gaierror):
+                dns_cache.resolve("invalid.host.example.site", "443")
+        self.assertEqual(mock_getaddrinfo.call_count, 1)
+
+        clock.now += 6
+        with self.assertRaises(socket.gaierror):
+            dns_cache.resolve("invalid.host.example.site", "443")
+        self.assertEqual(mock_getaddrinfo.call_count, 2)
+
+    @patch("socket.getaddrinfo")
+    def test_dns_cache_eviction_and_clear(self, mock_getaddrinfo):
+        mock_getaddrinfo.return_value = ADDR_INFO
+        dns_cache = CachingResolver(maxsize=2)
+        for fqdn in ("a.example.com", "b.example.com", "c.example.com"):
+            dns_cache.resolve(fqdn, "443")
+        self.assertEqual(dns_cache.evictions, 1)
+        self.assertEqual(len(dns_cache), 2)
+
+        dns_cache.clear()
+        self.assertEqual(len(dns_cache), 0)
+        self.assertEqual((dns_cache.hits, dns_cache.misses, dns_cache.evictions), (0, 0, 0))
+
+
+class TestCachingResolverAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_dns_cache_resolve_async_shares_cache(self):
+        dns_cache = CachingResolver(maxsize=8, ttl=60)
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "getaddrinfo", AsyncMock(return_value=ADDR_INFO)) as mock_getaddrinfo:
+            self.assertEqual(await dns_cache.resolve_async("example.com", "443"), ADDR_INFO)
+            self.assertEqual(await dns_cache.resolve_async("EXAMPLE.com", 443), ADDR_INFO)
+            self.assertEqual(dns_cache.resolve("example.com", "443"), ADDR_INFO)
+            self.assertEqual(mock_getaddrinfo.await_count, 1)
+
+    async def test_dns_cache_resolve_async_negative(self):
+        dns_cache = CachingResolver(maxsize=8, ttl=60, negative_ttl=5)
+        loop = asyncio.get_running_loop()
+        error = socket.gaierror(-2, "Name or service not known")
+        with patch.object(loop, "getaddrinfo", AsyncMock(side_effect=error)) as mock_getaddrinfo:
+            for _ in range(2):
+                with self.assertRaises(socket.gaierror):
+                    await dns_cache.resolve_async("invalid.host.example.site", "443")
+            self.assertEqual(mock_getaddrinfo.await_count, 1)
+
+
+class TestResolvers(unittest.TestCase):
+    def test_static_resolver(self):
+        resolver = StaticResolver({"Example.com": "93.184.215.14", "v6.example.com": ["2606:2800:21f:cb07::1", "10.0.0.1"]})
+        self.assertEqual(resolver.resolve("EXAMPLE.COM.", "443"), ADDR_INFO)
+        self.assertEqual(
+            resolver.resolve("v6.example.com", 8443),
+            [
+                (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("2606:2800:21f:cb07::1", 8443, 0, 0)),
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 8443)),
+            ],
+        )
+        with self.assertRaises(socket.gaierror):
+            resolver.resolve("missing.example.com", "443")
+
+    @patch("pkg_19544.utils.dns.time.sleep")
+    def test_static_resolver_latency(self, mock_sleep):
+        StaticResolver({"example.com": "93.184.215.14"}, latency=0.25).resolve("example.com", 443)
+        mock_sleep.assert_called_once_with(0.25)
+
+    @patch("socket.getaddrinfo")
+    def test_system_resolver(self, mock_getaddrinfo):
+        mock_getaddrinfo.return_value = ADDR_INFO
+        self.assertEqual(SystemResolver().resolve("example.com", "443"), ADDR_INFO)
+        self.assertEqual(SystemResolver().resolve("example.com", "443"), ADDR_INFO)
+        self.assertEqual(mock_getaddrinfo.call_count, 2)
+
+    def test_caching_resolver_wraps_resolver(self):
+        static = StaticResolver({"example.com": "93.184.215.14"})
+        resolver = CachingResolver(maxsize=8, resolver=static)
+        with patch.object(static, "resolve", wraps=static.resolve) as mock_resolve:
+            for _ in range(3):
+                self.assertEqual(resolver.resolve("example.com", "443"), ADDR_INFO)
+                with self.assertRaises(socket.gaierror):
+                    resolver.resolve("missing.example.com", "443")
+            self.assertEqual(mock_resolve.call_count, 2)
+
+
+class TestResolversAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_static_resolver_async_latency(self):
+        resolver = StaticResolver({"example.com": "93.184.215.14"}, latency=0.05)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await asyncio.gather(*(resolver.resolve_async("example.com", "443") for _ in range(20)))
+        self.assertEqual(results, [ADDR_INFO] * 20)
+        self.assertLess(loop.time() - start, 0.5)
+
+    async def test_caching_resolver_async(self):
+        resolver = CachingResolver(resolver=StaticResolver({"example.com": "93.184.215.14"}))
+        self.assertEqual(await resolver.resolve_async("example.com", 443), ADDR_INFO)
+        self.assertEqual(resolver.resolve("example.com", 443), ADDR_INFO)
+        self.assertEqual((resolver.hits, resolver.misses), (1, 1))
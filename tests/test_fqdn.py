@@ -12,10 +12,15 @@ from pkg_19544.helpers.evaluate import (
     _has_valid_fqdn_network,
     _is_fqdn_resolvable,
     _is_fqdn_resolved_ip_allowed,
+    _resolve_fqdn,
 )
+from pkg_19544.utils.dns import dns_cache
 
 
 class TestEvaluateUrlNetwork(unittest.TestCase):
+    def setUp(self):
+        dns_cache.clear()
+
     def test_has_valid_fqdn_network_true(self):
         fqdn = "example.com"
         port = "443"
@@ -123,3 +128,26 @@ class TestEvaluateUrlNetwork(unittest.TestCase):
             mock_getaddrinfo.side_effect = socket.gaierror("Unknown host")
             with self.assertRaises(ValueError):
                 return _is_fqdn_resolved_ip_allowed(fqdn, port)
+
+    @patch("socket.getaddrinfo")
+    def test_has_valid_fqdn_network_resolve_once(self, mock_getaddrinfo):
+        fqdn = "example.com"
+        port = "443"
+        mock_getaddrinfo.return_value = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.215.14", 443))]
+        self.assertTrue(_has_valid_fqdn_network(fqdn, port))
+        self.assertEqual(mock_getaddrinfo.call_count, 1)
+
+    @patch("socket.getaddrinfo")
+    def test_is_fqdn_resolved_ip_allowed_addr_info(self, mock_getaddrinfo):
+        fqdn = "example.com"
+        port = "443"
+        addr_info = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.30.10.30", 443))]
+        self.assertTrue(_is_fqdn_resolvable(fqdn, port, addr_info=addr_info))
+        with self.assertRaises(ValueError):
+            _is_fqdn_resolved_ip_allowed(fqdn, port, addr_info=addr_info)
+        mock_getaddrinfo.assert_not_called()
+
+    @patch("socket.getaddrinfo")
+    def test_resolve_fqdn_gaierror(self, mock_getaddrinfo):
+        mock_getaddrinfo.side_effect = socket.gaierror("Unknown host")
+        self.assertEqual(_resolve_fqdn("example.com", "443"), [])
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+"""
+Purpose: tests
+"""
+
+import ipaddress
+import random
+import unittest
+
+from pkg_19544.utils.ip import (
+    LINK_LOCAL,
+    LOOPBACK,
+    PRIVATE,
+    RESERVED,
+    UNSPECIFIED,
+    classify_ip,
+    classify_ips,
+    get_ip_tables,
+)
+
+PROPERTIES = (
+    (UNSPECIFIED, "is_unspecified"),
+    (LINK_LOCAL, "is_link_local"),
+    (LOOPBACK, "is_loopback"),
+    (RESERVED, "is_reserved"),
+    (PRIVATE, "is_private"),
+)
+
+# IPv6 prefixes with special-purpose ranges (sampled more densely than the full address space)
+IPV6_PREFIXES = [0x0000, 0x0064, 0x0100, 0x2001, 0x2002, 0x3FFF, 0x5F00, 0xFC00, 0xFE80, 0xFEC0, 0xFF00]
+
+
+def _reference_flags(ip_addr):
+    return sum(flag for flag, name in PROPERTIES if getattr(ip_addr, name))
+
+
+class TestIpClassifier(unittest.TestCase):
+    def _assert_same(self, ip_addrs):
+        ip_addrs = list(ip_addrs)
+        expected = [_reference_flags(ip_addr) for ip_addr in ip_addrs]
+        self.assertEqual(classify_ips(str(ip_addr) for ip_addr in ip_addrs), expected)
+        self.assertEqual(classify_ips(ip_addr.packed for ip_addr in ip_addrs), expected)
+
+    def test_classify_ip_examples(self):
+        self.assertEqual(classify_ip("0.0.0.0"), UNSPECIFIED | PRIVATE)
+        self.assertEqual(classify_ip("127.0.0.1"), LOOPBACK | PRIVATE)
+        self.assertEqual(classify_ip("10.1.2.3"), PRIVATE)
+        self.assertEqual(classify_ip("169.254.1.1"), LINK_LOCAL | PRIVATE)
+        self.assertEqual(classify_ip("8.8.8.8"), 0)
+        self.assertEqual(classify_ip("::1"), _reference_flags(ipaddress.ip_address("::1")))
+        self.assertTrue(classify_ip("::1") & LOOPBACK)
+        self.assertEqual(classify_ip("fe80::1%eth0"), classify_ip("fe80::1"))
+        self.assertEqual(classify_ip("2607:f8b0:4004:c07::64"), 0)
+
+    def test_classify_ip_invalid(self):
+        for address in ["", "256.0.0.1", "1.2.3", "::g", "example.com", b"\x00" * 5]:
+            with self.subTest(address=address):
+                with self.assertRaises(ValueError):
+                    classify_ip(address)
+
+    def test_classify_ip_boundaries_identical(self):
+        ipv4_table, ipv6_table = get_ip_tables()
+        for address_class, table in ((ipaddress.IPv4Address, ipv4_table), (ipaddress.IPv6Address, ipv6_table)):
+            points = {point + delta for point in table.starts for delta in (-1, 0, 1)}
+            self._assert_same(address_class(point) for point in points if 0 <= point <= address_class._ALL_ONES)
+
+    def test_classify_ip_randomized_identical(self):
+        rand = random.Random(19544)
+        self._assert_same(ipaddress.IPv4Address(rand.getrandbits(32)) for _ in range(50000))
+        self._assert_same(ipaddress.IPv6Address(rand.getrandbits(128)) for _ in range(20000))
+        self._assert_same(ipaddress.IPv6Address((0xFFFF << 32) | rand.getrandbits(32)) for _ in range(20000))
+        self._assert_same(
+            ipaddress.IPv6Address((rand.choice(IPV6_PREFIXES) << 112) | rand.getrandbits(rand.choice([16, 64, 112])))
+            for _ in range(20000)
+        )
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+"""
+Purpose: tests
+"""
+
+import dataclasses
+import os
+import ssl
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from pkg_19544.clean_url import evaluate_url
+from pkg_19544.configs.constants import WHITELIST_TLS_VERSION
+from pkg_19544.helpers.evaluate import _has_weak_protocol
+from pkg_19544.policy import Policy, configure_ca, get_policy
+from pkg_19544.utils.tls import get_ssl_context
+
+CAFILE = ssl.get_default_verify_paths().openssl_cafile
+
+
+class TestPolicy(unittest.TestCase):
+    def test_policy_defaults(self):
+        policy = Policy()
+        assert isinstance(policy.ssl_context, ssl.SSLContext)
+        assert policy.ssl_context.minimum_version == ssl.TLSVersion.TLSv1_2
+
+    def test_policy_allow_options(self):
+        policy = Policy(allow_http=True, allow_tlsv12=True, skip_tls=True)
+        assert policy.ssl_context is None
+
+    def test_policy_frozen(self):
+        policy = Policy()
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            policy.allow_http = True
+
+    def test_policy_hashable(self):
+        assert Policy(allow_http=True) == Policy(allow_http=True)
+        assert hash(Policy(allow_http=True)) == hash(Policy(allow_http=True))
+        assert Policy(allow_http=True) != Policy()
+        assert len({Policy(), Policy(), Policy(skip_tls=True)}) == 2
+
+    def test_get_policy_cached(self):
+        assert get_policy(allow_http=True) is get_policy(allow_http=True)
+        assert get_policy(allow_http=True).ssl_context is get_policy(allow_http=True).ssl_context
+
+    def test_has_weak_protocol_keeps_whitelist(self):
+        self.assertTrue(_has_weak_protocol("TLSv1.2", allow_tlsv12=True))
+        assert WHITELIST_TLS_VERSION == ["TLSv1.3"]
+        with self.assertRaises(ValueError):
+            _has_weak_protocol("TLSv1.2")
+
+    def test_evaluate_url_policy(self):
+        user_url = "http://localhost"
+        self.assertFalse(evaluate_url(user_url, policy=Policy()))
+        self.assertFalse(evaluate_url(user_url, allow_http=True, policy=Policy(allow_http=False, skip_tls=True)))
+
+
+class TestSslContext(unittest.TestCase):
+    def test_get_ssl_context_reused(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            contexts = list(executor.map(lambda _: get_ssl_context(), range(8)))
+        assert all(ssl_context is contexts[0] for ssl_context in contexts)
+        assert get_ssl_context(allow_tlsv12=True) is not get_ssl_context()
+        assert Policy().ssl_context is get_ssl_context()
+
+    def test_get_ssl_context_minimum_version(self):
+        ssl_context = get_ssl_context(minimum_version=ssl.TLSVersion.TLSv1_3)
+        assert ssl_context.minimum_version == ssl.TLSVersion.TLSv1_3
+        assert ssl_context is get_ssl_context(minimum_version=ssl.TLSVersion.TLSv1_3)
+
+    @unittest.skipUnless(os.path.isfile(CAFILE), "no CA bundle file")
+    def test_policy_cafile(self):
+        policy = Policy(cafile=CAFILE)
+        assert policy.ssl_context is get_ssl_context(cafile=CAFILE)
+        assert policy.ssl_context is not get_ssl_context()
+        assert policy == Policy(cafile=CAFILE) != Policy()
+
+    @unittest.skipUnless(os.path.isfile(CAFILE), "no CA bundle file")
+    def test_configure_ca(self):
+        try:
+            with patch("ssl.create_default_context", wraps=ssl.create_default_context) as mock_create:
+                configure_ca(cafile=CAFILE)
+                loads = mock_create.call_count
+                assert get_policy().ssl_context is get_ssl_context(cafile=CAFILE)
+                get_policy(allow_tlsv12=True)
+                evaluate_url("ftp://example.com")
+                self.assertEqual(mock_create.call_count, loads)
+        finally:
+            configure_ca()
+        assert get_policy().ssl_context is get_ssl_context(cafile=None)
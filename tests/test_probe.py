@@ -0,0 +1,361 @@
+#!/usr/bin/env python
+
+"""
+Purpose: tests
+"""
+
+import asyncio
+import os
+import shutil
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pkg_19544.clean_url import (
+    evaluate_url_detailed,
+    redirect_url,
+    redirect_url_async,
+    trace_redirects,
+    trace_redirects_async,
+)
+from pkg_19544.helpers.evaluate import (
+    _has_valid_tls,
+    _has_valid_tls_async,
+    _inspect_tls,
+)
+from pkg_19544.helpers.probe import _probe_final_hop, _probe_final_hop_async
+from pkg_19544.policy import Policy
+from pkg_19544.utils.tls import TlsSessionStore, TlsVerdictCache, get_ssl_context
+
+ROUTES = {
+    "/": (301, "/next"),
+    "/next": (302, "/final?key=value"),
+    "/final": (200, None),
+    "/loop": (302, "/loop"),
+    "/missing": (404, None),
+    "/ftp": (302, "ftp://127.0.0.1/file"),
+}
+
+
+class RedirectHandler(BaseHTTPRequestHandler):
+    def _respond(self):
+        self.server.requests.append((self.command, self.path))
+        if self.path == "/nohead" and self.command == "HEAD":
+            status, location = 405, None
+        else:
+            status, location = ROUTES.get(self.path.split("?")[0], (200, None))
+        self.send_response(status)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = _respond
+    do_HEAD = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestProbeFinalHop(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), RedirectHandler)
+        cls.server.requests = []
+        cls.port = cls.server.server_address[1]
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.inspected = []
+
+    def _inspect(self, sock):
+        self.inspected.append(sock)
+        return True
+
+    def _probe(self, path="/", max_redirects=10):
+        return _probe_final_hop(
+            "http", "127.0.0.1", self.port, get_ssl_context(), self._inspect, path=path, max_redirects=max_redirects
+        )
+
+    def test_probe_follows_redirects_with_head(self):
+        self.assertTrue(self._probe())
+        self.assertEqual(
+            self.server.requests,
+            [("HEAD", "/"), ("HEAD", "/next"), ("HEAD", "/final?key=value")],
+        )
+        self.assertEqual(len(self.inspected), 1)
+
+    def test_probe_head_not_allowed_falls_back_to_get(self):
+        self.assertTrue(self._probe(path="/nohead"))
+        self.assertEqual(self.server.requests, [("HEAD", "/nohead"), ("GET", "/nohead")])
+
+    def test_probe_max_redirects(self):
+        self.assertFalse(self._probe(path="/loop", max_redirects=3))
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(self.inspected, [])
+
+    def test_probe_http_error(self):
+        self.assertFalse(self._probe(path="/missing"))
+
+    def test_probe_unsupported_scheme(self):
+        self.assertFalse(self._probe(path="/ftp"))
+
+    def test_probe_records_hops(self):
+        hops = []
+        self.assertTrue(
+            _probe_final_hop("http", "127.0.0.1", self.port, get_ssl_context(), self._inspect, path="/nohead", hops=hops)
+        )
+        self.assertEqual([(hop.method, hop.status, hop.location) for hop in hops], [("HEAD", 405, None), ("GET", 200, None)])
+        self.assertTrue(all(hop.latency > 0 for hop in hops))
+
+    def test_trace_redirects(self):
+        trace = trace_redirects(f"http://127.0.0.1:{self.port}/path1")
+        self.assertTrue(trace)
+        self.assertEqual(trace.url, f"http://127.0.0.1:{self.port}/final?key=value")
+        self.assertEqual(
+            [(hop.url, hop.method, hop.status, hop.location) for hop in trace.hops],
+            [
+                (f"http://127.0.0.1:{self.port}/", "HEAD", 301, "/next"),
+                (f"http://127.0.0.1:{self.port}/next", "HEAD", 302, "/final?key=value"),
+                (f"http://127.0.0.1:{self.port}/final?key=value", "HEAD", 200, None),
+            ],
+        )
+        self.assertIsNone(trace.error)
+
+    def test_trace_redirects_failures(self):
+        trace = trace_redirects(f"http://127.0.0.1:{self.port}", max_redirects=1)
+        self.assertFalse(trace)
+        self.assertEqual(len(trace.hops), 2)
+        self.assertEqual(trace.error, "redirect not followed: /final?key=value")
+
+        trace = trace_redirects(f"http://127.0.0.1:{self.port}", timeout=0)
+        self.assertEqual((trace.url, trace.hops), (None, []))
+        self.assertTrue(trace.error.startswith("TimeoutError"))
+
+        self.assertEqual(trace_redirects("ftp://127.0.0.1/file").error, "unsupported scheme: ftp")
+
+    def test_redirect_url(self):
+        user_url = f"http://127.0.0.1:{self.port}/path1"
+        self.assertEqual(redirect_url(user_url, trailing_path="v1"), f"http://127.0.0.1:{self.port}/v1")
+        self.assertEqual(self.server.requests[0], ("HEAD", "/"))
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_has_valid_tls_redirect_final_hop_not_tls(self):
+        with self.assertRaises(ValueError):
+            _has_valid_tls("http", f"127.0.0.1:{self.port}", allow_redirect=True)
+        self.assertEqual(self.server.requests[0], ("HEAD", "/"))
+
+    def test_inspect_tls_plain_socket(self):
+        with socket.socket() as sock:
+            self.assertFalse(_inspect_tls(sock))
+
+
+class TestProbeFinalHopAsync(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), RedirectHandler)
+        cls.server.requests = []
+        cls.port = cls.server.server_address[1]
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests.clear()
+
+    async def _probe(self, path="/", max_redirects=10):
+        return await _probe_final_hop_async(
+            "http",
+            "127.0.0.1",
+            self.port,
+            get_ssl_context(),
+            lambda ssl_object, url: (ssl_object, url),
+            path=path,
+            max_redirects=max_redirects,
+        )
+
+    async def test_probe_async_follows_redirects_with_head(self):
+        ssl_object, url = await self._probe()
+        self.assertIsNone(ssl_object)
+        self.assertEqual(url, f"http://127.0.0.1:{self.port}/final?key=value")
+        self.assertEqual(
+            self.server.requests,
+            [("HEAD", "/"), ("HEAD", "/next"), ("HEAD", "/final?key=value")],
+        )
+
+    async def test_probe_async_head_not_allowed_falls_back_to_get(self):
+        self.assertTrue(await self._probe(path="/nohead"))
+        self.assertEqual(self.server.requests, [("HEAD", "/nohead"), ("GET", "/nohead")])
+
+    async def test_probe_async_failures(self):
+        self.assertFalse(await self._probe(path="/loop", max_redirects=3))
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertFalse(await self._probe(path="/missing"))
+        self.assertFalse(await self._probe(path="/ftp"))
+
+    async def test_probe_async_concurrent(self):
+        results = await asyncio.gather(*(self._probe(path="/final") for _ in range(20)))
+        self.assertEqual(len([result for result in results if result]), 20)
+
+    async def test_has_valid_tls_async_final_hop_not_tls(self):
+        with self.assertRaises(ValueError):
+            await _has_valid_tls_async("http", f"127.0.0.1:{self.port}", allow_redirect=True)
+        self.assertEqual(self.server.requests[0], ("HEAD", "/"))
+
+    async def test_trace_redirects_async(self):
+        trace = await trace_redirects_async(f"http://127.0.0.1:{self.port}/path1")
+        self.assertEqual(trace.url, f"http://127.0.0.1:{self.port}/final?key=value")
+        self.assertEqual([hop.status for hop in trace.hops], [301, 302, 200])
+
+        trace = await trace_redirects_async(f"http://127.0.0.1:{self.port}", max_redirects=0)
+        self.assertEqual((trace.url, len(trace.hops)), (None, 1))
+        trace = await trace_redirects_async(f"http://127.0.0.1:{self.port}", timeout=0)
+        self.assertTrue(trace.error.startswith("TimeoutError"))
+
+    async def test_redirect_url_async(self):
+        user_url = f"http://127.0.0.1:{self.port}/path1"
+        self.assertEqual(await redirect_url_async(user_url, trailing_path="v1"), f"http://127.0.0.1:{self.port}/v1")
+        self.assertEqual(self.server.requests[0], ("HEAD", "/"))
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertFalse(await redirect_url_async("ftp://127.0.0.1/file", enable_log=True))
+
+
+class TestTlsSessionResumption(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # self-signed certificate + key for localhost / 127.0.0.1, generated per run (no key in the repo)
+        if shutil.which("openssl") is None:
+            raise unittest.SkipTest("openssl is not installed")
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.certfile = os.path.join(cls.directory.name, "localhost.crt")
+        cls.keyfile = os.path.join(cls.directory.name, "localhost.key")
+        subprocess.run(
+            [
+                "openssl",
+                "req",
+                "-x509",
+                "-newkey",
+                "ec",
+                "-pkeyopt",
+                "ec_paramgen_curve:prime256v1",
+                "-sha256",
+                "-nodes",
+                "-days",
+                "2",
+                "-subj",
+                "/CN=localhost",
+                "-addext",
+                "subjectAltName=DNS:localhost,IP:127.0.0.1",
+                "-keyout",
+                cls.keyfile,
+                "-out",
+                cls.certfile,
+            ],
+            check=True,
+            capture_output=True,
+        )
+
+        cls.servers = []
+        cls.ports = {}
+        for maximum_version in (ssl.TLSVersion.TLSv1_2, ssl.TLSVersion.TLSv1_3):
+            server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            server_context.load_cert_chain(cls.certfile, cls.keyfile)
+            server_context.maximum_version = maximum_version
+            server = ThreadingHTTPServer(("127.0.0.1", 0), RedirectHandler)
+            server.socket = server_context.wrap_socket(server.socket, server_side=True)
+            server.requests = []
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            cls.servers.append(server)
+            cls.ports[maximum_version] = server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        for server in cls.servers:
+            server.shutdown()
+            server.server_close()
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.ssl_context = get_ssl_context(allow_tlsv12=True, cafile=self.certfile)
+        self.sessions = TlsSessionStore()
+
+    def _has_valid_tls(self, maximum_version, allow_redirect, tls_sessions):
+        tls_info = {}
+        _has_valid_tls(
+            "https",
+            f"localhost:{self.ports[maximum_version]}",
+            allow_redirect=allow_redirect,
+            allow_tlsv12=True,
+            ssl_context=self.ssl_context,
+            tls_sessions=tls_sessions,
+            tls_info=tls_info,
+        )
+        return tls_info["session_reused"]
+
+    def test_session_resumed_tlsv12(self):
+        self.assertFalse(self._has_valid_tls(ssl.TLSVersion.TLSv1_2, False, self.sessions))
+        self.assertTrue(self._has_valid_tls(ssl.TLSVersion.TLSv1_2, False, self.sessions))
+        self.assertEqual(self.sessions.hits, 1)
+
+    def test_session_resumed_tlsv13(self):
+        # the ticket arrives after the handshake: stored once a HEAD response has been read
+        session_reused = [self._has_valid_tls(ssl.TLSVersion.TLSv1_3, False, self.sessions) for _ in range(3)]
+        self.assertEqual(session_reused, [False, True, True])
+        self.assertEqual(len(self.sessions), 1)
+        self.assertEqual(self.sessions.hits, 2)
+
+    def test_session_resumed_across_redirect_hops(self):
+        # / -> /next -> /final: the 2nd and 3rd hop resume the session of the 1st one
+        for maximum_version in (ssl.TLSVersion.TLSv1_2, ssl.TLSVersion.TLSv1_3):
+            self.sessions.clear()
+            self.assertTrue(self._has_valid_tls(maximum_version, True, self.sessions))
+            self.assertEqual((self.sessions.hits, self.sessions.misses), (2, 1))
+
+    def test_no_session_store(self):
+        for _ in range(2):
+            self.assertFalse(self._has_valid_tls(ssl.TLSVersion.TLSv1_2, False, None))
+
+    def test_session_store_disabled(self):
+        sessions = TlsSessionStore(maxsize=0)
+        for _ in range(2):
+            self.assertFalse(self._has_valid_tls(ssl.TLSVersion.TLSv1_2, False, sessions))
+        self.assertEqual(len(sessions), 0)
+
+    def test_session_not_offered_to_other_context(self):
+        self._has_valid_tls(ssl.TLSVersion.TLSv1_2, False, self.sessions)
+        other_context = ssl.create_default_context(cafile=self.certfile)
+        self.assertIsNone(self.sessions.get("localhost", self.ports[ssl.TLSVersion.TLSv1_2], other_context))
+
+    def test_evaluate_url_detailed_session_reused(self):
+        policy = Policy(
+            allow_localhost=True,
+            allow_loopback_ip=True,
+            allow_redirect=False,
+            allow_tlsv12=True,
+            cafile=self.certfile,
+            tls_cache=TlsVerdictCache(maxsize=0),
+            tls_sessions=self.sessions,
+        )
+        for maximum_version in (ssl.TLSVersion.TLSv1_2, ssl.TLSVersion.TLSv1_3):
+            with self.subTest(maximum_version=maximum_version):
+                user_url = f"https://localhost:{self.ports[maximum_version]}/"
+                results = [evaluate_url_detailed(user_url, policy=policy) for _ in range(2)]
+                self.assertEqual([result.verdict for result in results], [True, True])
+                self.assertEqual([result.session_reused for result in results], [False, True])
+
+        # no TLS handshake inspected
+        policy = Policy(allow_localhost=True, allow_loopback_ip=True, skip_tls=True)
+        self.assertIsNone(evaluate_url_detailed(user_url, policy=policy).session_reused)
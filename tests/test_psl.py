@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""
+Purpose: tests
+"""
+
+import os
+import tempfile
+import unittest
+
+from pkg_19544.utils.psl import (
+    PublicSuffixList,
+    get_public_suffix_list,
+    public_suffix,
+    registrable_domain,
+)
+
+RULES = [
+    "// ===BEGIN ICANN DOMAINS===",
+    "com",
+    "uk",
+    "co.uk",
+    "jp",
+    "*.kawasaki.jp",
+    "!city.kawasaki.jp",
+    "*.ck",
+    "!www.ck",
+    "中国",
+    "// ===END ICANN DOMAINS===",
+    "// ===BEGIN PRIVATE DOMAINS===",
+    "github.io",
+    "// ===END PRIVATE DOMAINS===",
+]
+
+# (fqdn, public suffix, registrable domain) - cases from https://publicsuffix.org/list/ (test_psl.txt)
+CASES = [
+    ("com", "com", None),
+    ("example.com", "com", "example.com"),
+    ("www.example.com", "com", "example.com"),
+    ("WwW.Example.COM", "com", "example.com"),
+    ("example.com.", "com", "example.com"),
+    ("example", "example", None),
+    ("example.example", "example", "example.example"),
+    ("co.uk", "co.uk", None),
+    ("www.example.co.uk", "co.uk", "example.co.uk"),
+    ("kawasaki.jp", "jp", "kawasaki.jp"),
+    ("test.kawasaki.jp", "test.kawasaki.jp", None),
+    ("www.test.kawasaki.jp", "test.kawasaki.jp", "www.test.kawasaki.jp"),
+    ("city.kawasaki.jp", "kawasaki.jp", "city.kawasaki.jp"),
+    ("www.city.kawasaki.jp", "kawasaki.jp", "city.kawasaki.jp"),
+    ("www.ck", "ck", "www.ck"),
+    ("test.ck", "test.ck", None),
+    ("b.test.ck", "test.ck", "b.test.ck"),
+    ("食狮.中国", "中国", "食狮.中国"),
+    ("xn--85x722f.xn--fiqs8s", "xn--fiqs8s", "xn--85x722f.xn--fiqs8s"),
+    ("user.github.io", "github.io", "user.github.io"),
+    ("", None, None),
+    ("a..com", None, None),
+]
+
+
+class TestPublicSuffixList(unittest.TestCase):
+    def test_psl_rules(self):
+        psl = PublicSuffixList(RULES)
+        for fqdn, suffix, domain in CASES:
+            with self.subTest(fqdn=fqdn):
+                self.assertEqual(psl.public_suffix(fqdn), suffix)
+                self.assertEqual(psl.registrable_domain(fqdn), domain)
+
+    def test_psl_exclude_private(self):
+        psl = PublicSuffixList(RULES, include_private=False)
+        self.assertEqual(psl.public_suffix("user.github.io"), "io")
+        self.assertEqual(psl.registrable_domain("user.github.io"), "github.io")
+
+    def test_psl_from_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "public_suffix_list.dat")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("\n".join(RULES) + "\n")
+            psl = PublicSuffixList.from_file(path)
+        self.assertEqual(psl.registrable_domain("www.example.co.uk"), "example.co.uk")
+
+    def test_psl_vendored(self):
+        self.assertIs(get_public_suffix_list(), get_public_suffix_list())
+        for fqdn, suffix, domain in CASES:
+            with self.subTest(fqdn=fqdn):
+                self.assertEqual(public_suffix(fqdn), suffix)
+                self.assertEqual(registrable_domain(fqdn), domain)
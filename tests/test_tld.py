@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+
+"""
+Purpose: tests
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from pkg_19544.configs.constants import TLD_LOOKUP_CACHE_SIZE
+from pkg_19544.helpers.evaluate import _has_valid_tld
+from pkg_19544.utils.tld import (
+    TldRefresh,
+    _source_version,
+    get_tlds,
+    refresh_tlds,
+)
+from pkg_19544.utils.tld_index import TldRegistry
+from pkg_19544.utils.tld_snapshot import (
+    SnapshotError,
+    TldSnapshot,
+    build_snapshot,
+    write_snapshot,
+)
+
+IANA_LIST = "# Version 2025100200, Last Updated Thu Oct  2 07:07:01 2025 UTC\nCOM\nNET\nXN--11B4C3D\nZW\n"
+
+
+class TestTldSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "tlds.bin")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _write(self, data):
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+    def test_snapshot_roundtrip(self):
+        write_snapshot(["ZW", "COM", "net", "com", "XN--11B4C3D"], self.path, source_version=2025100200)
+        snapshot = TldSnapshot(self.path)
+        self.assertEqual(list(snapshot), ["com", "net", "xn--11b4c3d", "zw"])
+        self.assertEqual((len(snapshot), snapshot.source_version), (4, 2025100200))
+        for label in ["com", "COM", "Com", b"NET", "xn--11B4C3D", "zw"]:
+            self.assertIn(label, snapshot)
+        for label in ["", "co", "comm", "a", "zz", "中国", 1]:
+            self.assertNotIn(label, snapshot)
+        snapshot.close()
+
+    def test_snapshot_empty_list(self):
+        write_snapshot([], self.path)
+        self.assertNotIn("com", TldSnapshot(self.path))
+
+    def test_snapshot_checksum_mismatch(self):
+        data = bytearray(build_snapshot(["com", "net"]))
+        data[-1] ^= 0xFF
+        self._write(bytes(data))
+        with self.assertRaises(SnapshotError):
+            TldSnapshot(self.path)
+
+    def test_snapshot_invalid_file(self):
+        for data in [b"", b"TLDS", b"XXXX" + build_snapshot(["com"])[4:]]:
+            with self.subTest(data=data[:8]):
+                self._write(data)
+                with self.assertRaises(SnapshotError):
+                    TldSnapshot(self.path)
+
+    def test_source_version(self):
+        self.assertEqual(_source_version(IANA_LIST.splitlines()[0]), 2025100200)
+        self.assertEqual(_source_version("COM"), 0)
+
+    def test_write_snapshot_atomic(self):
+        write_snapshot(["com"], self.path)
+        with patch("pkg_19544.utils.tld_snapshot.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                write_snapshot(["com", "net"], self.path)
+        self.assertEqual(list(TldSnapshot(self.path)), ["com"])
+        self.assertEqual(os.listdir(self.tmpdir.name), ["tlds.bin"])
+
+
+class IanaHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        if self.server.status != 200:
+            self.send_error(self.server.status)
+            return
+        if self.headers.get("If-None-Match") == self.server.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = self.server.body.encode()
+        self.send_response(200)
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Last-Modified", "Thu, 02 Oct 2025 07:07:01 GMT")
+        self.send_header("Content-Length", str(self.server.length or len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestRefreshTlds(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), IanaHandler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/tlds-alpha-by-domain.txt"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests, self.server.status = [], 200
+        self.server.body, self.server.etag, self.server.length = IANA_LIST, '"v1"', None
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "tlds.bin")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _refresh(self):
+        return refresh_tlds(url=self.url, path=self.path)
+
+    def test_refresh_tlds_conditional(self):
+        result = self._refresh()
+        self.assertEqual((result.status, result.source_version), ("updated", 2025100200))
+        self.assertEqual(result.added, {"com", "net", "xn--11b4c3d", "zw"})
+        self.assertNotIn("If-None-Match", self.server.requests[0])
+
+        mtime = os.stat(self.path).st_mtime_ns
+        self.assertEqual(self._refresh().status, "not_modified")
+        self.assertEqual(self.server.requests[1]["If-None-Match"], '"v1"')
+        self.assertEqual(self.server.requests[1]["If-Modified-Since"], "Thu, 02 Oct 2025 07:07:01 GMT")
+        self.assertEqual(os.stat(self.path).st_mtime_ns, mtime)
+
+    def test_refresh_tlds_diff(self):
+        self._refresh()
+        self.server.body, self.server.etag = IANA_LIST.replace("NET\n", "ORG\n"), '"v2"'
+        result = self._refresh()
+        self.assertEqual((result.status, result.added, result.removed), ("updated", {"org"}, {"net"}))
+        self.assertEqual(list(TldSnapshot(self.path)), ["com", "org", "xn--11b4c3d", "zw"])
+
+    def test_refresh_tlds_unchanged_keeps_snapshot(self):
+        self._refresh()
+        inode = os.stat(self.path).st_ino
+        self.server.etag = '"v3"'
+        self.assertEqual(self._refresh().status, "unchanged")
+        self.assertEqual(os.stat(self.path).st_ino, inode)
+        self.assertEqual(self._refresh().status, "not_modified")
+
+    def test_refresh_tlds_failure_keeps_snapshot(self):
+        self._refresh()
+        for status, body in [(500, IANA_LIST), (200, "# Version 1\n")]:
+            self.server.status, self.server.body, self.server.etag = status, body, '"v4"'
+            self.assertFalse(self._refresh())
+            self.assertEqual(len(TldSnapshot(self.path)), 4)
+        self.assertFalse(refresh_tlds(url="http://127.0.0.1:1/", path=self.path, timeout=1))
+
+    def test_refresh_tlds_empty_or_truncated_body_keeps_snapshot(self):
+        self._refresh()
+        for body, length in [("", None), ("\n", None), (IANA_LIST[:20], len(IANA_LIST))]:
+            with self.subTest(body=body, length=length):
+                self.server.body, self.server.etag, self.server.length = body, '"v5"', length
+                result = self._refresh()
+                self.assertEqual(result.status, "failed")
+                self.assertEqual(list(TldSnapshot(self.path)), ["com", "net", "xn--11b4c3d", "zw"])
+
+    def test_get_tlds(self):
+        with patch("pkg_19544.utils.tld.refresh_tlds", return_value=TldRefresh("not_modified")):
+            self.assertTrue(get_tlds())
+
+
+class TestTldRegistry(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "tlds.bin")
+        write_snapshot(["com", "net"], self.path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_registry_reload(self):
+        registry = TldRegistry(self.path)
+        self.assertIn("COM", registry)
+        self.assertNotIn("org", registry)
+        self.assertFalse(registry.reload_if_modified())
+
+        write_snapshot(["com", "net", "org"], self.path)
+        self.assertTrue(registry.reload_if_modified())
+        self.assertIn("org", registry)
+
+        other_path = os.path.join(self.tmpdir.name, "other.bin")
+        write_snapshot(["io"], other_path)
+        self.assertEqual(list(registry.reload(other_path)), ["io"])
+        self.assertEqual(registry.path, other_path)
+        self.assertNotIn("com", registry)
+
+    def test_registry_lookup_lru(self):
+        registry = TldRegistry(self.path)
+        self.assertIn("com", registry)
+        contains = registry._index.contains
+        # junk labels evict the least recently used answers, not the hot ones
+        for number in range(2 * TLD_LOOKUP_CACHE_SIZE):
+            self.assertNotIn(f"junk{number}", registry)
+            self.assertIn("com", registry)
+        cache_info = contains.cache_info()
+        self.assertEqual(cache_info.currsize, TLD_LOOKUP_CACHE_SIZE)
+        self.assertEqual((cache_info.hits, cache_info.misses), (2 * TLD_LOOKUP_CACHE_SIZE, 2 * TLD_LOOKUP_CACHE_SIZE + 1))
+
+    def test_registry_invalid_reload_keeps_index(self):
+        registry = TldRegistry(self.path)
+        with open(os.path.join(self.tmpdir.name, "broken.bin"), "wb") as f:
+            f.write(b"TLDS")
+        with self.assertRaises(SnapshotError):
+            registry.reload(os.path.join(self.tmpdir.name, "broken.bin"))
+        with self.assertRaises(OSError):
+            registry.reload(os.path.join(self.tmpdir.name, "missing.bin"))
+        self.assertIn("com", registry)
+        self.assertEqual(registry.path, self.path)
+
+    def test_registry_concurrent_reload(self):
+        registry = TldRegistry(self.path)
+        errors, stop = [], threading.Event()
+
+        def read():
+            while not stop.is_set():
+                try:
+                    assert "com" in registry
+                except Exception as e:  # pragma: no cover
+                    errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for tlds in (["com", "org"], ["com", "net"]) * 10:
+            write_snapshot(tlds, self.path)
+            registry.reload()
+        stop.set()
+        for reader in readers:
+            reader.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(list(registry.snapshot), ["com", "net"])
+
+    def test_has_valid_tld_uses_registry(self):
+        registry = TldRegistry(self.path)
+        with patch("pkg_19544.helpers.syntax.tld_registry", registry):
+            with self.assertRaises(ValueError):
+                _has_valid_tld("host.example.newtld")
+            write_snapshot(["com", "newtld"], self.path)
+            registry.reload()
+            self.assertTrue(_has_valid_tld("host.example.newtld"))
@@ -4,13 +4,31 @@
 Purpose: tests
 """
 
+import socket
+import ssl
 import unittest
 from unittest.mock import MagicMock, patch
 
+from pkg_19544.clean_url import evaluate_url
 from pkg_19544.helpers.evaluate import _has_valid_tls
+from pkg_19544.policy import Policy
+from pkg_19544.utils.dns import StaticResolver, dns_cache
+from pkg_19544.utils.tls import TlsVerdictCache, tls_cache
+
+CERT_DICT = {
+    "subject": ((("commonName", "example.com"),),),
+    "notBefore": "Nov 12 12:12:12 2025 GMT",
+    "notAfter": "Feb 12 12:12:12 2046 GMT",
+    "subjectAltName": (("DNS", "example.com"),),
+}
+ADDR_INFO = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.215.14", 443))]
 
 
 class TestEvaluateUrlTls(unittest.TestCase):
+    def setUp(self):
+        dns_cache.clear()
+        tls_cache.clear()
+
     """
     when FQDN is localhost + skip_tls = True
     """
@@ -349,3 +367,158 @@ class TestEvaluateUrlTls(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             return _has_valid_tls(scheme, authroity)
+
+    """
+    when vetted addresses are provided = connect to the vetted IP with SNI set to FQDN
+    """
+
+    @patch("socket.getaddrinfo")
+    @patch("socket.socket")
+    @patch("ssl.SSLContext.wrap_socket")
+    def test_has_valid_tls_connects_vetted_address(self, mock_wrap_socket, mock_socket, mock_getaddrinfo):
+        scheme = "https"
+        authroity = "example.com"
+
+        mock_ssock = MagicMock()
+        mock_wrap_socket.return_value.__enter__.return_value = mock_ssock
+        mock_ssock.cipher.return_value = ("TLS_AES_256_GCM_SHA384", "TLSv1.3", "256")
+        mock_ssock.getpeercert.return_value = CERT_DICT
+        self.assertTrue(_has_valid_tls(scheme, authroity, addr_info=ADDR_INFO))
+
+        mock_getaddrinfo.assert_not_called()
+        mock_socket.return_value.connect.assert_called_once_with(("93.184.215.14", 443))
+        self.assertEqual(mock_wrap_socket.call_args.kwargs["server_hostname"], "example.com")
+
+    """
+    when evaluate_url runs network and TLS checks = resolve FQDN once
+    """
+
+    @patch("socket.getaddrinfo")
+    @patch("socket.socket")
+    @patch("ssl.SSLContext.wrap_socket")
+    def test_evaluate_url_resolves_once(self, mock_wrap_socket, mock_socket, mock_getaddrinfo):
+        mock_getaddrinfo.return_value = ADDR_INFO
+        mock_ssock = MagicMock()
+        mock_wrap_socket.return_value.__enter__.return_value = mock_ssock
+        mock_ssock.cipher.return_value = ("TLS_AES_256_GCM_SHA384", "TLSv1.3", "256")
+        mock_ssock.getpeercert.return_value = CERT_DICT
+
+        self.assertTrue(evaluate_url("https://example.com/path", allow_redirect=False))
+        self.assertEqual(mock_getaddrinfo.call_count, 1)
+        mock_socket.return_value.connect.assert_called_once_with(("93.184.215.14", 443))
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTlsVerdictCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        # wall clock 1 hour before CERT_DICT notAfter
+        self.wall_clock = FakeClock(ssl.cert_time_to_seconds(CERT_DICT["notAfter"]) - 3600)
+
+    def test_passing_verdict_capped_at_cert_not_after(self):
+        cache = TlsVerdictCache(ttl=86400, clock=self.clock, wall_clock=self.wall_clock)
+        cache.set("key", True, CERT_DICT)
+        self.clock.now = 3599
+        self.assertIs(cache.get("key"), True)
+        self.clock.now = 3601
+        self.assertIsNone(cache.get("key"))
+
+    def test_passing_verdict_capped_at_ttl(self):
+        cache = TlsVerdictCache(ttl=60, clock=self.clock, wall_clock=self.wall_clock)
+        cache.set("key", True, CERT_DICT)
+        self.clock.now = 61
+        self.assertIsNone(cache.get("key"))
+
+    def test_passing_verdict_without_cert_not_cached(self):
+        cache = TlsVerdictCache(clock=self.clock, wall_clock=self.wall_clock)
+        cache.set("key", True)
+        cache.set("other", True, {"notAfter": "not a date"})
+        self.assertEqual(len(cache), 0)
+
+    def test_failing_verdict_negative_ttl(self):
+        cache = TlsVerdictCache(negative_ttl=10, clock=self.clock, wall_clock=self.wall_clock)
+        cache.set("key", False)
+        self.assertIs(cache.get("key"), False)
+        self.clock.now = 11
+        self.assertIsNone(cache.get("key"))
+
+    def test_eviction_and_counters(self):
+        cache = TlsVerdictCache(maxsize=2, clock=self.clock, wall_clock=self.wall_clock)
+        for key in ("a", "b", "c"):
+            cache.set(key, False)
+        self.assertEqual((len(cache), cache.evictions), (2, 1))
+        self.assertIsNone(cache.get("a"))
+        self.assertIs(cache.get("c"), False)
+        self.assertEqual((cache.hits, cache.misses, cache.hit_rate), (1, 1, 0.5))
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses, cache.hit_rate), (0, 0, 0, 0.0))
+
+    def test_disabled(self):
+        cache = TlsVerdictCache(maxsize=0)
+        cache.set("key", False)
+        self.assertIsNone(cache.get("key"))
+
+
+class TestTlsVerdictCacheEvaluate(unittest.TestCase):
+    def setUp(self):
+        self.resolver = StaticResolver({"example.com": "93.184.215.14"})
+
+    @patch("socket.socket")
+    @patch("ssl.SSLContext.wrap_socket")
+    def test_has_valid_tls_cached(self, mock_wrap_socket, mock_socket):
+        mock_ssock = MagicMock()
+        mock_wrap_socket.return_value.__enter__.return_value = mock_ssock
+        mock_ssock.cipher.return_value = ("TLS_AES_256_GCM_SHA384", "TLSv1.3", "256")
+        mock_ssock.getpeercert.return_value = CERT_DICT
+        cache = TlsVerdictCache()
+
+        for _ in range(3):
+            self.assertTrue(_has_valid_tls("https", "example.com", addr_info=ADDR_INFO, tls_cache=cache))
+        self.assertEqual(mock_wrap_socket.call_count, 1)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+        # another TLS policy is another entry
+        self.assertTrue(_has_valid_tls("https", "example.com", allow_tlsv12=True, addr_info=ADDR_INFO, tls_cache=cache))
+        self.assertEqual(mock_wrap_socket.call_count, 2)
+
+    @patch("socket.socket")
+    @patch("ssl.SSLContext.wrap_socket")
+    def test_has_valid_tls_failure_cached(self, mock_wrap_socket, mock_socket):
+        mock_ssock = MagicMock()
+        mock_wrap_socket.return_value.__enter__.return_value = mock_ssock
+        mock_ssock.cipher.return_value = ("TLS_AES_256_GCM_SHA384", "TLSv1.1", "256")
+        cache = TlsVerdictCache()
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                _has_valid_tls("https", "example.com", addr_info=ADDR_INFO, tls_cache=cache)
+        self.assertEqual(mock_wrap_socket.call_count, 1)
+
+    @patch("socket.socket")
+    @patch("ssl.SSLContext.wrap_socket")
+    def test_evaluate_url_policy_tls_cache(self, mock_wrap_socket, mock_socket):
+        mock_ssock = MagicMock()
+        mock_wrap_socket.return_value.__enter__.return_value = mock_ssock
+        mock_ssock.cipher.return_value = ("TLS_AES_256_GCM_SHA384", "TLSv1.3", "256")
+        mock_ssock.getpeercert.return_value = CERT_DICT
+        cache = TlsVerdictCache()
+        policy = Policy(allow_redirect=False, resolver=self.resolver, tls_cache=cache)
+
+        self.assertTrue(evaluate_url("https://example.com/a", policy=policy))
+        self.assertTrue(evaluate_url("https://EXAMPLE.com/b", policy=policy))
+        self.assertEqual(mock_wrap_socket.call_count, 1)
+        self.assertEqual(len(cache), 1)
+
+        # caching disabled
+        policy = Policy(allow_redirect=False, resolver=self.resolver, tls_cache=TlsVerdictCache(maxsize=0))
+        self.assertTrue(evaluate_url("https://example.com/a", policy=policy))
+        self.assertTrue(evaluate_url("https://example.com/a", policy=policy))
+        self.assertEqual(mock_wrap_socket.call_count, 3)